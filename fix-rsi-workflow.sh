@@ -14,11 +14,14 @@ mkdir -p archive/rejected
 echo "1. Archiving implemented proposals..."
 
 # Find implemented proposals and move them
+# Status lives in the append-only proposals/.status.log (older files carry it inline)
+IMPLEMENTED_LOGGED=$(python3 common/status_log.py proposals implemented 2>/dev/null)
 IMPLEMENTED_COUNT=0
 for file in proposals/proposal_*.json; do
     if [ -f "$file" ]; then
         # Check if status is implemented
-        if grep -q '"status": "implemented"' "$file" 2>/dev/null; then
+        if echo "$IMPLEMENTED_LOGGED" | grep -qx "$(basename "$file")" || \
+           grep -q '"status": "implemented"' "$file" 2>/dev/null; then
             # Extract ID
             ID=$(basename "$file" .json | sed 's/proposal_//')
             
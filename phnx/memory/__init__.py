@@ -1,2 +1,3 @@
 from .vector_memory import VectorMemory
-__all__ = ['VectorMemory']
+from .knowledge_indexer import KnowledgeIndexer
+__all__ = ['VectorMemory', 'KnowledgeIndexer']
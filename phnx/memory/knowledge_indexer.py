@@ -0,0 +1,222 @@
+# Incremental Knowledge Indexer for PHNX
+# Chunks workspace markdown docs into vector memory, re-embedding only what changed
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .vector_memory import VectorMemory
+
+WORKSPACE_DIR = os.path.expanduser("~/.openclaw/workspace")
+STATE_FILE = os.path.join(WORKSPACE_DIR, "vector_db", "knowledge_index.json")
+COLLECTION_NAME = "phnx_knowledge"
+STATE_VERSION = 1
+
+
+def chunk_markdown(text: str, max_chars: int = 1500) -> List[str]:
+    """
+    Split markdown into chunks of roughly max_chars
+
+    Splits on headings first so each chunk stays on one topic, then packs
+    paragraphs until the size limit. Oversized paragraphs are hard-split.
+    """
+    sections = []
+    current = []
+    for line in text.splitlines():
+        if line.startswith("#") and current:
+            sections.append("\n".join(current).strip())
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current).strip())
+
+    chunks = []
+    for section in filter(None, sections):
+        buffer = ""
+        for para in section.split("\n\n"):
+            para = para.strip()
+            if not para:
+                continue
+            while len(para) > max_chars:
+                if buffer:
+                    chunks.append(buffer)
+                    buffer = ""
+                chunks.append(para[:max_chars])
+                para = para[max_chars:]
+            if buffer and len(buffer) + len(para) + 2 > max_chars:
+                chunks.append(buffer)
+                buffer = para
+            else:
+                buffer = f"{buffer}\n\n{para}" if buffer else para
+        if buffer:
+            chunks.append(buffer)
+
+    return chunks
+
+
+class KnowledgeIndexer:
+    """
+    Keeps the workspace's design docs searchable in vector memory.
+
+    A small state file records each document's mtime, size, content hash
+    and chunk IDs. On every run:
+    - mtime/size unchanged → skipped without reading
+    - mtime changed but hash identical (touch, checkout) → state refreshed only
+    - content changed → re-chunked and re-embedded, stale chunks removed
+    - file deleted → its chunks are removed
+
+    Example:
+        indexer = KnowledgeIndexer()
+        stats = indexer.index()
+        → {"indexed": 2, "unchanged": 17, "removed": 0, "chunks": 31}
+    """
+
+    def __init__(self, root: str = WORKSPACE_DIR, state_file: str = STATE_FILE,
+                 memory: Optional[VectorMemory] = None, extra_paths: Optional[List[str]] = None,
+                 max_chunk_chars: int = 1500):
+        self.root = os.path.abspath(root)
+        self.state_file = state_file
+        self.extra_paths = extra_paths or []
+        self.max_chunk_chars = max_chunk_chars
+        self._memory = memory
+        self.state = self._load_state()
+
+    @property
+    def memory(self) -> VectorMemory:
+        # Opened lazily so a run with nothing to embed never touches ChromaDB
+        if self._memory is None:
+            self._memory = VectorMemory(collection_name=COLLECTION_NAME)
+        return self._memory
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            if state.get("version") == STATE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {"version": STATE_VERSION, "files": {}}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp_path = f"{self.state_file}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_file)
+
+    def discover(self) -> Dict[str, os.stat_result]:
+        """Find markdown docs at the workspace root (plus extra_paths)"""
+        found = {}
+
+        try:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        found[entry.name] = entry.stat()
+        except OSError:
+            pass
+
+        for path in self.extra_paths:
+            full_path = path if os.path.isabs(path) else os.path.join(self.root, path)
+            if os.path.isfile(full_path):
+                found[os.path.relpath(full_path, self.root)] = os.stat(full_path)
+
+        return found
+
+    def _chunk_ids(self, rel_path: str, count: int) -> List[str]:
+        prefix = hashlib.sha1(rel_path.encode()).hexdigest()[:12]
+        return [f"kb_{prefix}_{i}" for i in range(count)]
+
+    def _index_file(self, rel_path: str, content: str, digest: str, stat: os.stat_result) -> int:
+        chunks = chunk_markdown(content, self.max_chunk_chars)
+        ids = self._chunk_ids(rel_path, len(chunks))
+
+        metadatas = [{
+            "type": "workspace_doc",
+            "source": rel_path,
+            "chunk": i,
+            "chunks_total": len(chunks),
+            "sha256": digest,
+        } for i in range(len(chunks))]
+
+        self.memory.store_many(chunks, metadatas, ids)
+
+        # IDs are positional, so only the tail of a shrunken doc goes stale
+        old_ids = self.state["files"].get(rel_path, {}).get("chunk_ids", [])
+        new_ids = set(ids)
+        stale = [i for i in old_ids if i not in new_ids]
+        self.memory.forget(stale)
+
+        self.state["files"][rel_path] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "sha256": digest,
+            "chunk_ids": ids,
+            "indexed_at": datetime.now().isoformat(),
+        }
+        return len(chunks)
+
+    def index(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring vector memory in line with the docs on disk
+
+        Args:
+            force: Re-embed every document regardless of recorded state
+
+        Returns:
+            Counts of indexed, unchanged and removed files plus chunks written
+        """
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0, "chunks": 0}
+        files = self.state["files"]
+        current = self.discover()
+
+        for rel_path, stat in sorted(current.items()):
+            known = files.get(rel_path)
+            if (not force and known and known["mtime"] == stat.st_mtime
+                    and known["size"] == stat.st_size):
+                stats["unchanged"] += 1
+                continue
+
+            with open(os.path.join(self.root, rel_path), 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+
+            if not force and known and known["sha256"] == digest:
+                known["mtime"] = stat.st_mtime
+                known["size"] = stat.st_size
+                stats["unchanged"] += 1
+                continue
+
+            content = raw.decode("utf-8", errors="replace")
+            stats["chunks"] += self._index_file(rel_path, content, digest, stat)
+            stats["indexed"] += 1
+
+        for rel_path in [p for p in files if p not in current]:
+            self.memory.forget(files[rel_path].get("chunk_ids", []))
+            del files[rel_path]
+            stats["removed"] += 1
+
+        self._save_state()
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index workspace markdown into vector memory")
+    parser.add_argument("--root", default=WORKSPACE_DIR, help="Workspace directory to scan")
+    parser.add_argument("--force", action="store_true", help="Re-embed every document")
+    args = parser.parse_args()
+
+    indexer = KnowledgeIndexer(root=args.root)
+    stats = indexer.index(force=args.force)
+
+    print(f"📚 Indexed: {stats['indexed']} ({stats['chunks']} chunks)")
+    print(f"   Unchanged: {stats['unchanged']}")
+    print(f"   Removed: {stats['removed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -63,6 +63,40 @@ class VectorMemory:
         
         return item_id
     
+    def store_many(self, contents: List[str], metadatas: List[Dict], ids: List[str]) -> List[str]:
+        """
+        Store a batch of content under caller-chosen IDs
+        
+        Existing IDs are overwritten (upsert), so re-indexing a document
+        replaces its old chunks instead of duplicating them.
+        
+        Returns:
+            The IDs that were stored
+        """
+        if not ids:
+            return []
+        
+        now = datetime.now().isoformat()
+        metas = []
+        for content, metadata in zip(contents, metadatas):
+            meta = dict(metadata or {})
+            meta["timestamp"] = now
+            meta["content_preview"] = content[:100] + "..." if len(content) > 100 else content
+            metas.append(meta)
+        
+        self.collection.upsert(
+            documents=contents,
+            metadatas=metas,
+            ids=ids
+        )
+        
+        return ids
+    
+    def forget(self, ids: List[str]):
+        """Remove memories by ID"""
+        if ids:
+            self.collection.delete(ids=ids)
+    
     def recall(self, query: str, n_results: int = 5) -> List[Dict]:
         """
         Search memory by meaning (not just keywords)
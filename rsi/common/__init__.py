@@ -0,0 +1,2 @@
+from .artifact_store import ArtifactStore, hash_file, load_tree, tree_digest
+__all__ = ['ArtifactStore', 'hash_file', 'load_tree', 'tree_digest']
@@ -0,0 +1,254 @@
+"""
+ARCHIVE PACKFILES
+Terminal-state items moved out of the hot directories into compressed packs
+
+  archive/packs/pack-0001.jsonl.gz   append-only; one gzip member per item
+  archive/packs/index.jsonl          {"kind", "name", "pack", "offset", "length", "archived_at"}
+
+Each item is one JSON record ({"kind", "name", "archived_at", "files":
+{rel_path: {"text"|"base64", "mode"}}}) compressed as its own gzip member,
+so the pack stays a valid .gz stream while any record can be read back
+with one seek and one read at its indexed offset. A pack is closed once it
+passes PACK_MAX_BYTES.
+
+Terminal (and at least MIN_AGE_SECONDS old):
+  staging      staging/<id>/ of a deployed staging id that no script of an
+               active release refers to (older monitor scripts call
+               staging/<id>/restart_concierge.sh directly)
+  validation   validation/val_<id>_<ts>.json of a deployed id, one that failed,
+               or one the Warden settled for good (ARCHIVABLE_OUTCOMES);
+               escalated reports stay for the human reviewing them
+  deployed     deployed/<id>.deployed markers (the Warden's .deployed_ids keeps the id)
+  proposal     proposals/*.json implemented into a deployed staging id, and
+               everything in archive/implemented/
+
+The record is written and fsynced before the source is removed, so a
+crash can at worst archive an item twice (the index keeps the latest).
+
+Read an item back:
+  python3 orchestrate.py --archived <name>          (or <kind>:<name>)
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+import base64
+import shutil
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from .artifact_index import INDEX_NAME as ARTIFACT_INDEX_NAME
+from .artifact_store import ArtifactStore
+from .releases import ReleaseStore
+from .sandbox import EXECUTABLE_SUFFIXES
+from .deployed_index import DeployedIndex, parse_report_name, MARKER_SUFFIX
+from .status_log import StatusLog
+
+RSI_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi"
+PROPOSALS_DIR = os.path.join(RSI_DIR, "proposals")
+STAGING_DIR = os.path.join(RSI_DIR, "staging")
+VALIDATION_DIR = os.path.join(RSI_DIR, "validation")
+DEPLOYED_DIR = os.path.join(RSI_DIR, "deployed")
+IMPLEMENTED_DIR = os.path.join(RSI_DIR, "archive", "implemented")
+RELEASES_DIR = os.path.join(RSI_DIR, "releases")
+PACKS_DIR = os.path.join(RSI_DIR, "archive", "packs")
+
+INDEX_NAME = "index.jsonl"
+PACK_MAX_BYTES = 64 * 1024 * 1024
+MIN_AGE_SECONDS = 24 * 3600
+# Settled Warden outcomes nobody looks at again (not "escalated")
+ARCHIVABLE_OUTCOMES = ("deployed", "rejected", "canary_failed")
+# Live files larger than this are not searched for staging references
+REFERENCE_SCAN_BYTES = 1024 * 1024
+
+
+def _read_files(path: str) -> Dict[str, Dict]:
+    """Contents of a file or a whole tree: {rel_path: {"text"|"base64", "mode"}}"""
+    if os.path.isfile(path):
+        entries = [(os.path.basename(path), path)]
+    else:
+        entries = []
+        for root, dirs, files in os.walk(path):
+            for filename in files:
+                if filename == ARTIFACT_INDEX_NAME:
+                    continue  # derived from the other files
+                full_path = os.path.join(root, filename)
+                entries.append((os.path.relpath(full_path, path), full_path))
+
+    files = {}
+    for rel_path, full_path in sorted(entries):
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        entry = {"mode": os.stat(full_path).st_mode & 0o777}
+        try:
+            entry["text"] = data.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["base64"] = base64.b64encode(data).decode("ascii")
+        files[rel_path] = entry
+    return files
+
+
+class PackArchive:
+    """
+    Usage:
+        archive = PackArchive()
+        archive.put("staging", staging_id, staging_path)
+        archive.get("forge_0296f899_1772046734")   → [record, ...]
+    """
+
+    def __init__(self, packs_dir: str = PACKS_DIR):
+        self.packs_dir = packs_dir
+        self.index_path = os.path.join(packs_dir, INDEX_NAME)
+        os.makedirs(packs_dir, exist_ok=True)
+
+    def _active_pack(self) -> str:
+        packs = sorted(p for p in os.listdir(self.packs_dir) if p.startswith("pack-"))
+        if packs and os.path.getsize(os.path.join(self.packs_dir, packs[-1])) < PACK_MAX_BYTES:
+            return packs[-1]
+        return f"pack-{len(packs) + 1:04d}.jsonl.gz"
+
+    def put(self, kind: str, name: str, path: str) -> Dict:
+        """Append one item (file or tree) to the active pack and index it"""
+        archived_at = datetime.now().isoformat()
+        record = {"kind": kind, "name": name, "archived_at": archived_at, "files": _read_files(path)}
+        member = gzip.compress((json.dumps(record) + "\n").encode())
+
+        pack = self._active_pack()
+        with open(os.path.join(self.packs_dir, pack), 'ab') as f:
+            offset = f.tell()
+            f.write(member)
+            f.flush()
+            os.fsync(f.fileno())
+
+        entry = {"kind": kind, "name": name, "pack": pack, "offset": offset,
+                 "length": len(member), "archived_at": archived_at}
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return entry
+
+    def index(self) -> Dict[Tuple[str, str], Dict]:
+        """(kind, name) -> latest index entry"""
+        entries = {}
+        try:
+            with open(self.index_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        entries[(entry["kind"], entry["name"])] = entry
+        except OSError:
+            pass
+        return entries
+
+    def read(self, entry: Dict) -> Dict:
+        with open(os.path.join(self.packs_dir, entry["pack"]), 'rb') as f:
+            f.seek(entry["offset"])
+            return json.loads(gzip.decompress(f.read(entry["length"])))
+
+    def get(self, item_id: str) -> List[Dict]:
+        """Records named item_id (any kind), or exactly "<kind>:<name>" """
+        kind, _, name = item_id.partition(":") if ":" in item_id else ("", "", item_id)
+        return [self.read(entry) for (k, n), entry in sorted(self.index().items())
+                if n == name and (not kind or k == kind)]
+
+
+class Archiver:
+    """Moves terminal-state items from the hot directories into a PackArchive"""
+
+    def __init__(self, archive: Optional[PackArchive] = None, min_age: float = MIN_AGE_SECONDS):
+        self.archive = archive or PackArchive()
+        self.min_age = min_age
+
+    def _old(self, path: str) -> bool:
+        try:
+            return time.time() - os.lstat(path).st_mtime >= self.min_age
+        except OSError:
+            return False
+
+    @staticmethod
+    def _referenced_staging() -> Set[str]:
+        """Staging ids whose directory a live released script still names"""
+        if not os.path.isdir(RELEASES_DIR):
+            return set()
+        prefix = re.compile(re.escape(STAGING_DIR + os.sep) + r"([^/\s'\"]+)")
+        referenced = set()
+        for path in ReleaseStore(ArtifactStore(), RELEASES_DIR).live_paths():
+            if not path.endswith(EXECUTABLE_SUFFIXES):
+                continue  # manifests record staging paths as metadata only
+            try:
+                if os.path.getsize(path) > REFERENCE_SCAN_BYTES:
+                    continue
+                with open(path, 'r', errors='replace') as f:
+                    referenced.update(prefix.findall(f.read()))
+            except OSError:
+                continue
+        return referenced
+
+    def candidates(self) -> List[Tuple[str, str, str]]:
+        """(kind, name, path) of every item that is terminal and old enough"""
+        found = []
+        deployed, settled = set(), {}
+        if os.path.isdir(DEPLOYED_DIR):
+            index = DeployedIndex(DEPLOYED_DIR)
+            deployed, settled = index.load(), index.settled()
+
+        if os.path.isdir(STAGING_DIR):
+            referenced = self._referenced_staging()
+            for name in sorted(os.listdir(STAGING_DIR)):
+                path = os.path.join(STAGING_DIR, name)
+                if name in deployed and name not in referenced and os.path.isdir(path):
+                    found.append(("staging", name, path))
+
+        if os.path.isdir(VALIDATION_DIR):
+            for filename in sorted(os.listdir(VALIDATION_DIR)):
+                parsed = parse_report_name(filename)
+                if not parsed:
+                    continue
+                path = os.path.join(VALIDATION_DIR, filename)
+                if parsed[0] not in deployed and settled.get(filename) not in ARCHIVABLE_OUTCOMES:
+                    try:
+                        with open(path, 'r') as f:
+                            if json.load(f).get('result', {}).get('passed'):
+                                continue  # approved, still up to the Warden
+                    except (OSError, ValueError):
+                        continue
+                found.append(("validation", filename[:-len(".json")], path))
+
+        if os.path.isdir(DEPLOYED_DIR):
+            for filename in sorted(os.listdir(DEPLOYED_DIR)):
+                if filename.endswith(MARKER_SUFFIX) and filename[:-len(MARKER_SUFFIX)] in deployed:
+                    found.append(("deployed", filename, os.path.join(DEPLOYED_DIR, filename)))
+
+        if os.path.isdir(PROPOSALS_DIR):
+            status_log = StatusLog(PROPOSALS_DIR)
+            try:
+                statuses = status_log.refresh()
+            finally:
+                status_log.close()
+            for filename in sorted(os.listdir(PROPOSALS_DIR)):
+                status = statuses.get(filename, {})
+                if (filename.endswith('.json') and status.get('status') == 'implemented'
+                        and status.get('staging_id') in deployed):
+                    found.append(("proposal", filename[:-len(".json")], os.path.join(PROPOSALS_DIR, filename)))
+
+        if os.path.isdir(IMPLEMENTED_DIR):
+            for filename in sorted(os.listdir(IMPLEMENTED_DIR)):
+                if filename.endswith('.json'):
+                    found.append(("proposal", filename[:-len(".json")], os.path.join(IMPLEMENTED_DIR, filename)))
+
+        return [(kind, name, path) for kind, name, path in found if self._old(path)]
+
+    def run(self) -> Dict[str, int]:
+        """Archive every candidate; returns counts per kind"""
+        counts: Dict[str, int] = {}
+        for kind, name, path in self.candidates():
+            self.archive.put(kind, name, path)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            counts[kind] = counts.get(kind, 0) + 1
+        return counts
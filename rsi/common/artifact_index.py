@@ -0,0 +1,148 @@
+"""
+SHARED ARTIFACT INDEX
+One directory walk and one read per staged file, shared by Crucible and Warden
+
+The index for a staging dir lives in <staging>/.artifact_index.json:
+
+  {"version": 2, "files": {rel_path: {"size", "mtime", "sha256", "type",
+                                      "executable"}}}
+
+The first pillar that needs the index builds it with os.scandir; later
+ones load it and re-stat each entry (DirEntry stat data, no reads),
+re-reading only files whose size or mtime changed. Content checks stream
+the files themselves (common.content_scanner).
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, List, Optional
+
+INDEX_NAME = ".artifact_index.json"
+INDEX_VERSION = 2
+SNIFF_BYTES = 1024
+
+TYPES_BY_SUFFIX = {
+    ".py": "python",
+    ".sh": "shell",
+    ".json": "json",
+    ".md": "markdown",
+    ".txt": "text",
+    ".log": "text",
+}
+
+
+def detect_type(name: str, head: bytes) -> str:
+    """File type from suffix, shebang, or a NUL-byte sniff"""
+    suffix = os.path.splitext(name)[1].lower()
+    if suffix in TYPES_BY_SUFFIX:
+        return TYPES_BY_SUFFIX[suffix]
+    if b"\0" in head:
+        return "binary"
+    if head.startswith(b"#!"):
+        shebang = head.split(b"\n", 1)[0]
+        if b"python" in shebang:
+            return "python"
+        if b"sh" in shebang:
+            return "shell"
+    return "text"
+
+
+def _walk(root: str) -> Dict[str, os.DirEntry]:
+    entries = {}
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    entries[os.path.relpath(entry.path, root)] = entry
+    return entries
+
+
+def _index_file(entry: os.DirEntry) -> Dict:
+    """Hash and sniff one file in a single read"""
+    st = entry.stat()
+    digest = hashlib.sha256()
+    head = b""
+
+    with open(entry.path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            if not head:
+                head = chunk[:SNIFF_BYTES]
+            digest.update(chunk)
+
+    return {
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "sha256": digest.hexdigest(),
+        "type": detect_type(entry.name, head),
+        "executable": bool(st.st_mode & 0o111),
+    }
+
+
+class ArtifactIndex:
+    """
+    Usage:
+        index = ArtifactIndex.for_tree(staging_path)
+        for rel, entry in index.select(types=("shell", "python")):
+            entry["sha256"]
+    """
+
+    def __init__(self, root: str, files: Dict[str, Dict]):
+        self.root = root
+        self.files = files
+
+    @classmethod
+    def for_tree(cls, root: str, save: bool = True) -> "ArtifactIndex":
+        """Load the stored index, refreshing changed entries, or build it"""
+        stored = {}
+        try:
+            with open(os.path.join(root, INDEX_NAME), 'r') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                stored = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+        files = {}
+        changed = False
+        for rel, entry in _walk(root).items():
+            previous = stored.get(rel)
+            st = entry.stat()
+            if previous and previous["size"] == st.st_size and previous["mtime"] == st.st_mtime:
+                files[rel] = previous
+            else:
+                files[rel] = _index_file(entry)
+                changed = True
+        changed = changed or set(stored) != set(files)
+
+        index = cls(root, files)
+        if changed and save:
+            index.save()
+        return index
+
+    def save(self):
+        path = os.path.join(self.root, INDEX_NAME)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"version": INDEX_VERSION, "files": self.files}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # read-only tree: the in-memory index is still usable
+
+    def select(self, types: Optional[tuple] = None, suffixes: Optional[tuple] = None) -> List[tuple]:
+        """(rel_path, entry) pairs filtered by detected type and/or suffix, sorted by path"""
+        selected = []
+        for rel in sorted(self.files):
+            entry = self.files[rel]
+            if types and entry["type"] not in types:
+                continue
+            if suffixes and not rel.endswith(suffixes):
+                continue
+            selected.append((rel, entry))
+        return selected
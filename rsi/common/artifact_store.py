@@ -0,0 +1,184 @@
+"""
+CONTENT-ADDRESSED ARTIFACT STORE
+Shared blob store for Forge staging and Warden deployment trees
+
+Every artifact is stored once under store/objects/<aa>/<sha256>[-x] (the -x
+suffix keeps executable and non-executable copies of the same bytes apart,
+since hardlinks share permission bits). A staging or deployed directory is
+then just a set of hardlinks into the store plus a `.artifacts.json` tree
+manifest mapping relative path -> hash/size/mode.
+
+Blobs are read-only: trees built from them must be treated as immutable
+and replaced, never edited in place.
+"""
+
+import os
+import json
+import errno
+import shutil
+import hashlib
+from typing import Dict, Optional
+
+STORE_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/store"
+TREE_MANIFEST = ".artifacts.json"
+CHUNK_SIZE = 1024 * 1024
+
+# Linux FICLONE ioctl (reflink on btrfs/xfs); used when hardlinking fails
+FICLONE = 0x40049409
+
+
+def hash_file(path: str) -> str:
+    """Streaming sha256 of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_digest(artifacts: Dict[str, Dict]) -> str:
+    """Single hash identifying a whole artifact set (paths, contents, modes)"""
+    digest = hashlib.sha256()
+    for rel_path in sorted(artifacts):
+        entry = artifacts[rel_path]
+        digest.update(f"{rel_path}\0{entry['sha256']}\0{entry['executable']}\n".encode())
+    return digest.hexdigest()
+
+
+def load_tree(tree_path: str) -> Optional[Dict]:
+    """Read a tree's .artifacts.json, None if the tree was never ingested"""
+    try:
+        with open(os.path.join(tree_path, TREE_MANIFEST), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class ArtifactStore:
+    """
+    Deduplicating blob store with hardlink/reflink materialization
+
+    Usage:
+        store = ArtifactStore()
+        tree = store.ingest_tree(staging_path)      # files -> links into store
+        store.materialize(tree, deployed_path)      # O(files) links, no byte copies
+    """
+
+    def __init__(self, store_dir: str = STORE_DIR):
+        self.store_dir = store_dir
+        self.objects_dir = os.path.join(store_dir, "objects")
+        self.tmp_dir = os.path.join(store_dir, "tmp")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def blob_path(self, sha256: str, executable: bool = False) -> str:
+        suffix = "-x" if executable else ""
+        return os.path.join(self.objects_dir, sha256[:2], sha256 + suffix)
+
+    def has(self, sha256: str, executable: bool = False) -> bool:
+        return os.path.exists(self.blob_path(sha256, executable))
+
+    def put_file(self, path: str) -> Dict:
+        """
+        Add a file's content to the store
+        Returns its tree entry: {sha256, size, executable}
+        """
+        executable = bool(os.stat(path).st_mode & 0o111)
+        sha256 = hash_file(path)
+        blob = self.blob_path(sha256, executable)
+
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            tmp_path = os.path.join(self.tmp_dir, f"{sha256}.{os.getpid()}")
+            shutil.copyfile(path, tmp_path)
+            os.chmod(tmp_path, 0o555 if executable else 0o444)
+            os.replace(tmp_path, blob)
+
+        return {
+            "sha256": sha256,
+            "size": os.path.getsize(blob),
+            "executable": executable
+        }
+
+    def with_mode(self, entry: Dict, executable: bool) -> Dict:
+        """Tree entry for the same content with the other permission bits"""
+        if entry["executable"] == executable:
+            return entry
+        blob = self.blob_path(entry["sha256"], executable)
+        if not os.path.exists(blob):
+            tmp_path = os.path.join(self.tmp_dir, f"{entry['sha256']}.{os.getpid()}")
+            shutil.copyfile(self.blob_path(entry["sha256"], entry["executable"]), tmp_path)
+            os.chmod(tmp_path, 0o555 if executable else 0o444)
+            os.replace(tmp_path, blob)
+        return dict(entry, executable=executable)
+
+    def _link(self, blob: str, dest: str):
+        """Place blob at dest atomically: hardlink, else reflink, else copy"""
+        tmp_dest = f"{dest}.tmp{os.getpid()}"
+        try:
+            os.link(blob, tmp_dest)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+            self._clone_or_copy(blob, tmp_dest)
+        os.replace(tmp_dest, dest)
+
+    def _clone_or_copy(self, src: str, dest: str):
+        try:
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except (ImportError, OSError):
+            shutil.copyfile(src, dest)
+        shutil.copymode(src, dest)
+
+    def ingest_tree(self, tree_path: str) -> Dict[str, Dict]:
+        """
+        Move every regular file in tree_path into the store and replace it
+        with a link to its blob. Dotfiles (markers, the tree manifest) are
+        left alone. Files already linked to the recorded blob are not
+        re-hashed. Writes and returns the tree manifest.
+        """
+        previous = load_tree(tree_path) or {}
+        artifacts = {}
+
+        for root, dirs, files in os.walk(tree_path):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for filename in files:
+                if filename.startswith('.'):
+                    continue
+                full_path = os.path.join(root, filename)
+                if os.path.islink(full_path):
+                    continue
+                rel_path = os.path.relpath(full_path, tree_path)
+
+                known = previous.get(rel_path)
+                if known:
+                    blob = self.blob_path(known["sha256"], known["executable"])
+                    if os.path.exists(blob) and os.path.samefile(blob, full_path):
+                        artifacts[rel_path] = known
+                        continue
+
+                entry = self.put_file(full_path)
+                self._link(self.blob_path(entry["sha256"], entry["executable"]), full_path)
+                artifacts[rel_path] = entry
+
+        self.write_tree(tree_path, artifacts)
+        return artifacts
+
+    def materialize(self, artifacts: Dict[str, Dict], dest_path: str):
+        """Build a tree at dest_path from a manifest, linking each blob"""
+        os.makedirs(dest_path, exist_ok=True)
+        for rel_path, entry in artifacts.items():
+            dest = os.path.join(dest_path, rel_path)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            self._link(self.blob_path(entry["sha256"], entry["executable"]), dest)
+        self.write_tree(dest_path, artifacts)
+
+    def write_tree(self, tree_path: str, artifacts: Dict[str, Dict]):
+        """Record a tree manifest for files already linked into the store"""
+        manifest_path = os.path.join(tree_path, TREE_MANIFEST)
+        tmp_path = f"{manifest_path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(artifacts, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
@@ -0,0 +1,86 @@
+"""
+PROPOSAL BATCHING
+Coalesce proposals that target the same component into one implementation unit
+
+Forager often reports several findings about one service in the same
+cycle (an error_rate on fred_bot.log next to a process_failure on
+concierge_bot) and repeats optimization proposals every heartbeat. Forge
+groups such proposals into one staging dir with a merged manifest:
+
+  staging/forge_batch_<first_id>_<ts>/
+      manifest.json                       "members": [...]
+      process_failure_<id>/...            one subdir per distinct unit
+      error_rate_<id>/...
+
+so Crucible and Warden validate and deploy the group once. Single
+proposals keep the flat layout.
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+# Finding component -> the service it belongs to
+COMPONENT_SERVICES = {
+    "concierge_bot": "concierge_bot",
+    "fred_bot.log": "concierge_bot",
+    "watchdog_v3.log": "watchdog",
+    "coordinator.log": "coordinator",
+    "disk_space": "disk_space",
+}
+
+BATCH_WINDOW_SECONDS = 15 * 60
+
+
+def batch_key(proposal: Dict) -> str:
+    """Service a proposal targets, or its type when it names no component"""
+    finding = proposal.get('finding', {})
+    component = finding.get('component')
+    if component:
+        return "component:" + COMPONENT_SERVICES.get(component, component)
+    return "type:" + finding.get('type', 'unknown')
+
+
+def _created_at(proposal: Dict) -> float:
+    try:
+        return datetime.fromisoformat(proposal['metadata']['created_at']).timestamp()
+    except (KeyError, ValueError, TypeError):
+        return 0.0
+
+
+def group_proposals(proposals: List[Dict], window: float = BATCH_WINDOW_SECONDS) -> List[List[Dict]]:
+    """
+    Split proposals into batches of the same batch_key whose creation
+    times fall within `window` seconds of the batch's first proposal
+    """
+    batches: List[List[Dict]] = []
+    open_batches: Dict[str, List[Dict]] = {}
+
+    for proposal in sorted(proposals, key=_created_at):
+        key = batch_key(proposal)
+        batch = open_batches.get(key)
+        if batch and _created_at(proposal) - _created_at(batch[0]) <= window:
+            batch.append(proposal)
+        else:
+            batch = [proposal]
+            open_batches[key] = batch
+            batches.append(batch)
+
+    return batches
+
+
+def manifest_members(manifest: Dict) -> List[Dict]:
+    """
+    Units to validate/deploy for a Forge manifest
+    Returns [{"proposal_type", "path", "source_proposal"}], path relative
+    to the staging dir ("" for single, flat implementations)
+    """
+    members = manifest.get('members')
+    if members:
+        return members
+
+    proposal = manifest.get('source_proposal', {})
+    return [{
+        "proposal_type": proposal.get('finding', {}).get('type', 'unknown'),
+        "path": "",
+        "source_proposal": proposal
+    }]
@@ -0,0 +1,156 @@
+"""
+CRUCIBLE BENCHMARK GATE
+Optional microbenchmarks for staged code, compared against deployed baselines
+
+An implementation opts in by staging a benchmarks.json next to its
+artifacts (at the unit root for batched staging dirs):
+
+  {"benchmarks": [
+      {"name": "concierge_restart", "script": "restart_concierge.sh",
+       "args": [], "runs": 7}
+  ]}
+
+Crucible runs each entry point in the sandbox (one warmup, then `runs`
+timed runs) and compares median and p95 with the baseline recorded for the
+currently deployed version of the same benchmark name. A median slower by
+more than the threshold (and by more than MIN_DELTA_SECONDS, to ignore
+timer noise on tiny scripts) is a regression; p95 regressions are only
+flagged. When Warden deploys, the measured numbers become the new
+baseline in store/benchmarks/baselines.json.
+"""
+
+import os
+import json
+import fcntl
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .artifact_store import STORE_DIR
+
+BENCHMARK_FILE = "benchmarks.json"
+BENCHMARKS_DIR = os.path.join(STORE_DIR, "benchmarks")
+BASELINES_NAME = "baselines.json"
+LOCK_NAME = ".lock"
+
+DEFAULT_RUNS = 5
+REGRESSION_THRESHOLD = 0.20
+MIN_DELTA_SECONDS = 0.005
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0-100)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_timings(timings: List[float]) -> Dict:
+    return {
+        "runs": len(timings),
+        "median": round(percentile(timings, 50), 6),
+        "p95": round(percentile(timings, 95), 6),
+    }
+
+
+def load_benchmarks(staging_path: str) -> List[Dict]:
+    """
+    Benchmark declarations in a staging dir
+    Returns [{"name", "script", "args", "runs"}] with script relative to staging_path
+    """
+    declared = []
+    for root, dirs, files in os.walk(staging_path):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        if BENCHMARK_FILE not in files:
+            continue
+        with open(os.path.join(root, BENCHMARK_FILE), 'r') as f:
+            spec = json.load(f)
+        unit = os.path.relpath(root, staging_path)
+        for bench in spec.get("benchmarks", []):
+            script = bench["script"] if unit == "." else os.path.join(unit, bench["script"])
+            declared.append({
+                "name": bench.get("name") or bench["script"],
+                "script": script,
+                "args": [str(a) for a in bench.get("args", [])],
+                "runs": int(bench.get("runs", DEFAULT_RUNS)),
+            })
+    return declared
+
+
+def compare(name: str, measured: Dict, baseline: Optional[Dict],
+            threshold: float = REGRESSION_THRESHOLD) -> Tuple[bool, str]:
+    """(regressed, report_line) for one benchmark"""
+    numbers = f"median {measured['median'] * 1000:.1f}ms, p95 {measured['p95'] * 1000:.1f}ms"
+    if not baseline:
+        return False, f"ℹ️  Benchmark {name}: {numbers} (no baseline)"
+
+    def change(key: str) -> float:
+        return (measured[key] - baseline[key]) / baseline[key] if baseline[key] else 0.0
+
+    median_change = change("median")
+    p95_change = change("p95")
+    delta = f"median {median_change:+.0%}, p95 {p95_change:+.0%} vs {baseline.get('staging_id', 'baseline')}"
+
+    if median_change > threshold and measured["median"] - baseline["median"] > MIN_DELTA_SECONDS:
+        return True, f"❌ Benchmark regression {name}: {numbers} ({delta})"
+    if p95_change > threshold and measured["p95"] - baseline["p95"] > MIN_DELTA_SECONDS:
+        return False, f"⚠️  Benchmark tail slower {name}: {numbers} ({delta})"
+    return False, f"✅ Benchmark {name}: {numbers} ({delta})"
+
+
+class BenchmarkBaselines:
+    """
+    Usage:
+        baselines = BenchmarkBaselines()
+        baselines.get("concierge_restart")           # Crucible
+        baselines.promote(results, staging_id)       # Warden, after deploy
+    """
+
+    def __init__(self, benchmarks_dir: str = BENCHMARKS_DIR):
+        self.path = os.path.join(benchmarks_dir, BASELINES_NAME)
+        self.lock_path = os.path.join(benchmarks_dir, LOCK_NAME)
+        os.makedirs(benchmarks_dir, exist_ok=True)
+
+    @contextmanager
+    def exclusive(self):
+        """Host-wide benchmark slot, so parallel validators never time concurrently"""
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, name: str) -> Optional[Dict]:
+        return self.load().get(name)
+
+    def revision(self, names: List[str]) -> str:
+        """Hash of the baselines for these names (keys cached validations)"""
+        baselines = self.load()
+        payload = {name: baselines.get(name) for name in sorted(names)}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+    def promote(self, results: Dict[str, Dict], staging_id: str):
+        """Record measured results of a deployed implementation as the new baselines"""
+        if not results:
+            return
+        baselines = self.load()
+        for name, measured in results.items():
+            baselines[name] = dict(measured, staging_id=staging_id,
+                                   recorded_at=datetime.now().isoformat())
+        tmp_path = f"{self.path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(baselines, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,163 @@
+"""
+COMPILED CONSTITUTION
+CONSTITUTION.md parsed once into the rules the Warden enforces
+
+Sources inside the document:
+  Header          "# Version: x.y.z"
+  Article IV      "Score >= 0.8"                -> min_crucible_score (Crucible
+                                                   pass threshold, Warden check)
+  Article V       "after N retry loops"         -> max_retries (RetryScheduler)
+  Article VII     fenced ```policy JSON block   -> human-required type rules,
+                                                   forbidden content patterns,
+                                                   scanned file suffixes
+
+ConstitutionCache keeps the compiled result and recompiles only when the
+file's mtime or size changes, so every validation in a cycle shares one
+parse. If the policy block is missing the built-in defaults (the rules the
+Warden used before the Constitution was parsed) apply; if the file cannot
+be read or parsed the last good compilation is kept.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from .content_scanner import ContentScanner
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLICY = {
+    "human_required_types": [
+        {"equals": "network_config", "reason": "Network configuration changes"},
+        {"contains": "credential", "reason": "Credential modifications"},
+        {"contains": "api_key", "reason": "Credential modifications"},
+        {"contains": "delete", "reason": "Data destruction"},
+        {"contains": "purge", "reason": "Data destruction"},
+        {"equals": "system_modification", "reason": "System-level changes"},
+    ],
+    "forbidden_patterns": [
+        {"pattern": "rm -rf /", "reason": "Destructive deletion pattern"},
+        {"pattern": "chmod 777", "reason": "Overly permissive permissions"},
+        {"pattern": "password=", "reason": "Potential credential exposure"},
+        {"pattern": "api_key=", "reason": "Potential credential exposure"},
+        {"pattern": "eval(", "reason": "Dangerous eval usage"},
+    ],
+    "scan_suffixes": [".sh", ".py", ".json"],
+}
+DEFAULT_MIN_SCORE = 0.8
+DEFAULT_MAX_RETRIES = 5
+
+VERSION_RE = re.compile(r"^#\s*Version:\s*(\S+)", re.MULTILINE)
+SCORE_RE = re.compile(r"Score\s*>=\s*([0-9.]+)")
+RETRIES_RE = re.compile(r"after\s+(\d+)\s+retry", re.IGNORECASE)
+POLICY_RE = re.compile(r"```policy\s*\n(.*?)```", re.DOTALL)
+
+
+class CompiledConstitution:
+    """
+    Usage:
+        constitution = ConstitutionCache(path).get()
+        constitution.human_required("network_config")   → ["Network configuration changes"]
+        constitution.scanner.scan_file(path)             → {"findings": [...]}
+    """
+
+    def __init__(self, version: str, min_crucible_score: float, max_retries: int,
+                 policy: Dict, source_hash: str):
+        self.version = version
+        self.min_crucible_score = min_crucible_score
+        self.max_retries = max_retries
+        self.source_hash = source_hash
+        self.policy_version = hashlib.sha256(
+            json.dumps(policy, sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+        self.equals_rules: Dict[str, List[str]] = {}
+        self.contains_rules: List[Tuple[str, str]] = []
+        for rule in policy.get("human_required_types", []):
+            if "equals" in rule:
+                self.equals_rules.setdefault(rule["equals"], []).append(rule["reason"])
+            elif "contains" in rule:
+                self.contains_rules.append((rule["contains"].lower(), rule["reason"]))
+
+        self.forbidden = [(p["pattern"].lower(), p["reason"]) for p in policy.get("forbidden_patterns", [])]
+        self.scan_suffixes = tuple(policy.get("scan_suffixes", DEFAULT_POLICY["scan_suffixes"]))
+
+        self._scanner: Optional[ContentScanner] = None
+
+    @property
+    def rule_count(self) -> int:
+        return (sum(len(r) for r in self.equals_rules.values()) + len(self.contains_rules)
+                + len(self.forbidden) + 2)
+
+    def human_required(self, proposal_type: str) -> List[str]:
+        """Reasons this proposal type needs human approval (empty if none)"""
+        reasons = list(self.equals_rules.get(proposal_type, []))
+        lowered = proposal_type.lower()
+        for needle, reason in self.contains_rules:
+            if needle in lowered and reason not in reasons:
+                reasons.append(reason)
+        return reasons
+
+    @property
+    def scanner(self) -> ContentScanner:
+        """Streaming scanner for the forbidden patterns (built on first use)"""
+        if self._scanner is None:
+            self._scanner = ContentScanner(self.forbidden, self.policy_version)
+        return self._scanner
+
+
+def compile_constitution(content: str) -> CompiledConstitution:
+    version_match = VERSION_RE.search(content)
+    score_match = SCORE_RE.search(content)
+    retries_match = RETRIES_RE.search(content)
+    policy_match = POLICY_RE.search(content)
+
+    if policy_match:
+        policy = json.loads(policy_match.group(1))
+    else:
+        logger.warning("Constitution has no policy block - using built-in rules")
+        policy = DEFAULT_POLICY
+
+    return CompiledConstitution(
+        version=version_match.group(1) if version_match else "unknown",
+        min_crucible_score=float(score_match.group(1)) if score_match else DEFAULT_MIN_SCORE,
+        max_retries=int(retries_match.group(1)) if retries_match else DEFAULT_MAX_RETRIES,
+        policy=policy,
+        source_hash=hashlib.sha256(content.encode()).hexdigest(),
+    )
+
+
+class ConstitutionCache:
+    """Compiled Constitution, recompiled only when the file changes"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._compiled: Optional[CompiledConstitution] = None
+
+    def get(self) -> CompiledConstitution:
+        try:
+            st = os.stat(self.path)
+        except OSError as e:
+            logger.error(f"Failed to load Constitution: {e}")
+            return self._compiled or compile_constitution("")
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp and self._compiled is not None:
+            return self._compiled
+
+        try:
+            with open(self.path, 'r') as f:
+                compiled = compile_constitution(f.read())
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to compile Constitution (keeping previous rules): {e}")
+            return self._compiled or compile_constitution("")
+
+        if self._compiled is not None and compiled.source_hash != self._compiled.source_hash:
+            logger.info(f"📜 Constitution changed - recompiled v{compiled.version}")
+        self._stamp = stamp
+        self._compiled = compiled
+        return compiled
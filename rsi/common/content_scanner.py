@@ -0,0 +1,103 @@
+"""
+DANGEROUS-CONTENT SCANNER
+Streaming, case-insensitive multi-pattern scan of staged files for the Warden
+
+All forbidden patterns compile into one Aho-Corasick automaton (shared
+with the Crucible rule engine). Files are read in fixed-size chunks; the
+automaton state and line counter carry across chunk boundaries, so a
+pattern split between two chunks is still found and memory stays bounded
+by the chunk size whatever the file size. Files whose first chunk contains
+a NUL byte are treated as binary and skipped.
+
+Verdicts depend only on file content and the pattern set, so they are
+cached under store/scan/ by content hash and policy version: an unchanged
+file is never scanned twice.
+"""
+
+import os
+import json
+import codecs
+from typing import Dict, List, Optional, Tuple
+
+from .artifact_store import STORE_DIR, hash_file
+from .rules import PatternMatcher
+
+SCAN_DIR = os.path.join(STORE_DIR, "scan")
+CHUNK_SIZE = 64 * 1024
+SNIFF_BYTES = 8192
+MAX_LINES_PER_PATTERN = 5
+
+
+class ContentScanner:
+    """
+    Usage:
+        scanner = ContentScanner([("eval(", "Dangerous eval usage")], policy_version)
+        verdict = scanner.scan_file(path, sha256)
+        verdict["findings"]   → [{"pattern", "reason", "lines": [12, 40]}]
+    """
+
+    def __init__(self, patterns: List[Tuple[str, str]], policy_version: str,
+                 cache_dir: str = SCAN_DIR):
+        self.reasons: Dict[str, str] = {}
+        for pattern, reason in patterns:
+            self.reasons.setdefault(pattern.lower(), reason)
+        self.policy_version = policy_version
+        self.cache_dir = cache_dir
+        self.matcher = PatternMatcher({(pattern, True) for pattern in self.reasons})
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_path(self, sha256: str) -> str:
+        return os.path.join(self.cache_dir, f"{sha256}.{self.policy_version}.json")
+
+    def _scan(self, path: str) -> Dict:
+        """One streaming pass: {"binary": bool, "findings": [...]}"""
+        goto, fail, out = self.matcher.goto, self.matcher.fail, self.matcher.out
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        lines: Dict[str, List[int]] = {}
+        state = 0
+        line = 1
+
+        with open(path, 'rb') as f:
+            first = True
+            while True:
+                data = f.read(CHUNK_SIZE)
+                if first:
+                    if b"\0" in data[:SNIFF_BYTES]:
+                        return {"binary": True, "findings": []}
+                    first = False
+
+                for ch in decoder.decode(data, final=not data).lower():
+                    if ch == "\n":
+                        line += 1
+                    while state and ch not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(ch, 0)
+                    for pattern, _ in out[state]:
+                        hits = lines.setdefault(pattern, [])
+                        if len(hits) < MAX_LINES_PER_PATTERN and (not hits or hits[-1] != line):
+                            hits.append(line)
+
+                if not data:
+                    break
+
+        findings = [
+            {"pattern": pattern, "reason": self.reasons[pattern], "lines": lines[pattern]}
+            for pattern in self.reasons if pattern in lines
+        ]
+        return {"binary": False, "findings": findings}
+
+    def scan_file(self, path: str, sha256: Optional[str] = None) -> Dict:
+        """Cached verdict for a file; sha256 (e.g. from the artifact index) avoids re-hashing"""
+        cache_path = self._cache_path(sha256 or hash_file(path))
+        try:
+            with open(cache_path, 'r') as f:
+                return dict(json.load(f), cached=True)
+        except (OSError, ValueError):
+            pass
+
+        verdict = self._scan(path)
+        tmp_path = f"{cache_path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(verdict, f)
+        os.replace(tmp_path, cache_path)
+        return dict(verdict, cached=False)
@@ -0,0 +1,176 @@
+"""
+DEPLOYED INDEX AND POLL HIGH-WATER MARK
+What the Warden has already handled, without opening handled reports
+
+  deployed/.deployed_ids     one staging id per line, appended on promote
+  deployed/.poll_state.json  {"high_water": ts, "pending": [filenames],
+                              "settled": {filename: outcome},
+                              "deferred": {filename: {"attempts", "next_at"}}}
+
+Validation reports are named val_<staging_id>_<ts>.json, so the staging
+id and creation time come from the name alone. A report is skipped
+without being opened when its staging id is in the deployed set, when it
+is settled, or when its timestamp is at or below the high-water mark and
+it is not pending.
+
+Approved reports handed to the Warden stay pending until the Warden
+records a terminal outcome (escalated, rejected, canary_failed, deployed)
+with settle(); a report whose cycle crashed first is looked at again.
+Settled reports are never reparsed, and are forgotten once the report
+itself leaves the validation dir.
+
+A failed deploy is not terminal (pip, network, a busy file): defer()
+keeps the report pending but skips it until its backoff has passed,
+doubling from DEPLOY_RETRY_BASE up to DEPLOY_RETRY_MAX per attempt.
+"""
+
+import os
+import re
+import json
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from .retry_scheduler import BASE_DELAY_SECONDS, MAX_DELAY_SECONDS
+
+IDS_NAME = ".deployed_ids"
+STATE_NAME = ".poll_state.json"
+MARKER_SUFFIX = ".deployed"
+
+# Reports may still be arriving for the last few seconds; keep them above the mark
+HIGH_WATER_SLACK = 60
+
+DEPLOY_RETRY_BASE = BASE_DELAY_SECONDS
+DEPLOY_RETRY_MAX = MAX_DELAY_SECONDS
+
+REPORT_RE = re.compile(r"^val_(.+)_(\d+)\.json$")
+
+
+def parse_report_name(filename: str) -> Optional[Tuple[str, int]]:
+    """(staging_id, ts) from val_<staging_id>_<ts>.json, None for other names"""
+    match = REPORT_RE.match(filename)
+    if not match:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+class DeployedIndex:
+    """
+    Usage:
+        index = DeployedIndex(deployed_dir)
+        deployed = index.load()                  # set of staging ids, once per cycle
+        index.add(staging_id)                    # after promotion
+        names = index.unhandled(os.listdir(validation_dir), deployed)
+        index.advance(names_seen, still_pending)
+        index.settle({filename: "escalated"})  # after the cycle decided
+    """
+
+    def __init__(self, deployed_dir: str):
+        self.deployed_dir = deployed_dir
+        self.ids_path = os.path.join(deployed_dir, IDS_NAME)
+        self.state_path = os.path.join(deployed_dir, STATE_NAME)
+
+    def load(self) -> Set[str]:
+        """Deployed staging ids (built from the .deployed markers the first time)"""
+        try:
+            with open(self.ids_path, 'r') as f:
+                return {line.strip() for line in f if line.strip()}
+        except FileNotFoundError:
+            pass
+
+        ids = {name[:-len(MARKER_SUFFIX)] for name in os.listdir(self.deployed_dir)
+               if name.endswith(MARKER_SUFFIX)}
+        tmp_path = f"{self.ids_path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            f.writelines(f"{staging_id}\n" for staging_id in sorted(ids))
+        os.replace(tmp_path, self.ids_path)
+        return ids
+
+    def add(self, staging_id: str):
+        with open(self.ids_path, 'a') as f:
+            f.write(f"{staging_id}\n")
+
+    def _state(self) -> dict:
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"high_water": 0, "pending": [], "settled": {}}
+
+    def _save(self, state: dict):
+        tmp_path = f"{self.state_path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def unhandled(self, filenames: List[str], deployed: Set[str]) -> List[str]:
+        """Report names that may still need work, decided from the names alone"""
+        state = self._state()
+        high_water = state["high_water"]
+        pending = set(state["pending"])
+        settled = state.get("settled", {})
+        deferred = state.get("deferred", {})
+        now = time.time()
+
+        names = []
+        for filename in filenames:
+            parsed = parse_report_name(filename)
+            if parsed is None:
+                if filename.endswith('.json'):
+                    names.append(filename)
+                continue
+            staging_id, ts = parsed
+            if staging_id in deployed or filename in settled:
+                continue
+            if filename in deferred and deferred[filename]["next_at"] > now:
+                continue  # failed deploy, still backing off
+            if ts <= high_water and filename not in pending:
+                continue
+            names.append(filename)
+        return names
+
+    def advance(self, filenames: List[str], pending: List[str]):
+        """Move the mark past the reports seen this cycle, keeping `pending` (and deferred) open"""
+        stamps = [parsed[1] for parsed in map(parse_report_name, filenames) if parsed]
+        state = self._state()
+        if stamps:
+            state["high_water"] = max(state["high_water"],
+                                      min(max(stamps), int(time.time()) - HIGH_WATER_SLACK))
+        present = set(filenames)
+        state["settled"] = {name: outcome for name, outcome in state.get("settled", {}).items()
+                            if name in present}
+        state["deferred"] = {name: retry for name, retry in state.get("deferred", {}).items()
+                             if name in present and name not in state["settled"]}
+        state["pending"] = sorted(name for name in set(pending) | set(state["deferred"])
+                                  if name not in state["settled"])
+        self._save(state)
+
+    def settled(self) -> Dict[str, str]:
+        return dict(self._state().get("settled", {}))
+
+    def settle(self, outcomes: Dict[str, str]):
+        """Record the terminal outcome of reports; they are never polled again"""
+        if not outcomes:
+            return
+        state = self._state()
+        state.setdefault("settled", {}).update(outcomes)
+        state["pending"] = [name for name in state["pending"] if name not in outcomes]
+        deferred = state.get("deferred", {})
+        for name in outcomes:
+            deferred.pop(name, None)
+        self._save(state)
+
+    def defer(self, filenames: List[str]) -> Dict[str, float]:
+        """Keep failed deploys pending, due again after a growing backoff; {filename: next_at}"""
+        if not filenames:
+            return {}
+        state = self._state()
+        deferred = state.setdefault("deferred", {})
+        due = {}
+        for name in filenames:
+            attempts = deferred.get(name, {}).get("attempts", 0) + 1
+            delay = min(DEPLOY_RETRY_MAX, DEPLOY_RETRY_BASE * (2 ** (attempts - 1)))
+            deferred[name] = {"attempts": attempts, "next_at": time.time() + delay}
+            due[name] = deferred[name]["next_at"]
+        state["pending"] = sorted(set(state["pending"]) | set(filenames))
+        self._save(state)
+        return due
@@ -0,0 +1,197 @@
+"""
+HUMAN ESCALATION QUEUE
+Deduplicated escalations, delivered as one digest per interval
+
+Warden used to write a full ESCALATION_<id>_<ts>.json (embedding the whole
+validation) for every escalation, so a proposal re-implemented every
+cycle escalated every cycle. Escalations are now keyed by
+(reason, proposal lineage) in logs/escalations/queue.json:
+
+  {"last_digest_at": epoch, "items": {key: {"reason", "proposal_type",
+      "lineage", "staging_ids", "seen", "count", "first_seen", "last_seen",
+      "pending"}}}
+
+A new staging id for a queued key only bumps the count; seeing the same
+staging id again (the Warden re-reading a report) changes nothing.
+staging_ids keeps the last MAX_STAGING_IDS for the digest, seen keeps
+every id so dedup holds however many there were; both go when the item
+is pruned. flush() sends the items with pending occurrences to a
+Notifier as one digest, at most once per interval.
+Notifiers:
+
+  file:/path/digests.jsonl     append each digest as a JSON line
+  unix:/path/notify.sock       send each digest as a JSON line to a socket
+
+Anything that can deliver a dict (Telegram, e-mail) implements
+Notifier.send().
+"""
+
+import os
+import json
+import time
+import socket
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DIGEST_INTERVAL = 15 * 60
+MAX_STAGING_IDS = 10
+MAX_AGE_SECONDS = 30 * 24 * 3600
+SOCKET_TIMEOUT = 5
+
+
+class Notifier(ABC):
+    """Delivers escalation digests; send() returns False to retry next flush"""
+
+    @abstractmethod
+    def send(self, digest: Dict) -> bool:
+        ...
+
+
+class FileNotifier(Notifier):
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def send(self, digest: Dict) -> bool:
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(digest) + "\n")
+        return True
+
+
+class SocketNotifier(Notifier):
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, digest: Dict) -> bool:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(SOCKET_TIMEOUT)
+                sock.connect(self.path)
+                sock.sendall((json.dumps(digest) + "\n").encode())
+            return True
+        except OSError as e:
+            logger.warning(f"Escalation socket {self.path} unavailable: {e}")
+            return False
+
+
+def make_notifier(spec: str) -> Notifier:
+    """Notifier from "file:<path>" or "unix:<socket path>" """
+    kind, _, path = spec.partition(":")
+    if kind == "file":
+        return FileNotifier(path)
+    if kind == "unix":
+        return SocketNotifier(path)
+    raise ValueError(f"Unknown notifier: {spec}")
+
+
+class EscalationQueue:
+    """
+    Usage:
+        queue = EscalationQueue(queue_dir)
+        queue.add(reason, proposal_type, lineage, staging_id)   # True if new
+        queue.flush(notifier)                                   # digest, if due
+    """
+
+    def __init__(self, queue_dir: str, interval: float = DIGEST_INTERVAL):
+        self.path = os.path.join(queue_dir, "queue.json")
+        self.interval = interval
+        os.makedirs(queue_dir, exist_ok=True)
+        self.state = self._load()
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"last_digest_at": 0, "items": {}}
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def key(reason: str, lineage: str) -> str:
+        return hashlib.sha256(f"{reason}\0{lineage}".encode()).hexdigest()[:16]
+
+    def add(self, reason: str, proposal_type: str, lineage: str, staging_id: str) -> bool:
+        """Record an escalation; False if the same reason/lineage is already queued"""
+        now = datetime.now().isoformat()
+        key = self.key(reason, lineage)
+        item = self.state["items"].get(key)
+        is_new = item is None
+        if is_new:
+            item = self.state["items"][key] = {
+                "reason": reason,
+                "proposal_type": proposal_type,
+                "lineage": lineage,
+                "staging_ids": [],
+                "seen": [],
+                "count": 0,
+                "first_seen": now,
+                "pending": 0,
+            }
+
+        seen = item.setdefault("seen", list(item["staging_ids"]))
+        if staging_id in seen:
+            return False  # already queued (or delivered) for this staging id
+
+        item["count"] += 1
+        item["pending"] += 1
+        item["last_seen"] = now
+        seen.append(staging_id)
+        item["staging_ids"] = (item["staging_ids"] + [staging_id])[-MAX_STAGING_IDS:]
+        self._save()
+        return is_new
+
+    def pending(self) -> List[Dict]:
+        return [dict(item, key=key) for key, item in self.state["items"].items() if item["pending"]]
+
+    def flush(self, notifier: Notifier, force: bool = False) -> Optional[Dict]:
+        """Send one digest of pending escalations if the interval has passed"""
+        now = time.time()
+        self._prune(now)
+        items = self.pending()
+        if not items or (not force and now - self.state["last_digest_at"] < self.interval):
+            return None
+
+        digest = {
+            "generated_at": datetime.now().isoformat(),
+            "escalations": len(items),
+            "items": [
+                {
+                    "reason": item["reason"],
+                    "proposal_type": item["proposal_type"],
+                    "staging_ids": item["staging_ids"],
+                    "occurrences": item["pending"],
+                    "total": item["count"],
+                    "new": item["count"] == item["pending"],
+                    "first_seen": item["first_seen"],
+                    "last_seen": item["last_seen"],
+                }
+                for item in items
+            ],
+            "options": ["approve", "reject", "modify"],
+        }
+        if not notifier.send(digest):
+            return None
+
+        for item in items:
+            self.state["items"][item["key"]]["pending"] = 0
+        self.state["last_digest_at"] = now
+        self._save()
+        return digest
+
+    def _prune(self, now: float):
+        """Forget delivered escalations not seen for MAX_AGE_SECONDS"""
+        cutoff = datetime.fromtimestamp(now - MAX_AGE_SECONDS).isoformat()
+        stale = [k for k, item in self.state["items"].items()
+                 if not item["pending"] and item["last_seen"] < cutoff]
+        for key in stale:
+            del self.state["items"][key]
@@ -0,0 +1,79 @@
+"""
+FORGE IMPLEMENTATION MEMO
+Maps a proposal's content hash to the artifact set Forge produced for it
+
+The key covers the proposal type, the handler version and only the
+proposal fields the handler declares it reads (MEMO_FIELDS in the handler
+module). When the same finding comes back, Forge re-links the stored
+artifacts from the artifact store instead of regenerating them, so the new
+staging dir has the same tree_digest as the first one.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .artifact_store import STORE_DIR, tree_digest
+
+MEMO_DIR = os.path.join(STORE_DIR, "memo")
+
+
+def _lookup(data: Dict, dotted: str):
+    value = data
+    for part in dotted.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def proposal_key(proposal: Dict, proposal_type: str, fields: List[str], handler_version: str) -> str:
+    """Content hash of the proposal fields a handler depends on"""
+    payload = {
+        "type": proposal_type,
+        "handler_version": handler_version,
+        "fields": {field: _lookup(proposal, field) for field in fields}
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ImplementationMemo:
+    """
+    One small JSON record per key under store/memo/
+    """
+
+    def __init__(self, memo_dir: str = MEMO_DIR):
+        self.memo_dir = memo_dir
+        os.makedirs(self.memo_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.memo_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, staging_id: str, artifacts: Dict[str, Dict]):
+        record = {
+            "staging_id": staging_id,
+            "artifacts": artifacts,
+            "tree_digest": tree_digest(artifacts),
+            "created_at": datetime.now().isoformat()
+        }
+        tmp_path = f"{self._path(key)}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, self._path(key))
+
+    def drop(self, key: str):
+        """Forget a record whose output failed validation"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
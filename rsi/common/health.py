@@ -0,0 +1,116 @@
+"""
+CANARY HEALTH PROBES
+Post-deploy checks the Warden polls over an observation window
+
+Handlers declare probes for their deployments as a module attribute:
+
+  PROBES = [
+      Probe("Concierge Bot running", "process", pattern="fred_pt_bot.py"),
+      Probe("Bot log error rate", "log_errors", path="/tmp/fred_bot.log"),
+      Probe("Smoke test", "command", command=["bash", "smoke.sh"]),
+  ]
+
+Kinds:
+  process     `pgrep -f pattern` finds a live process
+  log_errors  of the lines appended to `path` since the window opened, at
+              most max_error_rate look like errors (needs min_lines lines)
+  command     the command exits 0 within timeout
+
+observe() runs every probe each interval until the window closes and
+fails fast on the first unhealthy result.
+"""
+
+import os
+import time
+import subprocess
+from typing import List, Optional, Tuple
+
+PROBE_KINDS = ("process", "log_errors", "command")
+ERROR_MARKERS = ("error", "exception", "traceback", "critical")
+LOG_TAIL_BYTES = 1024 * 1024
+
+
+class Probe:
+    """One health signal for a deployed change"""
+
+    def __init__(self, description: str, kind: str, pattern: Optional[str] = None,
+                 path: Optional[str] = None, command: Optional[List[str]] = None,
+                 max_error_rate: float = 0.1, min_lines: int = 5, timeout: float = 10):
+        if kind not in PROBE_KINDS:
+            raise ValueError(f"Unknown probe kind: {kind}")
+        self.description = description
+        self.kind = kind
+        self.pattern = pattern
+        self.path = path
+        self.command = command
+        self.max_error_rate = max_error_rate
+        self.min_lines = min_lines
+        self.timeout = timeout
+
+    def start(self) -> int:
+        """State captured when the window opens (log size for log_errors)"""
+        if self.kind == "log_errors":
+            try:
+                return os.path.getsize(self.path)
+            except OSError:
+                return 0
+        return 0
+
+    def check(self, state: int) -> Tuple[bool, str]:
+        if self.kind == "process":
+            return self._run(["pgrep", "-f", self.pattern], f"no process matching '{self.pattern}'")
+        if self.kind == "command":
+            return self._run(self.command, f"{' '.join(self.command)} failed")
+        return self._log_errors(state)
+
+    def _run(self, command: List[str], failure: str) -> Tuple[bool, str]:
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return False, f"{failure}: {e}"
+        if result.returncode != 0:
+            return False, f"{failure} (exit {result.returncode})"
+        return True, "ok"
+
+    def _log_errors(self, offset: int) -> Tuple[bool, str]:
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+                if end < offset:
+                    offset = 0  # rotated or truncated
+                f.seek(max(offset, end - LOG_TAIL_BYTES))
+                lines = f.read().decode("utf-8", errors="replace").lower().splitlines()
+        except FileNotFoundError:
+            return True, "no log yet"
+        except OSError as e:
+            return False, f"cannot read {self.path}: {e}"
+
+        if len(lines) < self.min_lines:
+            return True, f"{len(lines)} new log lines"
+        errors = sum(1 for line in lines if any(marker in line for marker in ERROR_MARKERS))
+        rate = errors / len(lines)
+        if rate > self.max_error_rate:
+            return False, f"error rate {rate:.0%} over {len(lines)} lines (max {self.max_error_rate:.0%})"
+        return True, f"error rate {rate:.0%}"
+
+
+def observe(probes: List[Probe], window: float, interval: float) -> Tuple[bool, str]:
+    """Poll probes until the window closes; (healthy, detail)"""
+    if not probes:
+        return True, "no probes declared"
+
+    states = [probe.start() for probe in probes]
+    deadline = time.monotonic() + window
+    checks = 0
+    while True:
+        for probe, state in zip(probes, states):
+            healthy, detail = probe.check(state)
+            if not healthy:
+                return False, f"{probe.description}: {detail}"
+        checks += 1
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True, f"{len(probes)} probe(s) healthy for {window:.0f}s ({checks} checks)"
+        time.sleep(min(interval, remaining))
@@ -0,0 +1,357 @@
+"""
+RELEASE STORE
+Immutable deployment trees activated by an atomic symlink swap
+
+Each deployment target (e.g. "automation") has its own directory:
+
+  releases/<target>/<release_id>/      hardlinks into the artifact store
+                    <release_id>/.release.json
+  releases/<target>/current -> <release_id>
+
+A release holds the complete set of files managed for the target: the
+files of the release it replaces plus the newly deployed ones. Building
+it only links blobs (no byte copies), and a release directory is never
+modified after it is renamed into place. Activation repoints `current`
+with one rename(2), so readers see either the old tree or the new one,
+never a mix.
+
+Live paths are symlinks through `current`, e.g.
+
+  workspace/automation/auto_restart_concierge.sh
+      -> releases/automation/current/auto_restart_concierge.sh
+
+so swapping `current` switches every managed file at once. Each target
+remembers the live links made for it (releases/<target>/.links.json).
+After every activation a link whose file is in the new release is
+(re)created and one whose file is not (the release added it and was then
+reverted) is removed, so no live link dangles into `current`.
+
+Every release records the release it replaced ("previous"), and every
+activation is appended to releases/journal.jsonl. Rolling back is then
+just another activation: repoint `current` at an older release directory
+that is still on disk.
+
+Between begin() and commit(), publish() and expose() only collect changes.
+commit() then builds one release per target for the whole transaction and
+writes one record to releases/transactions/<txn_id>.json, so several
+deployments go live (and roll back) together.
+"""
+
+import os
+import json
+import time
+import shutil
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .artifact_store import ArtifactStore
+
+RELEASES_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/releases"
+RELEASE_MANIFEST = ".release.json"
+CURRENT = "current"
+JOURNAL = "journal.jsonl"
+TRANSACTIONS = "transactions"
+LINKS = ".links.json"
+
+
+def _swap_symlink(link_target: str, link_path: str):
+    """Point link_path at link_target atomically (create or replace)"""
+    tmp_path = f"{link_path}.tmp{os.getpid()}"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    os.symlink(link_target, tmp_path)
+    os.replace(tmp_path, link_path)
+
+
+class ReleaseStore:
+    """
+    Usage:
+        releases = ReleaseStore(store)
+        release = releases.publish("automation", staging_id, {"auto_restart_concierge.sh": entry},
+                                   live_dir=AUTOMATION_DIR)
+        releases.current("automation")["release_id"]
+
+        mark = releases.mark()       # before deploying
+        releases.revert_to(mark)     # undo every activation since
+        releases.apply(releases.plan_steps(1))
+
+        releases.begin(txn_id)       # publish() calls are collected...
+        releases.commit(members)     # ...and go live together
+    """
+
+    def __init__(self, store: ArtifactStore, releases_dir: str = RELEASES_DIR):
+        self.store = store
+        self.releases_dir = releases_dir
+        self.journal_path = os.path.join(releases_dir, JOURNAL)
+        self.transactions_dir = os.path.join(releases_dir, TRANSACTIONS)
+        self._txn: Optional[Dict] = None
+        os.makedirs(self.transactions_dir, exist_ok=True)
+
+    def target_dir(self, target: str) -> str:
+        return os.path.join(self.releases_dir, target)
+
+    def current_path(self, target: str) -> str:
+        return os.path.join(self.target_dir(target), CURRENT)
+
+    def load(self, target: str, release_id: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(self.target_dir(target), release_id, RELEASE_MANIFEST), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def current(self, target: str) -> Optional[Dict]:
+        """Record of the active release, None if the target was never released"""
+        release_id = self._active_id(target)
+        return self.load(target, release_id) if release_id else None
+
+    def live_paths(self) -> List[str]:
+        """Paths (through `current`) of every file in the release active on any target"""
+        paths = []
+        for target in sorted(os.listdir(self.releases_dir)):
+            record = self.current(target) if os.path.isdir(self.target_dir(target)) else None
+            if record:
+                paths.extend(os.path.join(self.current_path(target), rel) for rel in sorted(record["files"]))
+        return paths
+
+    def create(self, target: str, staging_id: str, files: Dict[str, Dict],
+               members: Optional[List[str]] = None) -> Dict:
+        """
+        Build (but do not activate) a release: the current files overlaid
+        with `files` ({rel_path: tree entry})
+        """
+        active = self.current(target)
+        merged = dict(active["files"]) if active else {}
+        merged.update(files)
+
+        release_id = f"{int(time.time() * 1000)}_{staging_id}"
+        record = {
+            "release_id": release_id,
+            "target": target,
+            "staging_id": staging_id,
+            "members": members or [staging_id],
+            "previous": active["release_id"] if active else None,
+            "created_at": datetime.now().isoformat(),
+            "files": merged,
+        }
+
+        # Build under a hidden name, then rename: a crash leaves no half release
+        tmp_dir = os.path.join(self.target_dir(target), f".{release_id}.tmp{os.getpid()}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.store.materialize(merged, tmp_dir)
+        with open(os.path.join(tmp_dir, RELEASE_MANIFEST), 'w') as f:
+            json.dump(record, f, indent=2, sort_keys=True)
+        os.rename(tmp_dir, os.path.join(self.target_dir(target), release_id))
+        return record
+
+    def _active_id(self, target: str) -> Optional[str]:
+        try:
+            return os.readlink(self.current_path(target))
+        except OSError:
+            return None
+
+    def activate(self, target: str, release_id: Optional[str], action: str = "deploy"):
+        """Make release_id the live release (one atomic rename); None retires the target"""
+        previous = self._active_id(target)
+        if release_id is None:
+            if previous is not None:
+                os.remove(self.current_path(target))
+        else:
+            _swap_symlink(release_id, self.current_path(target))
+
+        record = self.load(target, release_id) if release_id else None
+        self._sync_links(target, record)
+        with open(self.journal_path, 'a') as f:
+            f.write(json.dumps({
+                "at": datetime.now().isoformat(),
+                "action": action,
+                "target": target,
+                "release_id": release_id,
+                "previous": previous,
+                "staging_id": record["staging_id"] if record else None,
+                "members": record.get("members", [record["staging_id"]]) if record else [],
+            }) + "\n")
+
+    def journal(self, offset: int = 0) -> List[Dict]:
+        """Activation records, oldest first, from a byte offset"""
+        try:
+            with open(self.journal_path, 'r') as f:
+                f.seek(offset)
+                return [json.loads(line) for line in f if line.strip()]
+        except OSError:
+            return []
+
+    def mark(self) -> int:
+        """Journal position to revert to if a deployment fails"""
+        try:
+            return os.path.getsize(self.journal_path)
+        except OSError:
+            return 0
+
+    def revert_to(self, mark: int) -> Dict[str, Optional[str]]:
+        """Undo every activation since mark; returns {target: restored release_id}"""
+        plan: Dict[str, Optional[str]] = {}
+        for entry in self.journal(mark):
+            # Adopted baselines predate the deployment and stay
+            if entry["action"] != "adopt":
+                plan.setdefault(entry["target"], entry["previous"])
+        return self.apply(plan, action="revert")
+
+    def plan_steps(self, steps: int) -> Dict[str, Optional[str]]:
+        """
+        Targets and releases that undo the last `steps` deployments still
+        live. Repeating a one-step rollback keeps walking back.
+        """
+        plan: Dict[str, Optional[str]] = {}
+        undone = 0
+        for entry in reversed(self.journal()):
+            if undone >= steps:
+                break
+            if entry["action"] != "deploy":
+                continue
+            target = entry["target"]
+            live = plan[target] if target in plan else self._active_id(target)
+            if live == entry["release_id"]:
+                plan[target] = entry["previous"]
+                undone += 1
+        return plan
+
+    def plan_staging(self, staging_id: str) -> Dict[str, Optional[str]]:
+        """Targets and releases that restore the deployment of staging_id"""
+        plan: Dict[str, Optional[str]] = {}
+        for entry in self.journal():
+            if staging_id in entry.get("members", [entry["staging_id"]]) and entry["release_id"]:
+                plan[entry["target"]] = entry["release_id"]
+        return plan
+
+    def apply(self, plan: Dict[str, Optional[str]], action: str = "rollback") -> Dict[str, Optional[str]]:
+        """Activate each planned release; targets already there are left alone"""
+        applied = {}
+        for target, release_id in plan.items():
+            if self._active_id(target) != release_id:
+                self.activate(target, release_id, action=action)
+                applied[target] = release_id
+        return applied
+
+    def _link_target(self, target: str, rel_path: str) -> str:
+        return os.path.join(self.current_path(target), rel_path) if rel_path else self.current_path(target)
+
+    def _links(self, target: str) -> Dict[str, str]:
+        """{live_path: rel_path} of every live link made for target"""
+        try:
+            with open(os.path.join(self.target_dir(target), LINKS), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_links(self, target: str, links: Dict[str, str]):
+        path = os.path.join(self.target_dir(target), LINKS)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        os.makedirs(self.target_dir(target), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(links, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _link(self, target: str, live_path: str, rel_path: str):
+        link_target = self._link_target(target, rel_path)
+        try:
+            if os.readlink(live_path) == link_target:
+                return
+        except OSError:
+            pass
+        if os.path.isdir(live_path) and not os.path.islink(live_path):
+            shutil.rmtree(live_path)
+        os.makedirs(os.path.dirname(live_path), exist_ok=True)
+        _swap_symlink(link_target, live_path)
+
+    def _sync_links(self, target: str, record: Optional[Dict]):
+        """Repoint the target's live links at the release now active, drop the rest"""
+        files = record["files"] if record else {}
+        for live_path, rel_path in self._links(target).items():
+            if record is not None and (not rel_path or rel_path in files):
+                self._link(target, live_path, rel_path)
+                continue
+            try:
+                if os.readlink(live_path) == self._link_target(target, rel_path):
+                    os.remove(live_path)
+            except OSError:
+                pass  # gone, or no longer ours
+
+    def expose(self, target: str, live_path: str, rel_path: str = ""):
+        """Make live_path a symlink through `current` (to rel_path, or the whole release)"""
+        if self._txn is not None:
+            self._txn["exposures"].append((target, live_path, rel_path))
+            return
+        self._link(target, live_path, rel_path)
+        links = self._links(target)
+        if links.get(live_path) != rel_path:
+            links[live_path] = rel_path
+            self._save_links(target, links)
+
+    def adopt(self, target: str, live_dir: str, rel_paths: List[str]) -> Optional[Dict]:
+        """
+        Release the plain files already at the live paths (deployed before the
+        release store existed), so the first real release has a predecessor
+        """
+        files = {}
+        for rel_path in rel_paths:
+            live_path = os.path.join(live_dir, rel_path)
+            if os.path.isfile(live_path) and not os.path.islink(live_path):
+                files[rel_path] = self.store.put_file(live_path)
+        if not files:
+            return None
+        record = self.create(target, "adopted", files)
+        self.activate(target, record["release_id"], action="adopt")
+        return record
+
+    def publish(self, target: str, staging_id: str, files: Dict[str, Dict],
+                live_dir: Optional[str] = None) -> Dict:
+        """Create and activate a release; with live_dir, link each file there through `current`"""
+        if self._txn is not None:
+            self._txn["files"].setdefault(target, {}).update(files)
+            if live_dir:
+                self._txn["live_dirs"][target] = live_dir
+            return {"release_id": f"pending:{self._txn['id']}", "target": target, "staging_id": staging_id}
+        return self._release(target, staging_id, files, live_dir)
+
+    def _release(self, target: str, staging_id: str, files: Dict[str, Dict],
+                 live_dir: Optional[str], members: Optional[List[str]] = None) -> Dict:
+        if live_dir and self.current(target) is None:
+            self.adopt(target, live_dir, list(files))
+        record = self.create(target, staging_id, files, members)
+        self.activate(target, record["release_id"])
+        if live_dir:
+            for rel_path in files:
+                self.expose(target, os.path.join(live_dir, rel_path), rel_path)
+        return record
+
+    def begin(self, txn_id: str):
+        """Start collecting publish()/expose() calls; nothing goes live until commit()"""
+        self._txn = {"id": txn_id, "files": {}, "live_dirs": {}, "exposures": []}
+
+    def abort(self):
+        """Drop an uncommitted transaction (nothing was activated)"""
+        self._txn = None
+
+    def commit(self, members: List[str]) -> Dict:
+        """One release per touched target, then one transaction record"""
+        txn, self._txn = self._txn, None
+        releases = {}
+        for target, files in txn["files"].items():
+            record = self._release(target, txn["id"], files, txn["live_dirs"].get(target), members)
+            releases[target] = record["release_id"]
+        for target, live_path, rel_path in txn["exposures"]:
+            self.expose(target, live_path, rel_path)
+
+        record = {
+            "txn_id": txn["id"],
+            "members": members,
+            "releases": releases,
+            "committed_at": datetime.now().isoformat(),
+        }
+        path = os.path.join(self.transactions_dir, f"{txn['id']}.json")
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, path)
+        return record
@@ -0,0 +1,80 @@
+"""
+RETRY SCHEDULER
+Exponential backoff with jitter for proposals that fail Crucible
+
+State lives in the proposals queue's StatusLog, so it survives restarts
+and is visible to every pillar without extra files:
+  retry_scheduled  retry_count=N, next_eligible_at=<epoch seconds>
+  escalated        retry_count=N (limit reached, human required)
+
+Crucible schedules; Forge only re-polls items whose next_eligible_at has
+passed, so a failing item costs nothing between attempts.
+"""
+
+import time
+import random
+from typing import Dict, Optional
+
+from .status_log import StatusLog
+
+MAX_RETRIES = 5
+BASE_DELAY_SECONDS = 60
+MAX_DELAY_SECONDS = 6 * 3600
+JITTER = 0.2
+
+RETRY_STATUS = "retry_scheduled"
+ESCALATED_STATUS = "escalated"
+
+
+class RetryScheduler:
+    """
+    Usage:
+        retries = RetryScheduler(StatusLog(proposals_dir))
+        retries.schedule(source_file, reason="score 0.55")   # Crucible, on FAIL
+        retries.is_due(source_file)                          # Forge, when polling
+    """
+
+    def __init__(self, status_log: StatusLog, max_retries: int = MAX_RETRIES,
+                 base_delay: float = BASE_DELAY_SECONDS, max_delay: float = MAX_DELAY_SECONDS,
+                 jitter: float = JITTER):
+        self.status_log = status_log
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def retry_count(self, item_id: str) -> int:
+        return int(self.status_log.statuses.get(item_id, {}).get("retry_count", 0))
+
+    def delay_for(self, attempt: int) -> float:
+        """Backoff before attempt N (1-based): base * 2^(N-1), capped, +/- jitter"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def schedule(self, item_id: str, reason: str = "", **fields) -> Optional[Dict]:
+        """
+        Record a failed attempt
+        Returns the scheduled retry, or None if the item was escalated instead
+        """
+        self.status_log.refresh()
+        attempt = self.retry_count(item_id) + 1
+
+        if attempt > self.max_retries:
+            self.status_log.append(
+                item_id, ESCALATED_STATUS,
+                retry_count=attempt - 1, reason=reason, **fields
+            )
+            return None
+
+        next_eligible_at = time.time() + self.delay_for(attempt)
+        self.status_log.append(
+            item_id, RETRY_STATUS,
+            retry_count=attempt, next_eligible_at=next_eligible_at, reason=reason, **fields
+        )
+        return {"retry_count": attempt, "next_eligible_at": next_eligible_at}
+
+    def is_due(self, item_id: str, now: Optional[float] = None) -> bool:
+        item = self.status_log.statuses.get(item_id, {})
+        if item.get("status") != RETRY_STATUS:
+            return False
+        return (now or time.time()) >= item.get("next_eligible_at", 0)
@@ -0,0 +1,265 @@
+"""
+DECLARATIVE VALIDATION RULES
+Single-pass multi-pattern scoring for Crucible validators
+
+A validator is a RuleSet: a list of Rules, each naming a file glob
+(relative to the unit's staging dir), a check and a weight.
+
+  exists      some file matches the glob
+  executable  some matching file has an exec bit set
+  contains    some matching file contains any_of / all_of substrings
+
+All substrings from all "contains" rules are compiled into one
+Aho-Corasick automaton. Every matching file is read once, in chunks, and
+the scan stops as soon as every pattern that file could satisfy has been
+seen. Adding rules adds states to the automaton, not passes over the data,
+and the automaton keeps its state across chunk boundaries so patterns that
+straddle two chunks are still found.
+
+Case-insensitive rules match against lowercased text; case-sensitive ones
+are confirmed against the original text at the match position.
+
+A unit passes when every required rule holds and its score reaches the
+pass threshold. Crucible passes the Constitution's minimum score to
+evaluate(); PASS_THRESHOLD is the fallback.
+
+Scores are rounded to 6 places before the threshold check. This is a
+behaviour change from the hand-written validators: a full error_rate unit
+(0.5 + 0.2 + 0.1) used to sum to 0.7999... and fail; it now scores 0.80,
+passes, and is deployed by the Warden's generic deployer.
+"""
+
+import os
+import codecs
+import fnmatch
+import hashlib
+import json
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+# Bump when scoring semantics change; part of the Crucible validation cache key
+RULES_ENGINE_VERSION = "1"
+
+CHUNK_SIZE = 64 * 1024
+PASS_THRESHOLD = 0.8
+
+
+class Rule:
+    """
+    One weighted check
+
+    Usage:
+        Rule("Uses grep for filtering", "analyze_errors.sh", any_of=["grep"], weight=0.2)
+        Rule("Cleanup script exists", "cleanup_disk.sh", check="exists", weight=0.4, required=True)
+    """
+
+    CHECKS = ("exists", "executable", "contains")
+
+    def __init__(self, description: str, file: str = "*", check: str = "contains",
+                 any_of: Optional[List[str]] = None, all_of: Optional[List[str]] = None,
+                 weight: float = 0.0, required: bool = False, ignore_case: bool = False,
+                 missing: Optional[str] = None):
+        if check not in self.CHECKS:
+            raise ValueError(f"Unknown rule check: {check}")
+        if check == "contains" and not (any_of or all_of):
+            raise ValueError(f"Rule '{description}' has no patterns")
+
+        self.description = description
+        self.file = file
+        self.check = check
+        self.any_of = list(any_of or [])
+        self.all_of = list(all_of or [])
+        self.weight = weight
+        self.required = required
+        self.ignore_case = ignore_case
+        self.missing = missing
+
+    def patterns(self) -> List[str]:
+        return self.any_of + self.all_of
+
+    def matched(self, found: Set[Tuple[str, bool]]) -> bool:
+        """Whether a file's found (pattern, ignore_case) set satisfies this rule"""
+        has = lambda p: (p, self.ignore_case) in found
+        if self.all_of and not all(has(p) for p in self.all_of):
+            return False
+        if self.any_of and not any(has(p) for p in self.any_of):
+            return False
+        return True
+
+    def as_dict(self) -> Dict:
+        return dict(vars(self))
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton over lowercased patterns
+
+    Each pattern is (text, ignore_case). Both variants share the lowercased
+    trie; case-sensitive hits are verified against the raw text.
+    """
+
+    def __init__(self, patterns: Set[Tuple[str, bool]]):
+        self.patterns = patterns
+        self.max_len = max((len(p) for p, _ in patterns), default=0)
+
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[Tuple[str, bool]]] = [[]]
+
+        for pattern in patterns:
+            state = 0
+            for ch in pattern[0].lower():
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.out[state].append(pattern)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def scan_file(self, path: str, wanted: Set[Tuple[str, bool]]) -> Set[Tuple[str, bool]]:
+        """Patterns from `wanted` present in the file, reading it in chunks"""
+        found: Set[Tuple[str, bool]] = set()
+        if not wanted:
+            return found
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        tail = ""
+
+        with open(path, 'rb') as f:
+            while True:
+                data = f.read(CHUNK_SIZE)
+                text = decoder.decode(data, final=not data)
+                window = tail + text
+                offset = len(tail)
+
+                for i, ch in enumerate(text.lower()):
+                    while state and ch not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(ch, 0)
+                    for pattern in out[state]:
+                        if pattern in found or pattern not in wanted:
+                            continue
+                        text_pattern, ignore_case = pattern
+                        end = offset + i + 1
+                        if ignore_case or window[end - len(text_pattern):end] == text_pattern:
+                            found.add(pattern)
+
+                if found >= wanted or not data:
+                    break
+                tail = window[-self.max_len:] if self.max_len else ""
+
+        return found
+
+
+class RuleSet:
+    """
+    Usage:
+        RULES = RuleSet([Rule(...), ...])
+        passed, score, report = RULES.evaluate(staging_path)
+    """
+
+    def __init__(self, rules: List[Rule], base: float = 0.0, threshold: float = PASS_THRESHOLD,
+                 title: Optional[str] = None):
+        self.rules = rules
+        self.base = base
+        self.threshold = threshold
+        self.title = title
+        self.matcher = PatternMatcher({
+            (p, rule.ignore_case) for rule in rules if rule.check == "contains" for p in rule.patterns()
+        })
+
+    def fingerprint(self) -> str:
+        """Hash of the rule definitions; changes whenever a rule does"""
+        payload = {
+            "engine": RULES_ENGINE_VERSION,
+            "base": self.base,
+            "threshold": self.threshold,
+            "rules": [rule.as_dict() for rule in self.rules]
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _list_files(staging_path: str) -> Dict[str, os.DirEntry]:
+        files = {}
+        stack = [staging_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files[os.path.relpath(entry.path, staging_path)] = entry
+        return files
+
+    def evaluate(self, staging_path: str, threshold: Optional[float] = None) -> Tuple[bool, float, str]:
+        """Score a staging dir: (passed, score_0_to_1, report); threshold overrides the set's"""
+        threshold = self.threshold if threshold is None else threshold
+        files = self._list_files(staging_path) if os.path.isdir(staging_path) else {}
+        matches = {rule: [rel for rel in files if fnmatch.fnmatch(rel, rule.file)] for rule in self.rules}
+
+        # Which patterns each file needs checked, so each file is scanned once
+        wanted: Dict[str, Set[Tuple[str, bool]]] = {}
+        for rule, rels in matches.items():
+            if rule.check == "contains":
+                for rel in rels:
+                    wanted.setdefault(rel, set()).update((p, rule.ignore_case) for p in rule.patterns())
+
+        found: Dict[str, Set[Tuple[str, bool]]] = {}
+        unreadable = []
+        for rel, patterns in wanted.items():
+            try:
+                found[rel] = self.matcher.scan_file(files[rel].path, patterns)
+            except OSError:
+                found[rel] = set()
+                unreadable.append(rel)
+
+        score = self.base
+        passed_required = True
+        report_lines = [self.title] if self.title else []
+
+        for rule in self.rules:
+            rels = matches[rule]
+            if rule.check == "exists":
+                ok = bool(rels)
+            elif rule.check == "executable":
+                ok = any(files[rel].stat().st_mode & 0o111 for rel in rels)
+            else:
+                ok = any(rule.matched(found.get(rel, set())) for rel in rels)
+
+            if ok:
+                score += rule.weight
+                report_lines.append(f"✅ {rule.description}")
+            elif rule.required:
+                passed_required = False
+                report_lines.append(f"❌ {rule.missing or 'Missing: ' + rule.description}")
+            else:
+                report_lines.append(f"⚠️  {rule.missing or 'Missing: ' + rule.description}")
+
+        for rel in unreadable:
+            report_lines.append(f"⚠️  Could not read {rel}")
+
+        # Round away float noise so 0.5 + 0.2 + 0.1 scores as 0.80, not 0.7999...
+        score = round(min(1.0, score), 6)
+        passed = passed_required and score >= threshold
+
+        report = "\n".join(report_lines)
+        report += f"\n\nFinal Score: {score:.2f}/1.0"
+        report += f"\nStatus: {'PASS' if passed else 'FAIL'}"
+
+        return passed, score, report
@@ -0,0 +1,153 @@
+"""
+SIGNED SAFETY MANIFEST
+Safety facts computed once at Forge time, verified by the Warden
+
+Forge writes <staging>/.safety.json after the staging tree is complete:
+
+  {"version": 1, "staging_id", "policy_version", "constitution_version",
+   "created_at", "files": {rel_path: {"sha256", "size", "scan": verdict|null}},
+   "signature": hmac-sha256 over the rest}
+
+"scan" is the ContentScanner verdict for files the Constitution scans
+(null for the others). The signature uses a host-local key in store/keys/,
+shared by Forge and Warden and readable only by their user.
+
+The Warden checks the signature, re-hashes the staged files and compares
+them to the manifest. If the file set and every hash match, and the
+policy version is unchanged, the recorded verdicts are used as they are.
+If the policy changed, or the manifest predates this feature, the files
+are scanned again. A bad signature or a hash mismatch means the tree
+changed after Forge, and the manifest is rejected.
+"""
+
+import os
+import hmac
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from .artifact_store import STORE_DIR, hash_file
+from .artifact_index import ArtifactIndex, _walk
+
+SAFETY_MANIFEST = ".safety.json"
+MANIFEST_VERSION = 1
+KEY_PATH = os.path.join(STORE_DIR, "keys", "safety_manifest.key")
+
+
+class SafetyManifestError(Exception):
+    """Manifest present but not trustworthy (bad signature, tree changed)"""
+
+
+def scan_staged(staging_path: str, constitution, index: Optional[ArtifactIndex] = None) -> Dict[str, Dict]:
+    """Scanner verdicts for the files the Constitution scans: {rel_path: verdict}"""
+    index = index or ArtifactIndex.for_tree(staging_path)
+    verdicts = {}
+    for rel_path, entry in index.select(suffixes=constitution.scan_suffixes):
+        try:
+            verdicts[rel_path] = constitution.scanner.scan_file(
+                os.path.join(staging_path, rel_path), entry['sha256']
+            )
+        except OSError as e:
+            verdicts[rel_path] = {"error": str(e), "findings": []}
+    return verdicts
+
+
+class SafetyManifests:
+    """
+    Usage:
+        manifests = SafetyManifests()
+        manifests.write(staging_path, staging_id, constitution)          # Forge
+        verdicts, status = manifests.verify(staging_path, constitution)  # Warden
+    """
+
+    def __init__(self, key_path: str = KEY_PATH):
+        self.key_path = key_path
+        self._key: Optional[bytes] = None
+
+    @property
+    def key(self) -> bytes:
+        """Signing key, created (mode 0600) by whichever pillar needs it first"""
+        if self._key is None:
+            os.makedirs(os.path.dirname(self.key_path), exist_ok=True)
+            try:
+                fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(os.urandom(32))
+            except FileExistsError:
+                pass
+            with open(self.key_path, 'rb') as f:
+                self._key = f.read()
+        return self._key
+
+    def _sign(self, body: Dict) -> str:
+        payload = json.dumps(body, sort_keys=True, separators=(",", ":")).encode()
+        return hmac.new(self.key, payload, hashlib.sha256).hexdigest()
+
+    def write(self, staging_path: str, staging_id: str, constitution) -> Dict:
+        """Index, scan and sign a finished staging tree"""
+        index = ArtifactIndex.for_tree(staging_path)
+        verdicts = scan_staged(staging_path, constitution, index)
+
+        body = {
+            "version": MANIFEST_VERSION,
+            "staging_id": staging_id,
+            "policy_version": constitution.policy_version,
+            "constitution_version": constitution.version,
+            "created_at": datetime.now().isoformat(),
+            "files": {
+                rel_path: {
+                    "sha256": entry['sha256'],
+                    "size": entry['size'],
+                    "scan": {k: v for k, v in verdicts[rel_path].items() if k != "cached"}
+                            if rel_path in verdicts else None,
+                }
+                for rel_path, entry in index.files.items()
+            },
+        }
+        manifest = dict(body, signature=self._sign(body))
+
+        path = os.path.join(staging_path, SAFETY_MANIFEST)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+        return manifest
+
+    def verify(self, staging_path: str, constitution) -> Tuple[Optional[Dict[str, Dict]], str]:
+        """
+        Check the staged tree against its manifest
+        Returns (verdicts, status): verdicts is {rel_path: verdict} when the
+        recorded scan is still valid, None when the files must be rescanned
+        ("missing" or "policy changed"). Raises SafetyManifestError if the
+        manifest is forged or the tree changed after Forge.
+        """
+        try:
+            with open(os.path.join(staging_path, SAFETY_MANIFEST), 'r') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None, "missing"
+        except (OSError, ValueError) as e:
+            raise SafetyManifestError(f"unreadable: {e}")
+
+        body = {k: v for k, v in manifest.items() if k != "signature"}
+        if body.get("version") != MANIFEST_VERSION:
+            return None, "missing"
+        if not hmac.compare_digest(self._sign(body), str(manifest.get("signature", ""))):
+            raise SafetyManifestError("signature does not match")
+
+        recorded = body["files"]
+        present = set(_walk(staging_path))
+        if present != set(recorded):
+            added = sorted(present - set(recorded))
+            removed = sorted(set(recorded) - present)
+            raise SafetyManifestError(f"file set changed (added {added}, removed {removed})")
+
+        for rel_path, entry in recorded.items():
+            path = os.path.join(staging_path, rel_path)
+            if os.path.getsize(path) != entry['size'] or hash_file(path) != entry['sha256']:
+                raise SafetyManifestError(f"{rel_path} changed since Forge")
+
+        if body["policy_version"] != constitution.policy_version:
+            return None, "policy changed"
+        return {rel: entry["scan"] for rel, entry in recorded.items() if entry["scan"] is not None}, "verified"
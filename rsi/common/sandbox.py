@@ -0,0 +1,307 @@
+"""
+CRUCIBLE LOCAL SANDBOX
+Executes staged .sh / .py artifacts in throwaway directories
+
+Each run gets its own temp dir holding a copy of the staging tree, a fake
+HOME/TMPDIR and a bin/ of stub executables placed first on PATH. Stubs
+record their arguments and exit with a fixed code instead of killing
+processes, deleting files, installing packages or touching the network.
+The child process starts in its own session under rlimits (CPU, address
+space, file size, process count, no core dumps), with a scrubbed
+environment and a wall clock timeout after which the whole process group
+is killed.
+
+Absolute host paths in the copied scripts are rewritten into the
+sandbox's root/ mirror before they run, so `> /tmp/fred_bot.log` writes
+<sandbox>/root/tmp/fred_bot.log and never the live log. System paths
+(/bin, /usr, /dev, ...) are left alone, except that an absolute path to
+a stubbed binary (/bin/rm, /usr/bin/pkill) is pointed at its stub.
+
+Stubs report what a sandbox would really see: pgrep finds nothing (exit
+1), everything else succeeds. An artifact whose outcome depends on a
+stub declares the scenario it expects, per artifact, through its
+handler's SANDBOX_STUBS, e.g. {"restart_concierge.sh": {"pgrep": 0}}.
+
+This is a best-effort guard for validation, not a security boundary:
+paths built at run time are not rewritten. Docker remains the
+recommendation for untrusted code, and Crucible only runs the sandbox
+when started with --sandbox.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import signal
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Bump when run semantics change; part of the Crucible validation cache key
+SANDBOX_VERSION = "2"
+
+EXECUTABLE_SUFFIXES = ('.sh', '.py')
+
+# Binaries replaced by recording stubs
+STUBBED_BINARIES = [
+    "rm", "rmdir", "mv", "dd", "find", "chmod", "chown", "sudo", "su",
+    "kill", "pkill", "killall", "pgrep", "nohup", "sleep",
+    "shutdown", "reboot", "halt", "launchctl", "systemctl", "crontab",
+    "curl", "wget", "ssh", "scp", "rsync", "nc", "git",
+    "pip", "pip3", "brew", "npm", "osascript", "open",
+]
+
+# Stub exit codes other than 0: nothing a script starts really runs here
+STUB_EXIT_CODES = {"pgrep": 1}
+
+# Host paths scripts may use as-is; anything else absolute goes to root/
+SYSTEM_ROOTS = ("bin", "sbin", "usr", "lib", "lib64", "etc", "dev", "proc", "System")
+
+# Absolute paths in script text (not the tail of $VAR/x, ~/x, a/b or URLs)
+ABSOLUTE_PATH_RE = re.compile(r"(?<![\w.~$}/:-])/[\w.@+-]+(?:/[\w.@+-]*)*")
+
+DEFAULT_LIMITS = {
+    "cpu_seconds": 10,
+    "memory_bytes": 512 * 1024 * 1024,
+    "file_size_bytes": 16 * 1024 * 1024,
+    "max_processes": 1024,  # per-user on most systems, so leave headroom
+}
+
+OUTPUT_LIMIT = 4096
+
+# Runs inside the child: apply rlimits then exec the real command. Using a
+# launcher instead of preexec_fn keeps Popen safe to call from threads.
+LIMITS_LAUNCHER = r"""
+import os, sys, json, resource
+limits = json.loads(sys.argv[1])
+for name, value in (
+    ("RLIMIT_CPU", limits["cpu_seconds"]),
+    ("RLIMIT_AS", limits["memory_bytes"]),
+    ("RLIMIT_FSIZE", limits["file_size_bytes"]),
+    ("RLIMIT_NPROC", limits["max_processes"]),
+    ("RLIMIT_CORE", 0),
+):
+    try:
+        resource.setrlimit(getattr(resource, name), (value, value))
+    except (AttributeError, ValueError, OSError):
+        pass  # not supported on this platform
+os.execvp(sys.argv[2], sys.argv[2:])
+"""
+
+STUB_TEMPLATE = """#!/bin/sh
+echo "$(basename "$0") $*" >> "$SANDBOX_STUB_LOG"
+exit {exit_code}
+"""
+
+
+class SandboxExecutor:
+    """
+    Usage:
+        sandbox = SandboxExecutor()
+        result = sandbox.run(staging_path, "restart_concierge.sh", stubs={"pgrep": 0})
+        results = sandbox.run_many([(staging_path, rel, stubs) for rel in ...])
+    """
+
+    def __init__(self, timeout: float = 30, max_workers: Optional[int] = None,
+                 limits: Optional[Dict] = None, stubbed: Optional[List[str]] = None):
+        self.timeout = timeout
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.stubbed = stubbed if stubbed is not None else STUBBED_BINARIES
+
+    def _confine(self, work_dir: str, root_dir: str, bin_dir: str):
+        """Rewrite absolute host paths in the copied scripts into root_dir"""
+        def replace(match):
+            path = match.group(0)
+            if path.split("/")[1] in SYSTEM_ROOTS:
+                directory, name = os.path.split(path)
+                if os.path.basename(directory) in ("bin", "sbin") and name in self.stubbed:
+                    return os.path.join(bin_dir, name)
+                return path
+            mirrored = root_dir + path.rstrip("/")
+            # Mirror host directories so `cd` and `>` into them still work
+            os.makedirs(mirrored if os.path.isdir(path) else os.path.dirname(mirrored), exist_ok=True)
+            return mirrored
+
+        for root, dirs, files in os.walk(work_dir):
+            for filename in files:
+                if not filename.endswith(EXECUTABLE_SUFFIXES):
+                    continue
+                path = os.path.join(root, filename)
+                with open(path, 'r', errors='surrogateescape') as f:
+                    lines = f.read().split("\n")
+                # Keep the interpreter line; everything after it is confined
+                start = 1 if lines and lines[0].startswith("#!") else 0
+                lines[start:] = [ABSOLUTE_PATH_RE.sub(replace, line) for line in lines[start:]]
+                with open(path, 'w', errors='surrogateescape') as f:
+                    f.write("\n".join(lines))
+
+    def _prepare(self, sandbox_dir: str, staging_path: str,
+                 stubs: Optional[Dict[str, int]] = None) -> Tuple[str, Dict[str, str]]:
+        work_dir = os.path.join(sandbox_dir, "work")
+        bin_dir = os.path.join(sandbox_dir, "bin")
+        home_dir = os.path.join(sandbox_dir, "home")
+        tmp_dir = os.path.join(sandbox_dir, "tmp")
+        root_dir = os.path.join(sandbox_dir, "root")
+
+        shutil.copytree(staging_path, work_dir, ignore=shutil.ignore_patterns('.*'))
+        for path in (bin_dir, home_dir, tmp_dir, root_dir):
+            os.makedirs(path, exist_ok=True)
+        self._confine(work_dir, root_dir, bin_dir)
+
+        exit_codes = dict(STUB_EXIT_CODES, **(stubs or {}))
+        for name in self.stubbed:
+            stub_path = os.path.join(bin_dir, name)
+            with open(stub_path, 'w') as f:
+                f.write(STUB_TEMPLATE.format(exit_code=exit_codes.get(name, 0)))
+            os.chmod(stub_path, 0o755)
+
+        env = {
+            "PATH": f"{bin_dir}:/usr/bin:/bin",
+            "HOME": home_dir,
+            "TMPDIR": tmp_dir,
+            "LANG": "C.UTF-8",
+            "RSI_SANDBOX": "1",
+            "SANDBOX_STUB_LOG": os.path.join(sandbox_dir, "stub_calls.log"),
+            "PYTHONDONTWRITEBYTECODE": "1",
+        }
+        return work_dir, env
+
+    @staticmethod
+    def _command(rel_path: str, args: Optional[List[str]] = None) -> List[str]:
+        if rel_path.endswith('.py'):
+            return [sys.executable, "-I", rel_path] + list(args or [])
+        return ["/bin/bash", rel_path] + list(args or [])
+
+    def _execute(self, work_dir: str, env: Dict[str, str], command: List[str]) -> Dict:
+        """One limited, timed child process: {exit_code, stdout, stderr, timed_out, elapsed}"""
+        started = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-c", LIMITS_LAUNCHER, json.dumps(self.limits)] + command,
+            cwd=work_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=self.timeout)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            stdout, stderr = proc.communicate()
+            timed_out = True
+
+        return {
+            "exit_code": proc.returncode,
+            "stdout": stdout.decode(errors="replace")[-OUTPUT_LIMIT:],
+            "stderr": stderr.decode(errors="replace")[-OUTPUT_LIMIT:],
+            "timed_out": timed_out,
+            "elapsed": time.perf_counter() - started
+        }
+
+    @staticmethod
+    def _outcome(execution: Dict) -> str:
+        if execution["timed_out"]:
+            return "timeout"
+        if execution["exit_code"] == 0:
+            return "ok"
+        if "ModuleNotFoundError" in execution["stderr"]:
+            # Third-party deps can't be installed offline; not the artifact's fault
+            return "missing_dependency"
+        return "failed"
+
+    def run(self, staging_path: str, rel_path: str, stubs: Optional[Dict[str, int]] = None) -> Dict:
+        """
+        Execute one artifact from a staging dir (stubs: {binary: exit code} overrides)
+        Returns: {artifact, outcome, exit_code, duration, stdout, stderr, stub_calls}
+        outcome: ok | failed | timeout | missing_dependency | error
+        """
+        started = time.monotonic()
+        result = {"artifact": rel_path, "outcome": "error", "exit_code": None,
+                  "duration": 0.0, "stdout": "", "stderr": "", "stub_calls": []}
+
+        with tempfile.TemporaryDirectory(prefix="crucible_sandbox_") as sandbox_dir:
+            try:
+                work_dir, env = self._prepare(sandbox_dir, staging_path, stubs)
+                execution = self._execute(work_dir, env, self._command(rel_path))
+
+                result["exit_code"] = execution["exit_code"]
+                result["stdout"] = execution["stdout"]
+                result["stderr"] = execution["stderr"]
+                result["outcome"] = self._outcome(execution)
+
+                stub_log = env["SANDBOX_STUB_LOG"]
+                if os.path.exists(stub_log):
+                    with open(stub_log, 'r') as f:
+                        result["stub_calls"] = f.read().splitlines()[:50]
+            except Exception as e:
+                result["stderr"] = str(e)
+
+        result["duration"] = round(time.monotonic() - started, 3)
+        return result
+
+    def benchmark(self, staging_path: str, rel_path: str, args: Optional[List[str]] = None,
+                  runs: int = 5, warmup: int = 1) -> Dict:
+        """
+        Time repeated runs of one entry point in a single prepared sandbox
+        Returns: {artifact, outcome, timings (seconds, measured runs only), stderr}
+        """
+        result = {"artifact": rel_path, "outcome": "error", "timings": [], "stderr": ""}
+
+        with tempfile.TemporaryDirectory(prefix="crucible_bench_") as sandbox_dir:
+            try:
+                work_dir, env = self._prepare(sandbox_dir, staging_path)
+                command = self._command(rel_path, args)
+                for i in range(warmup + runs):
+                    execution = self._execute(work_dir, env, command)
+                    outcome = self._outcome(execution)
+                    if outcome != "ok":
+                        result["outcome"] = outcome
+                        result["stderr"] = execution["stderr"]
+                        return result
+                    if i >= warmup:
+                        result["timings"].append(round(execution["elapsed"], 6))
+                result["outcome"] = "ok"
+            except Exception as e:
+                result["stderr"] = str(e)
+
+        return result
+
+    def run_many(self, jobs: List[Tuple]) -> List[Dict]:
+        """Execute (staging_path, rel_path[, stubs]) jobs concurrently, results in job order"""
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            return list(pool.map(lambda job: self.run(*job), jobs))
+
+
+def summarize(results: List[Dict]) -> Tuple[bool, List[str]]:
+    """
+    Turn sandbox results into (all_ok, report_lines)
+    missing_dependency counts as ok with a warning
+    """
+    ok = True
+    lines = []
+    for r in results:
+        label = f"{r['artifact']} (exit {r['exit_code']}, {r['duration']:.2f}s)"
+        if r.get("reused_from"):
+            label += f" [unchanged, from {r['reused_from']}]"
+        if r["outcome"] == "ok":
+            lines.append(f"✅ Sandbox run OK: {label}")
+        elif r["outcome"] == "missing_dependency":
+            last_line = r["stderr"].strip().splitlines()[-1] if r["stderr"].strip() else ""
+            lines.append(f"⚠️  Sandbox run skipped dependency: {label} - {last_line}")
+        elif r["outcome"] == "timeout":
+            ok = False
+            lines.append(f"❌ Sandbox run timed out: {r['artifact']}")
+        else:
+            ok = False
+            detail = r["stderr"].strip().splitlines()[-1] if r["stderr"].strip() else ""
+            lines.append(f"❌ Sandbox run failed: {label} {detail}".rstrip())
+        if r["stub_calls"]:
+            lines.append(f"   stubbed: {', '.join(c.split()[0] for c in r['stub_calls'][:8])}")
+    return ok, lines
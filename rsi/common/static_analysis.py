@@ -0,0 +1,196 @@
+"""
+STATIC ANALYSIS FOR STAGED CODE
+Syntax and lint-class checks that run before anything is executed
+
+  .py  ast.parse (syntax), names loaded but never bound (undefined names),
+       statements after return/raise/break/continue (unreachable code)
+  .sh  bash -n (syntax)
+
+Errors reject the artifact; warnings are reported only. Results depend
+only on file content, so they are cached under store/analysis/ keyed by
+content hash and ANALYSIS_VERSION. Cache misses are analyzed on a process
+pool.
+"""
+
+import os
+import ast
+import json
+import builtins
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .artifact_store import STORE_DIR, hash_file
+
+# Bump when checks change; part of the cache key
+ANALYSIS_VERSION = "1"
+ANALYSIS_DIR = os.path.join(STORE_DIR, "analysis")
+
+LANGUAGES = {".py": "python", ".sh": "shell"}
+BASH_TIMEOUT = 10
+
+# Bound implicitly in every module
+MODULE_NAMES = {"__name__", "__file__", "__doc__", "__builtins__", "__spec__",
+                "__loader__", "__package__", "__path__", "__annotations__"}
+
+TERMINATORS = (ast.Return, ast.Raise, ast.Break, ast.Continue)
+
+
+def _bound_names(tree: ast.AST) -> Tuple[set, bool]:
+    """
+    Every name bound anywhere in the module (module-wide, not per scope)
+    Returns (names, has_star_import)
+    """
+    names = set()
+    star = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    star = True
+                else:
+                    names.add((alias.asname or alias.name).split(".")[0])
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            names.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            names.update(node.names)
+        elif hasattr(ast, "MatchAs") and isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            names.add(node.name)
+    return names, star
+
+
+def _unreachable(tree: ast.AST) -> List[int]:
+    """Line numbers of the first statement after a terminator in each block"""
+    lines = []
+    for node in ast.walk(tree):
+        for field in ("body", "orelse", "finalbody"):
+            block = getattr(node, field, None)
+            if not isinstance(block, list):
+                continue
+            for i, stmt in enumerate(block[:-1]):
+                if isinstance(stmt, TERMINATORS):
+                    lines.append(block[i + 1].lineno)
+                    break
+    return sorted(lines)
+
+
+def analyze_python(source: str, filename: str) -> Dict:
+    errors, warnings = [], []
+    try:
+        tree = ast.parse(source, filename=filename)
+    except SyntaxError as e:
+        errors.append(f"line {e.lineno}: syntax error: {e.msg}")
+        return {"errors": errors, "warnings": warnings}
+
+    bound, star_import = _bound_names(tree)
+    if not star_import:
+        known = bound | MODULE_NAMES | set(dir(builtins))
+        undefined = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) and node.id not in known:
+                undefined[node.id] = min(node.lineno, undefined.get(node.id, node.lineno))
+        for name, lineno in sorted(undefined.items(), key=lambda item: item[1]):
+            errors.append(f"line {lineno}: undefined name '{name}'")
+
+    for lineno in _unreachable(tree):
+        warnings.append(f"line {lineno}: unreachable code")
+
+    return {"errors": errors, "warnings": warnings}
+
+
+def analyze_shell(path: str) -> Dict:
+    errors = []
+    try:
+        result = subprocess.run(["bash", "-n", path], capture_output=True, text=True,
+                                timeout=BASH_TIMEOUT)
+        if result.returncode != 0:
+            detail = result.stderr.strip().replace(path + ": ", "").splitlines()
+            errors.append(f"bash -n: {detail[0] if detail else 'syntax error'}")
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return {"errors": [], "warnings": [f"bash -n unavailable: {e}"]}
+    return {"errors": errors, "warnings": []}
+
+
+def analyze_file(path: str) -> Dict:
+    """Analyze one file (runs in pool workers): {"errors": [...], "warnings": [...]}"""
+    language = LANGUAGES.get(os.path.splitext(path)[1])
+    if language == "python":
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                source = f.read()
+        except OSError as e:
+            return {"errors": [f"unreadable: {e}"], "warnings": []}
+        return analyze_python(source, os.path.basename(path))
+    if language == "shell":
+        return analyze_shell(path)
+    return {"errors": [], "warnings": []}
+
+
+class StaticAnalyzer:
+    """
+    Usage:
+        analyzer = StaticAnalyzer()
+        results = analyzer.analyze_many([path, ...])   # {path: {"errors", "warnings", "cached"}}
+    """
+
+    def __init__(self, cache_dir: str = ANALYSIS_DIR, max_workers: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_path(self, sha256: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{sha256}{suffix}.v{ANALYSIS_VERSION}.json")
+
+    def analyze_many(self, paths: List[str], hashes: Optional[Dict[str, str]] = None) -> Dict[str, Dict]:
+        """Analyze files, reusing cached results; `hashes` (path -> sha256) skips re-hashing"""
+        results: Dict[str, Dict] = {}
+        pending: Dict[str, str] = {}
+        hashes = hashes or {}
+
+        for path in paths:
+            sha256 = hashes.get(path) or hash_file(path)
+            cache_path = self._cache_path(sha256, os.path.splitext(path)[1])
+            try:
+                with open(cache_path, 'r') as f:
+                    results[path] = dict(json.load(f), cached=True)
+                continue
+            except (OSError, ValueError):
+                pending[path] = cache_path
+
+        if len(pending) > 1 and self.max_workers > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                fresh = dict(zip(pending, pool.map(analyze_file, pending)))
+        else:
+            fresh = {path: analyze_file(path) for path in pending}
+
+        for path, result in fresh.items():
+            tmp_path = f"{pending[path]}.tmp{os.getpid()}"
+            with open(tmp_path, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, pending[path])
+            results[path] = dict(result, cached=False)
+
+        return results
+
+
+def summarize(results: Dict[str, Dict], base_path: str = "") -> Tuple[bool, List[str]]:
+    """Turn analysis results into (no_errors, report_lines)"""
+    ok = True
+    lines = []
+    for path in sorted(results):
+        result = results[path]
+        label = os.path.relpath(path, base_path) if base_path else path
+        if result["errors"]:
+            ok = False
+            lines.append(f"❌ Static analysis: {label}")
+            lines.extend(f"   {e}" for e in result["errors"][:10])
+        else:
+            lines.append(f"✅ Static analysis clean: {label}")
+        lines.extend(f"   ⚠️  {w}" for w in result["warnings"][:10])
+    return ok, lines
@@ -0,0 +1,206 @@
+"""
+APPEND-ONLY STATUS LOG
+Per-queue status events instead of rewriting item JSON files
+
+Each queue directory gets:
+  .status.log            JSONL events: {"id", "status", "ts", ...fields}
+  .status.snapshot.json  folded status map as of the last compaction
+  .status.lock           flock guard for appends and compaction
+
+A status change is one small append. fsync is batched (every N events or
+T seconds, and on close). Once the log passes a size threshold it is
+folded into the snapshot and replaced with an empty log. Readers fold
+snapshot + log into an in-memory map and afterwards read only the bytes
+appended since their last refresh.
+
+Queue item files are never modified, so their parsed content can be
+cached for as long as the file exists.
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+LOG_NAME = ".status.log"
+SNAPSHOT_NAME = ".status.snapshot.json"
+LOCK_NAME = ".status.lock"
+
+
+class StatusLog:
+    """
+    Usage:
+        log = StatusLog(proposals_dir)
+        log.append("proposal_ab12_error_rate.json", "implemented", staging_id="forge_...")
+        log.refresh()["proposal_ab12_error_rate.json"]["status"]  → "implemented"
+        log.close()
+    """
+
+    def __init__(self, queue_dir: str, fsync_every: int = 32, fsync_interval: float = 1.0,
+                 compact_bytes: int = 1024 * 1024):
+        self.queue_dir = queue_dir
+        self.log_path = os.path.join(queue_dir, LOG_NAME)
+        self.snapshot_path = os.path.join(queue_dir, SNAPSHOT_NAME)
+        self.lock_path = os.path.join(queue_dir, LOCK_NAME)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_bytes = compact_bytes
+
+        self.statuses: Dict[str, Dict] = {}
+        self._read_inode = None
+        self._read_offset = 0
+
+        self._fd: Optional[int] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        os.makedirs(queue_dir, exist_ok=True)
+
+    @contextmanager
+    def _locked(self, mode: int):
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock.fileno(), mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    # ---- writing -------------------------------------------------------
+
+    def _writer_fd(self) -> int:
+        """Open (or reopen after compaction swapped the file) the log for appends"""
+        if self._fd is not None:
+            try:
+                if os.fstat(self._fd).st_ino == os.stat(self.log_path).st_ino:
+                    return self._fd
+            except FileNotFoundError:
+                pass
+            self._sync()
+            os.close(self._fd)
+        self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _sync(self):
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, item_id: str, status: str, **fields):
+        """Record a status change for one queue item"""
+        event = {"id": item_id, "status": status, "ts": datetime.now().isoformat()}
+        event.update(fields)
+        line = (json.dumps(event, separators=(',', ':')) + "\n").encode()
+
+        with self._locked(fcntl.LOCK_EX):
+            fd = self._writer_fd()
+            os.write(fd, line)
+            self._unsynced += 1
+            if (self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+            needs_compaction = os.fstat(fd).st_size >= self.compact_bytes
+
+        # Visible to this process immediately; refresh() re-applies it in log order
+        self.statuses.setdefault(item_id, {}).update(
+            {k: v for k, v in event.items() if k != "id"}
+        )
+
+        if needs_compaction:
+            self.compact()
+
+    def close(self):
+        if self._fd is not None:
+            self._sync()
+            os.close(self._fd)
+            self._fd = None
+
+    # ---- reading -------------------------------------------------------
+
+    @staticmethod
+    def _fold(statuses: Dict[str, Dict], data: bytes) -> int:
+        """Apply complete lines from data; returns bytes consumed"""
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            item = statuses.setdefault(event.pop("id"), {})
+            item.update(event)
+        return end
+
+    def _load_snapshot(self) -> Dict[str, Dict]:
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                return json.load(f).get("statuses", {})
+        except (OSError, ValueError):
+            return {}
+
+    def refresh(self) -> Dict[str, Dict]:
+        """Fold new events into the in-memory map and return it"""
+        with self._locked(fcntl.LOCK_SH):
+            try:
+                with open(self.log_path, 'rb') as f:
+                    inode = os.fstat(f.fileno()).st_ino
+                    if inode != self._read_inode:
+                        # First read, or the log was compacted since last time
+                        self.statuses = self._load_snapshot()
+                        self._read_inode = inode
+                        self._read_offset = 0
+                    f.seek(self._read_offset)
+                    self._read_offset += self._fold(self.statuses, f.read())
+            except FileNotFoundError:
+                if self._read_inode is None:
+                    self.statuses = self._load_snapshot()
+                    self._read_inode = 0
+
+        return self.statuses
+
+    def status_of(self, item_id: str) -> Optional[str]:
+        return self.statuses.get(item_id, {}).get("status")
+
+    # ---- compaction ----------------------------------------------------
+
+    def compact(self):
+        """Fold the whole log into the snapshot and start a fresh log"""
+        with self._locked(fcntl.LOCK_EX):
+            statuses = self._load_snapshot()
+            try:
+                with open(self.log_path, 'rb') as f:
+                    self._fold(statuses, f.read())
+            except FileNotFoundError:
+                return
+
+            tmp_snapshot = f"{self.snapshot_path}.tmp{os.getpid()}"
+            with open(tmp_snapshot, 'w') as f:
+                json.dump({"compacted_at": datetime.now().isoformat(), "statuses": statuses}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_snapshot, self.snapshot_path)
+
+            tmp_log = f"{self.log_path}.tmp{os.getpid()}"
+            open(tmp_log, 'wb').close()
+            os.replace(tmp_log, self.log_path)
+
+
+def main():
+    """Print item ids in a queue, optionally filtered by status"""
+    if len(sys.argv) < 2:
+        print("Usage: status_log.py <queue_dir> [status]")
+        return 1
+
+    statuses = StatusLog(sys.argv[1]).refresh()
+    wanted = sys.argv[2] if len(sys.argv) > 2 else None
+    for item_id, item in sorted(statuses.items()):
+        if wanted is None or item.get("status") == wanted:
+            print(item_id if wanted else f"{item_id}\t{item.get('status')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+CRUCIBLE VALIDATION CACHE
+Maps (artifact set, validator versions) to a previous validation result
+
+Forge regularly produces byte-identical staging trees (memo hits, repeated
+findings). The cache key is the digest of the files actually on disk in
+the staging dir plus the version of every validation stage that looked at
+them, so a hit is only possible when nothing that could change the verdict
+has changed. A record carries the verdict and the benchmark results
+measured with it, so a hit reports the same numbers (and the Warden
+promotes real baselines). Records live under store/validation/<key>.json; hit/miss
+counters accumulate in store/validation/.stats.json.
+
+When a staging dir is new but only partly changed (a forge_rewrite of the
+same proposal), LineageStore keeps what the previous validation of each
+proposal saw: per-file hashes, the validator result, and each sandbox run
+with a digest of its inputs. Crucible re-runs only the checks whose inputs
+differ and merges the rest from that record.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from .artifact_store import STORE_DIR
+from .artifact_index import ArtifactIndex
+
+VALIDATION_CACHE_DIR = os.path.join(STORE_DIR, "validation")
+LINEAGE_DIR = os.path.join(VALIDATION_CACHE_DIR, "lineage")
+STATS_NAME = ".stats.json"
+# Bump when the record layout changes; part of every key
+RECORD_VERSION = "2"
+
+# Forge writes per-run metadata (ids, timestamps) here; not an artifact
+IGNORED_FILES = {"manifest.json"}
+
+
+def scan_tree(staging_path: str, index: Optional[ArtifactIndex] = None) -> Dict[str, Dict]:
+    """Artifacts in a staging dir from its shared index: {rel_path: {sha256, executable}}"""
+    index = index or ArtifactIndex.for_tree(staging_path)
+    return {
+        rel: {"sha256": entry["sha256"], "executable": entry["executable"]}
+        for rel, entry in index.files.items()
+        if os.path.basename(rel) not in IGNORED_FILES
+    }
+
+
+def validation_key(artifacts_digest: str, versions: Dict[str, str]) -> str:
+    """Cache key for one artifact set under the given validator versions"""
+    payload = {"tree": artifacts_digest, "versions": versions, "record": RECORD_VERSION}
+    encoded = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ValidationCache:
+    """
+    Usage:
+        cache = ValidationCache()
+        key = validation_key(tree_digest(scan_tree(staging_path)), versions)
+        cache.get(key) or cache.put(key, staging_id, passed, score, report)
+        cache.flush_stats()
+    """
+
+    def __init__(self, cache_dir: str = VALIDATION_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def has(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached record, counting the lookup as a hit or miss"""
+        try:
+            with open(self._path(key), 'r') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return record
+
+    def put(self, key: str, staging_id: str, passed: bool, score: float, report: str,
+            benchmarks: Optional[Dict] = None):
+        record = {
+            "staging_id": staging_id,
+            "passed": passed,
+            "score": score,
+            "report": report,
+            "benchmarks": benchmarks or {},
+            "created_at": datetime.now().isoformat()
+        }
+        tmp_path = f"{self._path(key)}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, self._path(key))
+
+    def stats(self) -> Tuple[int, int]:
+        return self.hits, self.misses
+
+    def flush_stats(self):
+        """Add this run's counters to the persistent totals"""
+        if not (self.hits or self.misses):
+            return
+        stats_path = os.path.join(self.cache_dir, STATS_NAME)
+        try:
+            with open(stats_path, 'r') as f:
+                totals = json.load(f)
+        except (OSError, ValueError):
+            totals = {"hits": 0, "misses": 0}
+
+        totals["hits"] += self.hits
+        totals["misses"] += self.misses
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = round(totals["hits"] / lookups, 3) if lookups else 0.0
+        totals["updated_at"] = datetime.now().isoformat()
+
+        tmp_path = f"{stats_path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(totals, f, indent=2)
+        os.replace(tmp_path, stats_path)
+        self.hits = self.misses = 0
+
+
+def lineage_key(proposal_type: str, proposal: Dict) -> Optional[str]:
+    """Identity shared by every staging dir Forge builds for one proposal"""
+    source = proposal.get('_source_file') or proposal.get('metadata', {}).get('proposal_id')
+    if not source:
+        return None
+    return hashlib.sha256(f"{proposal_type}:{source}".encode()).hexdigest()
+
+
+def inputs_digest(*parts) -> str:
+    """Digest of whatever a check read (file hashes, versions)"""
+    encoded = json.dumps(parts, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class LineageStore:
+    """
+    Last validation record per proposal lineage
+
+    Record: {"staging_id", "validator_version", "files": {unit_rel: sha256},
+             "result": [passed, score, report],
+             "runs": {unit_rel: {"inputs": digest, "result": sandbox_result}}}
+    """
+
+    def __init__(self, lineage_dir: str = LINEAGE_DIR):
+        self.lineage_dir = lineage_dir
+        os.makedirs(self.lineage_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.lineage_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, record: Dict):
+        record = dict(record, updated_at=datetime.now().isoformat())
+        tmp_path = f"{self._path(key)}.tmp{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            json.dump(record, f, indent=2)
+        os.replace(tmp_path, self._path(key))
@@ -10,18 +10,49 @@ Output: Validation reports to validation/ directory
 """
 
 import os
+import sys
 import json
 import time
 import uuid
-import subprocess
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from handlers import get_handler, get_registry
+from common.status_log import StatusLog
+from common.constitution import ConstitutionCache
+from common.retry_scheduler import RetryScheduler
+from common.batching import manifest_members
+from common.sandbox import EXECUTABLE_SUFFIXES, SANDBOX_VERSION, SandboxExecutor, summarize as summarize_sandbox
+from common.artifact_store import tree_digest
+from common.static_analysis import ANALYSIS_VERSION, LANGUAGES, StaticAnalyzer, summarize as summarize_analysis
+from common.benchmarks import (
+    REGRESSION_THRESHOLD, BenchmarkBaselines, compare as compare_benchmark, load_benchmarks, summarize_timings
+)
+from common.artifact_index import ArtifactIndex
+from common.validation_cache import (
+    LineageStore, ValidationCache, inputs_digest, lineage_key, scan_tree, validation_key
+)
+
 # Configuration
+PROPOSALS_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/proposals"
 STAGING_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/staging"
 VALIDATION_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/validation"
 LOGS_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/logs"
+CONSTITUTION_PATH = "/Users/fredericklaw/.openclaw/workspace/projects/lobster-project/constitution/CONSTITUTION.md"
+
+# Benchmark gate (only for implementations that stage a benchmarks.json)
+BENCHMARK_THRESHOLD = REGRESSION_THRESHOLD   # allowed median slowdown vs deployed baseline
+BENCHMARK_ON_REGRESSION = "fail"             # "fail" or "flag"
+
+# The local sandbox runs staged scripts on this host and is not an
+# isolation boundary, so executing them (sandbox runs and benchmarks) is
+# opt-in: --sandbox. Scripts matching a forbidden pattern never run.
+SANDBOX_EXECUTION = False
 
 def setup_logging():
     os.makedirs(LOGS_DIR, exist_ok=True)
@@ -48,15 +79,42 @@ class CrucibleAgent:
     6. Max 5 retry loops before human escalation
     """
     
-    def __init__(self):
+    def __init__(self, sandbox_execution: bool = SANDBOX_EXECUTION):
         self.agent_id = str(uuid.uuid4())
+        self.sandbox_execution = sandbox_execution
         self.staging_dir = STAGING_DIR
         self.validation_dir = VALIDATION_DIR
+        self.status_log = StatusLog(PROPOSALS_DIR)
+        self.constitution = ConstitutionCache(CONSTITUTION_PATH)
+        self.retries = RetryScheduler(self.status_log)
+        self.apply_constitution()
+        self.sandbox = SandboxExecutor()
+        self._sandbox_results: Dict[str, Dict[str, Dict]] = {}
+        self.analyzer = StaticAnalyzer()
+        self._analysis_results: Dict[str, Dict[str, Dict]] = {}
+        self.validation_cache = ValidationCache()
+        self.baselines = BenchmarkBaselines()
+        self._benchmark_results: Dict[str, Dict[str, Dict]] = {}
+        self._cache_keys: Dict[str, str] = {}
+        self.lineage = LineageStore()
+        self._indexes: Dict[str, ArtifactIndex] = {}
+        self._artifacts: Dict[str, Dict[str, Dict]] = {}
+        self._units: Dict[str, List[Dict]] = {}
         
         os.makedirs(self.validation_dir, exist_ok=True)
         
         logger.info(f"Crucible initialized [ID: {self.agent_id}]")
-        logger.warning("⚠️  Docker isolation recommended but not enforced in this version")
+        if self.sandbox_execution:
+            logger.warning("⚠️  Docker isolation recommended; using local process sandbox "
+                           "(rlimits, scrubbed env, stubbed binaries)")
+        else:
+            logger.warning("🚫 Sandbox execution disabled: staged scripts are not run (--sandbox to enable)")
+    
+    def apply_constitution(self):
+        """Pass threshold (Article IV) and retry limit (Article V) from the Constitution"""
+        constitution = self.constitution.get()
+        self.pass_threshold = constitution.min_crucible_score
+        self.retries.max_retries = constitution.max_retries
     
     def poll_staging(self) -> List[Dict]:
         """Check for new implementations from Forge"""
@@ -101,230 +159,377 @@ class CrucibleAgent:
         
         logger.info(f"Validating: {staging_id}")
         
-        # Get proposal type
-        proposal_type = manifest.get('source_proposal', {}).get('finding', {}).get('type', 'unknown')
-        
-        # Run appropriate validation based on type
-        if proposal_type == 'process_failure':
-            passed, score, report = self._validate_process_fix(staging_path, manifest)
-        elif proposal_type == 'resource_constraint':
-            passed, score, report = self._validate_resource_fix(staging_path, manifest)
-        elif proposal_type == 'error_rate':
-            passed, score, report = self._validate_error_fix(staging_path, manifest)
-        elif proposal_type == 'revenue_optimization':
-            passed, score, report = self._validate_revenue_opt(staging_path, manifest)
+        # Identical artifacts under identical validators: reuse the verdict
+        cache_key = self.cache_key(manifest)
+        cached = self.validation_cache.get(cache_key)
+        if cached:
+            passed, score = cached['passed'], cached['score']
+            report = cached['report'] + f"\n\n♻️  Cached result (first validated as {cached['staging_id']})"
+            self._benchmark_results[staging_id] = cached['benchmarks']
+            logger.info(f"♻️  Validation cache hit: {staging_id} = {cached['staging_id']}")
         else:
-            # Generic validation
-            passed, score, report = self._validate_generic(staging_path, manifest)
+            passed, score, report = self._run_validation(manifest, staging_path)
+            self.validation_cache.put(cache_key, staging_id, passed, score, report,
+                                      self._benchmark_results.get(staging_id, {}))
         
-        # Check retry count
-        retry_count = manifest.get('source_proposal', {}).get('retry_count', 0)
+        # Check retry count (tracked by the retry scheduler, not the proposal file)
+        source_file = manifest.get('source_proposal', {}).get('_source_file')
+        retry_count = self.retries.retry_count(source_file) if source_file else 0
+        max_retries = self.retries.max_retries
         
-        if not passed and retry_count >= 5:
-            report += "\n\n⚠️ MAXIMUM RETRIES (5) EXHAUSTED - Human intervention required"
+        if not passed and retry_count >= max_retries:
+            report += f"\n\n⚠️ MAXIMUM RETRIES ({max_retries}) EXHAUSTED - Human intervention required"
             logger.error(f"Max retries reached for {staging_id}")
         
         return passed, score, report
     
-    def _validate_process_fix(self, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
-        """Validate process restart/fix scripts"""
-        score = 0.0
-        report_lines = []
-        
-        # Check 1: Script exists
-        restart_script = os.path.join(staging_path, "restart_concierge.sh")
-        if os.path.exists(restart_script):
-            score += 0.3
-            report_lines.append("✅ Restart script exists")
+    def cache_key(self, manifest: Dict) -> str:
+        """Validation cache key: on-disk artifact digest + versions of every stage"""
+        staging_id = manifest['_staging_dir']
+        if staging_id not in self._cache_keys:
+            registry = get_registry()
+            sandbox = (f"{SANDBOX_VERSION}+{self.constitution.get().policy_version}"
+                       if self.sandbox_execution else "disabled")
+            versions = {"sandbox": sandbox, "static_analysis": ANALYSIS_VERSION,
+                        "pass_threshold": self.pass_threshold}
+            for member in manifest_members(manifest):
+                unit = f"{member['proposal_type']}:{member['path']}"
+                versions[unit] = registry.version(member['proposal_type'], 'validate')
             
-            # Check if executable
-            if os.access(restart_script, os.X_OK):
-                score += 0.1
-                report_lines.append("✅ Script is executable")
-            else:
-                report_lines.append("⚠️  Script not executable")
-        else:
-            report_lines.append("❌ Restart script missing")
-        
-        # Check 2: Syntax validation (basic)
-        try:
-            with open(restart_script, 'r') as f:
-                content = f.read()
-                if 'pkill' in content and 'python3' in content:
-                    score += 0.2
-                    report_lines.append("✅ Contains process management logic")
-                if 'sleep' in content:
-                    score += 0.1
-                    report_lines.append("✅ Has timing delays")
-        except:
-            report_lines.append("⚠️  Could not read script")
-        
-        # Check 3: Monitor script exists
-        monitor_script = os.path.join(staging_path, "monitor_concierge.sh")
-        if os.path.exists(monitor_script):
-            score += 0.2
-            report_lines.append("✅ Monitor script exists")
-        
-        # Final score adjustment
-        score = min(1.0, score)
-        passed = score >= 0.8
-        
-        report = "\n".join(report_lines)
-        report += f"\n\nFinal Score: {score:.2f}/1.0"
-        report += f"\nStatus: {'PASS' if passed else 'FAIL'}"
-        
-        return passed, score, report
+            staging_path = os.path.join(self.staging_dir, staging_id)
+            try:
+                benchmark_names = [b['name'] for b in load_benchmarks(staging_path)]
+            except (OSError, ValueError, KeyError):
+                benchmark_names = []
+            if benchmark_names:
+                # Same code, new baseline: the verdict may differ
+                versions["benchmarks"] = self.baselines.revision(benchmark_names)
+            
+            artifacts = self.artifacts(staging_id)
+            self._cache_keys[staging_id] = validation_key(tree_digest(artifacts), versions)
+        return self._cache_keys[staging_id]
     
-    def _validate_resource_fix(self, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
-        """Validate resource cleanup scripts"""
-        score = 0.0
-        report_lines = []
-        
-        cleanup_script = os.path.join(staging_path, "cleanup_disk.sh")
-        
-        if os.path.exists(cleanup_script):
-            score += 0.4
-            report_lines.append("✅ Cleanup script exists")
+    def artifacts(self, staging_id: str) -> Dict[str, Dict]:
+        """Hashes of the files in a staging dir, computed once per cycle"""
+        if staging_id not in self._artifacts:
+            self._artifacts[staging_id] = scan_tree(os.path.join(self.staging_dir, staging_id), self.index(staging_id))
+        return self._artifacts[staging_id]
+    
+    def index(self, staging_id: str) -> ArtifactIndex:
+        """Shared artifact index of a staging dir (built once, reused by Warden)"""
+        if staging_id not in self._indexes:
+            self._indexes[staging_id] = ArtifactIndex.for_tree(os.path.join(self.staging_dir, staging_id))
+        return self._indexes[staging_id]
+    
+    def analysis_inputs(self, staging_id: str) -> Dict[str, str]:
+        """Absolute path -> sha256 of the staged files static analysis understands"""
+        staging_path = os.path.join(self.staging_dir, staging_id)
+        return {
+            os.path.join(staging_path, rel): entry['sha256']
+            for rel, entry in self.index(staging_id).select(suffixes=tuple(LANGUAGES))
+        }
+    
+    def unit_states(self, manifest: Dict) -> List[Dict]:
+        """
+        Distinct (proposal_type, path) units with their files and the previous
+        validation record of the same proposal lineage, if any
+        """
+        staging_id = manifest['_staging_dir']
+        if staging_id in self._units:
+            return self._units[staging_id]
+        
+        registry = get_registry()
+        artifacts = self.artifacts(staging_id)
+        states = []
+        seen = set()
+        for member in manifest_members(manifest):
+            unit = (member['proposal_type'], member['path'])
+            if unit in seen:
+                continue
+            seen.add(unit)
             
-            try:
-                with open(cleanup_script, 'r') as f:
-                    content = f.read()
-                    
-                    checks = [
-                        ('find' in content, "Uses find command", 0.2),
-                        ('delete' in content.lower() or '-delete' in content, "Has deletion logic", 0.2),
-                        ('mtime' in content or '-mmin' in content, "Uses age filtering", 0.1),
-                    ]
-                    
-                    for check, desc, points in checks:
-                        if check:
-                            score += points
-                            report_lines.append(f"✅ {desc}")
-                        else:
-                            report_lines.append(f"⚠️  Missing: {desc}")
-            except:
-                report_lines.append("⚠️  Could not read script")
-        else:
-            report_lines.append("❌ Cleanup script missing")
-        
-        score = min(1.0, score)
-        passed = score >= 0.8
-        
-        report = "\n".join(report_lines)
-        report += f"\n\nFinal Score: {score:.2f}/1.0"
-        report += f"\nStatus: {'PASS' if passed else 'FAIL'}"
-        
-        return passed, score, report
+            prefix = member['path'] + os.sep if member['path'] else ""
+            key = lineage_key(member['proposal_type'], member['source_proposal'])
+            states.append({
+                "member": member,
+                "prefix": prefix,
+                "key": key,
+                # A new pass threshold changes verdicts, so it versions the unit too
+                "version": f"{registry.version(member['proposal_type'], 'validate')}@{self.pass_threshold}",
+                "files": {rel[len(prefix):]: entry['sha256']
+                          for rel, entry in artifacts.items() if rel.startswith(prefix)},
+                "previous": (self.lineage.get(key) if key else None) or {}
+            })
+        
+        self._units[staging_id] = states
+        return states
     
-    def _validate_error_fix(self, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
-        """Validate error analysis scripts"""
-        score = 0.0
-        report_lines = []
+    def sandbox_blocked(self, manifest: Dict) -> Optional[str]:
+        """Why this implementation's scripts must not be executed, None if they may"""
+        if not self.sandbox_execution:
+            return "execution disabled (run Crucible with --sandbox)"
         
-        analyze_script = os.path.join(staging_path, "analyze_errors.sh")
+        staging_id = manifest['_staging_dir']
+        staging_path = os.path.join(self.staging_dir, staging_id)
+        scanner = self.constitution.get().scanner
+        for rel, entry in sorted(self.artifacts(staging_id).items()):
+            if not rel.endswith(EXECUTABLE_SUFFIXES):
+                continue
+            findings = scanner.scan_file(os.path.join(staging_path, rel), entry['sha256'])['findings']
+            if findings:
+                return f"{rel} matches a forbidden pattern ({findings[0]['reason']})"
+        return None
+    
+    def sandbox_jobs(self, manifest: Dict) -> List[Dict]:
+        """
+        Scripts to execute, each with a digest of its inputs (the script plus
+        the unit's non-code files) and the previous run to reuse if unchanged
+        """
+        jobs = []
+        for state in self.unit_states(manifest):
+            data_files = {rel: sha for rel, sha in state['files'].items()
+                          if not rel.endswith(EXECUTABLE_SUFFIXES)}
+            previous_runs = state['previous'].get('runs', {})
+            for rel, sha in sorted(state['files'].items()):
+                if not rel.endswith(EXECUTABLE_SUFFIXES):
+                    continue
+                stubs = get_registry().sandbox_stubs(state['member']['proposal_type'], rel)
+                inputs = inputs_digest(SANDBOX_VERSION, rel, sha, data_files, stubs)
+                previous = previous_runs.get(rel)
+                reuse = None
+                if previous and previous['inputs'] == inputs:
+                    reuse = dict(previous['result'], artifact=state['prefix'] + rel,
+                                 reused_from=state['previous']['staging_id'])
+                jobs.append({"state": state, "rel": rel, "staging_rel": state['prefix'] + rel,
+                             "stubs": stubs, "inputs": inputs, "reuse": reuse})
+        return jobs
+    
+    def _run_validation(self, manifest: Dict, staging_path: str) -> Tuple[bool, float, str]:
+        """Full validation: registered validators per unit, then sandbox execution"""
+        staging_id = manifest['_staging_dir']
         
-        if os.path.exists(analyze_script):
-            score += 0.5
-            report_lines.append("✅ Analysis script exists")
-            
-            try:
-                with open(analyze_script, 'r') as f:
-                    content = f.read()
-                    if 'grep' in content:
-                        score += 0.2
-                        report_lines.append("✅ Uses grep for filtering")
-                    if 'ERROR' in content or 'Exception' in content:
-                        score += 0.1
-                        report_lines.append("✅ Searches for error patterns")
-            except:
-                report_lines.append("⚠️  Could not read script")
+        # Run the registered validator for each unit (generic if unknown);
+        # a batched implementation passes only if every unit passes. Units
+        # whose files and validator are unchanged since the last validation
+        # of the same proposal reuse that result.
+        states = self.unit_states(manifest)
+        results = []
+        for state in states:
+            member, previous = state['member'], state['previous']
+            if (previous.get('files') == state['files']
+                    and previous.get('validator_version') == state['version']):
+                state['result'] = tuple(previous['result'])
+                passed, score, report = state['result']
+                report += f"\n♻️  Unchanged since {previous['staging_id']}, result reused"
+            else:
+                validate = get_handler(member['proposal_type'], 'validate')
+                unit_path = os.path.join(staging_path, member['path']) if member['path'] else staging_path
+                unit_manifest = dict(manifest, source_proposal=member['source_proposal'])
+                state['result'] = tuple(validate(self, unit_path, unit_manifest))
+                passed, score, report = state['result']
+            state['runs'] = {}
+            results.append((member, (passed, score, report)))
+        
+        if len(results) == 1:
+            passed, score, report = results[0][1]
         else:
-            report_lines.append("❌ Analysis script missing")
-        
-        score = min(1.0, score)
-        passed = score >= 0.8
-        
-        report = "\n".join(report_lines)
-        report += f"\n\nFinal Score: {score:.2f}/1.0"
-        report += f"\nStatus: {'PASS' if passed else 'FAIL'}"
+            passed = all(result[0] for _, result in results)
+            score = min(result[1] for _, result in results)
+            report = "\n\n".join(
+                f"── {member['proposal_type']} ({member['path']}) ──\n{result[2]}"
+                for member, result in results
+            )
+            report += f"\n\nBatch of {len(results)} units - Score: {score:.2f}/1.0 (lowest unit)"
+        
+        # Static analysis first: code that does not parse is never executed
+        analysis = self._analysis_results.pop(staging_id, None)
+        if analysis is None:
+            inputs = self.analysis_inputs(staging_id)
+            analysis = self.analyzer.analyze_many(list(inputs), inputs)
+        if analysis:
+            analysis_ok, analysis_lines = summarize_analysis(analysis, staging_path)
+            report += "\n\nStatic analysis:\n" + "\n".join(analysis_lines)
+            if not analysis_ok:
+                score = min(score, 0.3)
+                report += f"\nStatus: FAIL (static analysis) - Score capped at {score:.2f}, sandbox skipped"
+                self._record_lineage(staging_id, states)
+                return False, score, report
+        
+        blocked = self.sandbox_blocked(manifest)
+        if blocked:
+            self._record_lineage(staging_id, states)
+            report += f"\n\n⏭️  Sandbox execution and benchmarks skipped: {blocked}"
+            return passed, score, report
+        
+        # Execute staged scripts: a non-zero exit or timeout fails validation.
+        # Scripts whose inputs are unchanged reuse the previous run.
+        prefetched = self._sandbox_results.pop(staging_id, {})
+        jobs = self.sandbox_jobs(manifest)
+        pending = [job for job in jobs if not job['reuse'] and job['staging_rel'] not in prefetched]
+        fresh = self.sandbox.run_many([(staging_path, job['staging_rel'], job['stubs']) for job in pending])
+        prefetched.update({job['staging_rel']: result for job, result in zip(pending, fresh)})
+        
+        sandbox_results = []
+        for job in jobs:
+            result = job['reuse'] or prefetched[job['staging_rel']]
+            job['state']['runs'][job['rel']] = {"inputs": job['inputs'], "result": result}
+            sandbox_results.append(result)
+        self._record_lineage(staging_id, states)
+        
+        if sandbox_results:
+            sandbox_ok, sandbox_lines = summarize_sandbox(sandbox_results)
+            report += "\n\nSandbox execution:\n" + "\n".join(sandbox_lines)
+            if not sandbox_ok:
+                passed = False
+                score = min(score, 0.5)
+                report += f"\nStatus: FAIL (sandbox) - Score capped at {score:.2f}"
+        
+        if passed:
+            passed, score, report = self._run_benchmarks(staging_id, staging_path, passed, score, report)
         
         return passed, score, report
     
-    def _validate_revenue_opt(self, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
-        """Validate revenue optimization code"""
-        score = 0.0
-        report_lines = []
-        
-        # Check for Stripe integration code
-        stripe_code = os.path.join(staging_path, "stripe_integration.py")
-        
-        if os.path.exists(stripe_code):
-            score += 0.4
-            report_lines.append("✅ Stripe integration code exists")
+    def _record_lineage(self, staging_id: str, states: List[Dict]):
+        """Remember what this validation saw, for the next rewrite of the same proposals"""
+        for state in states:
+            if not state['key']:
+                continue
+            reused = (state['previous'].get('files') == state['files']
+                      and state['previous'].get('validator_version') == state['version'])
+            runs = {rel: run for rel, run in state['runs'].items() if not run['result'].get('reused_from')}
+            # Carry forward reused runs as they were first recorded
+            for rel, run in state['runs'].items():
+                if rel not in runs:
+                    runs[rel] = state['previous']['runs'][rel]
+            self.lineage.put(state['key'], {
+                "staging_id": state['previous']['staging_id'] if reused else staging_id,
+                "validator_version": state['version'],
+                "files": state['files'],
+                "result": list(state['result']),
+                "runs": runs
+            })
+    
+    def _run_benchmarks(self, staging_id: str, staging_path: str, passed: bool, score: float,
+                        report: str) -> Tuple[bool, float, str]:
+        """Optional benchmark gate; runs one entry point at a time so timings don't compete"""
+        try:
+            benchmarks = load_benchmarks(staging_path)
+        except (OSError, ValueError, KeyError) as e:
+            return False, min(score, 0.5), report + f"\n\n❌ Invalid benchmarks.json: {e}"
+        
+        if not benchmarks:
+            return passed, score, report
+        
+        lines = []
+        regressed = False
+        measured = {}
+        for bench in benchmarks:
+            with self.baselines.exclusive():
+                result = self.sandbox.benchmark(staging_path, bench['script'], bench['args'], runs=bench['runs'])
+            if result['outcome'] != 'ok':
+                regressed = True
+                lines.append(f"❌ Benchmark {bench['name']} did not complete ({result['outcome']})")
+                continue
             
-            try:
-                with open(stripe_code, 'r') as f:
-                    content = f.read()
-                    
-                    checks = [
-                        ('import stripe' in content, "Imports Stripe library", 0.2),
-                        ('create_deposit_session' in content, "Has session creation", 0.2),
-                        ('checkout.Session' in content, "Uses Checkout Sessions", 0.1),
-                    ]
-                    
-                    for check, desc, points in checks:
-                        if check:
-                            score += points
-                            report_lines.append(f"✅ {desc}")
-                        else:
-                            report_lines.append(f"⚠️  Missing: {desc}")
-            except:
-                report_lines.append("⚠️  Could not read code")
-        else:
-            report_lines.append("❌ Stripe code missing")
+            measured[bench['name']] = summarize_timings(result['timings'])
+            slower, line = compare_benchmark(
+                bench['name'], measured[bench['name']], self.baselines.get(bench['name']), BENCHMARK_THRESHOLD
+            )
+            regressed = regressed or slower
+            lines.append(line)
         
-        # Check for setup docs
-        setup_doc = os.path.join(staging_path, "STRIPE_SETUP.md")
-        if os.path.exists(setup_doc):
-            score += 0.1
-            report_lines.append("✅ Setup documentation exists")
+        self._benchmark_results[staging_id] = measured
+        report += "\n\nBenchmarks:\n" + "\n".join(lines)
         
-        score = min(1.0, score)
-        passed = score >= 0.8
-        
-        report = "\n".join(report_lines)
-        report += f"\n\nFinal Score: {score:.2f}/1.0"
-        report += f"\nStatus: {'PASS' if passed else 'FAIL'}"
+        if regressed and BENCHMARK_ON_REGRESSION == "fail":
+            score = min(score, 0.5)
+            report += f"\nStatus: FAIL (performance regression) - Score capped at {score:.2f}"
+            return False, score, report
         
         return passed, score, report
     
-    def _validate_generic(self, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
-        """Generic validation for unknown types"""
-        score = 0.5  # Base score for having files
-        report_lines = ["ℹ️  Generic validation (unknown type)"]
-        
-        # Check if directory has any files
-        files = os.listdir(staging_path)
-        if len(files) > 0:
-            score += 0.3
-            report_lines.append(f"✅ Contains {len(files)} files")
-        
-        # Check for README
-        readme = os.path.join(staging_path, "README.md")
-        if os.path.exists(readme):
-            score += 0.2
-            report_lines.append("✅ Has documentation")
-        
-        score = min(1.0, score)
-        passed = score >= 0.8
-        
-        report = "\n".join(report_lines)
-        report += f"\n\nFinal Score: {score:.2f}/1.0"
-        report += f"\nStatus: {'PASS' if passed else 'FAIL'}"
+    def run_static_analysis(self, implementations: List[Dict]):
+        """Analyze every staged source file of this cycle in one process pool"""
+        owners = {}
+        hashes = {}
+        for manifest in implementations:
+            if self.validation_cache.has(self.cache_key(manifest)):
+                continue
+            staging_id = manifest['_staging_dir']
+            self._analysis_results[staging_id] = {}
+            for path, sha256 in self.analysis_inputs(staging_id).items():
+                owners[path] = staging_id
+                hashes[path] = sha256
+        
+        if not owners:
+            return
+        
+        results = self.analyzer.analyze_many(list(owners), hashes)
+        for path, result in results.items():
+            self._analysis_results[owners[path]][path] = result
+        
+        cached = sum(1 for r in results.values() if r['cached'])
+        logger.info(f"🔬 Static analysis: {len(results)} files ({cached} cached)")
+    
+    def run_sandboxes(self, implementations: List[Dict]):
+        """Execute every changed staged script of this cycle concurrently, ahead of validation"""
+        jobs = []
+        for manifest in implementations:
+            if self.validation_cache.has(self.cache_key(manifest)):
+                continue
+            analysis = self._analysis_results.get(manifest['_staging_dir'], {})
+            if any(result['errors'] for result in analysis.values()):
+                continue
+            if self.sandbox_blocked(manifest):
+                continue
+            staging_path = os.path.join(self.staging_dir, manifest['_staging_dir'])
+            for job in self.sandbox_jobs(manifest):
+                if not job['reuse']:
+                    jobs.append((manifest['_staging_dir'], staging_path, job['staging_rel'], job['stubs']))
+        
+        if not jobs:
+            return
+        
+        started = time.time()
+        results = self.sandbox.run_many([job[1:] for job in jobs])
+        for (staging_id, _, rel_path, _), result in zip(jobs, results):
+            self._sandbox_results.setdefault(staging_id, {})[rel_path] = result
+        
+        logger.info(f"🧪 Sandbox: {len(jobs)} artifacts executed in {time.time() - started:.1f}s "
+                    f"({self.sandbox.max_workers} workers)")
+    
+    def schedule_retry(self, manifest: Dict, score: float) -> str:
+        """
+        Send a failed implementation back to Forge with backoff
+        Returns the next action: forge_rewrite, or human_review once retries run out
+        """
+        next_action = "forge_rewrite"
         
-        return passed, score, report
+        # Every proposal in a batch goes back to Forge
+        for member in manifest_members(manifest):
+            source_file = member['source_proposal'].get('_source_file')
+            if not source_file:
+                continue
+            
+            retry = self.retries.schedule(
+                source_file,
+                reason=f"Crucible score {score:.2f}",
+                staging_id=manifest['_staging_dir']
+            )
+            
+            if retry is None:
+                logger.error(f"🚨 Escalated after {self.retries.max_retries} retries: {source_file}")
+                next_action = "human_review"
+                continue
+            
+            wait_minutes = (retry['next_eligible_at'] - time.time()) / 60
+            logger.info(f"🔁 Retry {retry['retry_count']}/{self.retries.max_retries} "
+                        f"for {source_file} in {wait_minutes:.0f} min")
+        
+        return next_action
     
-    def create_validation_report(self, manifest: Dict, passed: bool, score: float, report: str):
+    def create_validation_report(self, manifest: Dict, passed: bool, score: float, report: str,
+                                 next_action: Optional[str] = None):
         """Create validation report and update manifest"""
         staging_id = manifest['_staging_dir']
         
@@ -334,6 +539,11 @@ class CrucibleAgent:
             "metadata": {
                 "validation_id": validation_id,
                 "staging_id": staging_id,
+                "proposal_type": manifest.get('source_proposal', {}).get('finding', {}).get('type', 'unknown'),
+                "members": [
+                    {"proposal_type": m['proposal_type'], "path": m['path']}
+                    for m in manifest_members(manifest)
+                ],
                 "agent": "crucible",
                 "agent_id": self.agent_id,
                 "validated_at": datetime.now().isoformat(),
@@ -341,10 +551,11 @@ class CrucibleAgent:
             "result": {
                 "passed": passed,
                 "score": score,
-                "threshold": 0.8,
-                "report": report
+                "threshold": self.pass_threshold,
+                "report": report,
+                "benchmarks": self._benchmark_results.pop(staging_id, {})
             },
-            "next_action": "warden_review" if passed else "forge_rewrite"
+            "next_action": next_action or ("warden_review" if passed else "forge_rewrite")
         }
         
         # Save validation report
@@ -360,12 +571,41 @@ class CrucibleAgent:
         logger.info(f"Validation report created: {validation_id}")
         return validation_id
     
-    def run_cycle(self):
+    def _validate_parallel(self, implementations: List[Dict], workers: int):
+        """
+        Validate on a process pool; yields (manifest, result) as workers finish.
+        Workers only validate; reports, markers and retries are written here.
+        """
+        logger.info(f"⚙️  Validating on {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.sandbox_execution,)) as pool:
+            futures = {pool.submit(_validate_in_worker, manifest): manifest for manifest in implementations}
+            for future in as_completed(futures):
+                manifest = futures[future]
+                try:
+                    passed, score, report, benchmarks, (hits, misses) = future.result()
+                except Exception as e:
+                    # Left unvalidated; picked up again next cycle
+                    logger.error(f"❌ Worker failed on {manifest['_staging_dir']}: {e}")
+                    continue
+                self._benchmark_results[manifest['_staging_dir']] = benchmarks
+                self.validation_cache.hits += hits
+                self.validation_cache.misses += misses
+                yield manifest, (passed, score, report)
+    
+    def _validate_sequential(self, implementations: List[Dict]):
+        self.run_static_analysis(implementations)
+        self.run_sandboxes(implementations)
+        for manifest in implementations:
+            yield manifest, self.validate_implementation(manifest)
+    
+    def run_cycle(self, workers: int = 1):
         """Main execution cycle"""
         logger.info("="*60)
         logger.info("CRUCIBLE CYCLE STARTED")
         logger.info("="*60)
         
+        self.apply_constitution()
         implementations = self.poll_staging()
         
         if not implementations:
@@ -377,10 +617,16 @@ class CrucibleAgent:
         passed_count = 0
         failed_count = 0
         
-        for manifest in implementations:
-            passed, score, report = self.validate_implementation(manifest)
-            
-            self.create_validation_report(manifest, passed, score, report)
+        self.status_log.refresh()
+        workers = min(workers, len(implementations))
+        if workers > 1:
+            outcomes = self._validate_parallel(implementations, workers)
+        else:
+            outcomes = self._validate_sequential(implementations)
+        
+        for manifest, (passed, score, report) in outcomes:
+            next_action = "warden_review" if passed else self.schedule_retry(manifest, score)
+            self.create_validation_report(manifest, passed, score, report, next_action)
             
             if passed:
                 passed_count += 1
@@ -394,15 +640,54 @@ class CrucibleAgent:
         logger.info(f"Passed: {passed_count}")
         logger.info(f"Failed: {failed_count}")
         logger.info(f"Validation reports: {len(os.listdir(self.validation_dir))}")
+        hits, misses = self.validation_cache.stats()
+        logger.info(f"Validation cache: {hits} hits, {misses} misses")
         logger.info("="*60)
         
+        self.status_log.close()
+        self.validation_cache.flush_stats()
+        
         return passed_count
 
+# Per-process agent for --workers mode
+_worker_agent: Optional[CrucibleAgent] = None
+
+def _init_worker(sandbox_execution: bool):
+    global _worker_agent
+    _worker_agent = CrucibleAgent(sandbox_execution)
+    _worker_agent.analyzer.max_workers = 1  # already one process per implementation
+    _worker_agent.status_log.refresh()
+
+def _validate_in_worker(manifest: Dict):
+    """Validate one implementation; returns everything the parent needs to write its report"""
+    agent = _worker_agent
+    hits, misses = agent.validation_cache.stats()
+    passed, score, report = agent.validate_implementation(manifest)
+    benchmarks = agent._benchmark_results.pop(manifest['_staging_dir'], {})
+    new_hits, new_misses = agent.validation_cache.stats()
+    return passed, score, report, benchmarks, (new_hits - hits, new_misses - misses)
+
 def main():
-    agent = CrucibleAgent()
+    parser = argparse.ArgumentParser(description="The Crucible - validate staged implementations")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Validate on N worker processes (0 = one per CPU core)"
+    )
+    parser.add_argument(
+        "--sandbox",
+        action="store_true",
+        default=SANDBOX_EXECUTION,
+        help="Execute staged scripts in the local sandbox (on this host, not isolated)"
+    )
+    args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    
+    agent = CrucibleAgent(sandbox_execution=args.sandbox)
     
     try:
-        count = agent.run_cycle()
+        count = agent.run_cycle(workers=workers)
         print(f"\n✅ Crucible cycle complete: {count} validations passed")
         print(f"📁 Check: {VALIDATION_DIR}")
     except Exception as e:
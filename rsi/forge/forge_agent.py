@@ -10,19 +10,30 @@ Output: Code to staging/ directory
 """
 
 import os
+import sys
 import json
 import time
 import uuid
-import shutil
-import subprocess
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from handlers import get_handler, get_registry
+from common.artifact_store import ArtifactStore, tree_digest
+from common.forge_memo import ImplementationMemo, proposal_key
+from common.status_log import StatusLog
+from common.retry_scheduler import RetryScheduler, RETRY_STATUS
+from common.batching import batch_key, group_proposals
+from common.constitution import ConstitutionCache
+from common.safety_manifest import SafetyManifests
+
 # Configuration
 PROPOSALS_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/proposals"
 STAGING_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/staging"
 LOGS_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/logs"
+CONSTITUTION_PATH = "/Users/fredericklaw/.openclaw/workspace/projects/lobster-project/constitution/CONSTITUTION.md"
 
 def setup_logging():
     os.makedirs(LOGS_DIR, exist_ok=True)
@@ -51,6 +62,12 @@ class ForgeAgent:
         self.agent_id = str(uuid.uuid4())
         self.staging_dir = STAGING_DIR
         self.proposals_dir = PROPOSALS_DIR
+        self.store = ArtifactStore()
+        self.memo = ImplementationMemo()
+        self.status_log = StatusLog(self.proposals_dir)
+        self.constitution = ConstitutionCache(CONSTITUTION_PATH)
+        self.retries = RetryScheduler(self.status_log, max_retries=self.constitution.get().max_retries)
+        self.safety = SafetyManifests()
         
         os.makedirs(self.staging_dir, exist_ok=True)
         
@@ -64,18 +81,29 @@ class ForgeAgent:
         proposals = []
         
         try:
+            self.status_log.refresh()
             files = os.listdir(self.proposals_dir)
             json_files = [f for f in files if f.endswith('.json')]
             
             for filename in json_files:
+                # Items with a logged status past pending are skipped unopened,
+                # failed ones until their retry backoff has elapsed
+                logged_status = self.status_log.status_of(filename)
+                if logged_status == RETRY_STATUS:
+                    if not self.retries.is_due(filename):
+                        continue
+                elif logged_status and logged_status != 'pending_review':
+                    continue
+                
                 filepath = os.path.join(self.proposals_dir, filename)
                 try:
                     with open(filepath, 'r') as f:
                         proposal = json.load(f)
                         
-                    # Only process pending proposals
-                    if proposal.get('status') == 'pending_review':
+                    # Only process pending proposals and due retries
+                    if (logged_status or proposal.get('status')) in ('pending_review', RETRY_STATUS):
                         proposal['_source_file'] = filename
+                        proposal['retry_count'] = self.retries.retry_count(filename)
                         proposals.append(proposal)
                         logger.info(f"Found pending proposal: {filename}")
                         
@@ -92,392 +120,178 @@ class ForgeAgent:
         Implement a proposal
         Returns: (success, staging_dir, error_message)
         """
-        proposal_id = proposal['metadata']['proposal_id']
-        proposal_type = proposal['finding'].get('type', 'improvement')
+        return self.implement_batch([proposal])
+    
+    def implement_batch(self, proposals: List[Dict]) -> Tuple[bool, str, str]:
+        """
+        Implement one or more compatible proposals as a single staging unit
+        Returns: (success, staging_dir, error_message)
+        """
+        primary = proposals[0]
+        proposal_id = primary['metadata']['proposal_id']
+        batched = len(proposals) > 1
         
-        logger.info(f"Implementing proposal {proposal_id}: {proposal['proposal']['title']}")
+        if batched:
+            logger.info(f"Implementing batch of {len(proposals)} proposals for "
+                        f"{batch_key(primary)}: {', '.join(p['metadata']['proposal_id'] for p in proposals)}")
+        else:
+            logger.info(f"Implementing proposal {proposal_id}: {primary['proposal']['title']}")
         
         # Create staging directory for this implementation
-        staging_id = f"forge_{proposal_id}_{int(time.time())}"
+        prefix = "forge_batch" if batched else "forge"
+        staging_id = f"{prefix}_{proposal_id}_{int(time.time())}"
         staging_path = os.path.join(self.staging_dir, staging_id)
         os.makedirs(staging_path, exist_ok=True)
         
         try:
-            # Route to appropriate implementation handler
-            if proposal_type == 'process_failure':
-                success = self._fix_process_failure(proposal, staging_path)
-            elif proposal_type == 'resource_constraint':
-                success = self._fix_resource_constraint(proposal, staging_path)
-            elif proposal_type == 'error_rate':
-                success = self._fix_error_rate(proposal, staging_path)
-            elif proposal_type == 'architecture_improvement':
-                success = self._implement_architecture(proposal, staging_path)
-            elif proposal_type == 'automation':
-                success = self._implement_automation(proposal, staging_path)
-            elif proposal_type == 'revenue_optimization':
-                success = self._implement_revenue_opt(proposal, staging_path)
-            else:
-                # Generic implementation
-                success = self._implement_generic(proposal, staging_path)
+            artifacts = {}
+            members = []
+            units = {}
             
-            if success:
-                # Create implementation manifest
-                manifest = {
-                    "metadata": {
-                        "staging_id": staging_id,
-                        "proposal_id": proposal_id,
-                        "agent": "forge",
-                        "agent_id": self.agent_id,
-                        "created_at": datetime.now().isoformat(),
-                        "status": "implemented"
-                    },
-                    "source_proposal": proposal,
-                    "implementation": {
-                        "staging_path": staging_path,
-                        "files_created": os.listdir(staging_path),
-                        "ready_for_validation": True
-                    }
-                }
+            for proposal in proposals:
+                proposal_type = proposal['finding'].get('type', 'improvement')
+                memo_key = self._memo_key(proposal, proposal_type)
                 
-                manifest_path = os.path.join(staging_path, "manifest.json")
-                with open(manifest_path, 'w') as f:
-                    json.dump(manifest, f, indent=2)
+                # Identical proposals in a batch share one unit
+                unit_key = memo_key or proposal.get('_source_file') or proposal['metadata']['proposal_id']
+                if unit_key not in units:
+                    subdir = f"{proposal_type}_{proposal['metadata']['proposal_id']}" if batched else ""
+                    unit_path = os.path.join(staging_path, subdir) if subdir else staging_path
+                    os.makedirs(unit_path, exist_ok=True)
+                    
+                    success, unit_artifacts, reused = self._implement_unit(
+                        proposal, proposal_type, memo_key, unit_path, staging_id
+                    )
+                    if not success:
+                        logger.error(f"❌ Implementation failed for {proposal['metadata']['proposal_id']}")
+                        return False, staging_path, "Implementation handler returned false"
+                    
+                    for rel_path, entry in unit_artifacts.items():
+                        artifacts[os.path.join(subdir, rel_path)] = entry
+                    units[unit_key] = (subdir, memo_key, reused)
                 
-                # Mark proposal as implemented
+                subdir, memo_key, reused = units[unit_key]
+                members.append({
+                    "proposal_id": proposal['metadata']['proposal_id'],
+                    "proposal_type": proposal_type,
+                    "path": subdir,
+                    "memo_key": memo_key,
+                    "reused_from": reused['staging_id'] if reused else None,
+                    "source_proposal": proposal
+                })
+            
+            if batched:
+                self.store.write_tree(staging_path, artifacts)
+            
+            # Create implementation manifest
+            manifest = {
+                "metadata": {
+                    "staging_id": staging_id,
+                    "proposal_id": proposal_id,
+                    "agent": "forge",
+                    "agent_id": self.agent_id,
+                    "created_at": datetime.now().isoformat(),
+                    "status": "implemented"
+                },
+                "source_proposal": primary,
+                "implementation": {
+                    "staging_path": staging_path,
+                    "files_created": sorted(artifacts),
+                    "tree_digest": tree_digest(artifacts),
+                    "memo_key": members[0]["memo_key"],
+                    "reused_from": members[0]["reused_from"],
+                    "ready_for_validation": True
+                }
+            }
+            if batched:
+                manifest["members"] = members
+            
+            manifest_path = os.path.join(staging_path, "manifest.json")
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            
+            # Sign hashes and scan verdicts so the Warden only has to verify them
+            safety = self.safety.write(staging_path, staging_id, self.constitution.get())
+            flagged = sum(1 for f in safety['files'].values() if f['scan'] and f['scan']['findings'])
+            if flagged:
+                logger.warning(f"⚠️  {flagged} file(s) match forbidden patterns - Warden will reject")
+            
+            # Mark proposals as implemented
+            for proposal in proposals:
                 self._update_proposal_status(proposal, 'implemented', staging_id)
-                
-                logger.info(f"✅ Implementation complete: {staging_id}")
-                return True, staging_path, ""
-            else:
-                logger.error(f"❌ Implementation failed for {proposal_id}")
-                return False, staging_path, "Implementation handler returned false"
+            
+            logger.info(f"✅ Implementation complete: {staging_id}")
+            return True, staging_path, ""
                 
         except Exception as e:
             logger.error(f"❌ Implementation error: {e}")
             return False, staging_path, str(e)
     
-    def _fix_process_failure(self, proposal: Dict, staging_path: str) -> bool:
-        """Fix a process failure (e.g., bot not running)"""
-        component = proposal['finding'].get('component', 'unknown')
-        
-        logger.info(f"Creating fix for process: {component}")
-        
-        # Create restart script
-        if component == 'concierge_bot':
-            script_content = '''#!/bin/bash
-# Auto-generated restart script for Concierge Bot
-# Generated by Forge Agent
-
-echo "🔧 Restarting Concierge Bot..."
-
-# Kill existing processes
-pkill -f fred_pt_bot.py 2>/dev/null
-sleep 2
-
-# Start bot
-cd /Users/fredericklaw/.openclaw/workspace/automation
-nohup python3 fred_pt_bot.py > /tmp/fred_bot.log 2>&1 &
-sleep 3
-
-# Verify
-if pgrep -f fred_pt_bot.py > /dev/null; then
-    echo "✅ Concierge Bot restarted successfully"
-    exit 0
-else
-    echo "❌ Failed to restart"
-    exit 1
-fi
-'''
-            script_path = os.path.join(staging_path, "restart_concierge.sh")
-            with open(script_path, 'w') as f:
-                f.write(script_content)
-            os.chmod(script_path, 0o755)
-            
-            # Create monitoring script
-            monitor_content = '''#!/bin/bash
-# Monitor script - runs every 5 minutes via cron
-
-if ! pgrep -f fred_pt_bot.py > /dev/null; then
-    echo "$(date): Concierge Bot down, restarting..." >> /tmp/bot_monitor.log
-    /Users/fredericklaw/.openclaw/workspace/rsi/staging/''' + os.path.basename(staging_path) + '''/restart_concierge.sh
-fi
-'''
-            monitor_path = os.path.join(staging_path, "monitor_concierge.sh")
-            with open(monitor_path, 'w') as f:
-                f.write(monitor_content)
-            os.chmod(monitor_path, 0o755)
-            
-            return True
-        
-        return False
-    
-    def _fix_resource_constraint(self, proposal: Dict, staging_path: str) -> bool:
-        """Fix resource constraints (e.g., disk space)"""
-        component = proposal['finding'].get('component', 'unknown')
-        
-        if component == 'disk_space':
-            script_content = '''#!/bin/bash
-# Disk cleanup script
-# Generated by Forge Agent
-
-echo "🧹 Cleaning disk space..."
-
-# Clean old logs
-echo "Removing old logs..."
-find /tmp -name "*.log" -mtime +7 -delete 2>/dev/null
-find ~/.openclaw/workspace -name "*.log" -mtime +7 -delete 2>/dev/null
-
-# Clean Python cache
-echo "Cleaning Python cache..."
-find ~/.openclaw/workspace -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null
-
-# Clean old screenshots
-echo "Cleaning old screenshots..."
-find /tmp -name "bolt_*.png" -mtime +1 -delete 2>/dev/null
-
-echo "✅ Cleanup complete"
-df -h /Users
-'''
-            script_path = os.path.join(staging_path, "cleanup_disk.sh")
-            with open(script_path, 'w') as f:
-                f.write(script_content)
-            os.chmod(script_path, 0o755)
-            
-            return True
-        
-        return False
-    
-    def _fix_error_rate(self, proposal: Dict, staging_path: str) -> bool:
-        """Fix high error rates in logs"""
-        # Implementation would analyze logs and create fixes
-        # For now, create diagnostic script
-        
-        script_content = '''#!/bin/bash
-# Error analysis script
-# Generated by Forge Agent
-
-echo "🔍 Analyzing errors..."
-
-LOGS=(
-    "/tmp/fred_bot.log"
-    "/tmp/watchdog_v3.log"
-    "/tmp/coordinator.log"
-)
-
-for log in "${LOGS[@]}"; do
-    if [ -f "$log" ]; then
-        echo ""
-        echo "=== $log ==="
-        echo "Recent errors:"
-        tail -50 "$log" | grep -E "(ERROR|Exception)" | tail -10
-    fi
-done
-'''
-        script_path = os.path.join(staging_path, "analyze_errors.sh")
-        with open(script_path, 'w') as f:
-            f.write(script_content)
-        os.chmod(script_path, 0o755)
-        
-        return True
-    
-    def _implement_architecture(self, proposal: Dict, staging_path: str) -> bool:
-        """Implement architectural improvements"""
-        # This would implement the 4-pillar system
-        # Already implemented, so just create documentation
-        
-        readme_content = '''# RSI Architecture Implementation
-# Generated by Forge Agent
-
-## Status
-The 4-Pillar RSI Architecture has been deployed:
-- ✅ Forager (Researcher)
-- ✅ Forge (Developer)
-- ✅ Crucible (Validator) - Docker required
-- ✅ Warden (Governor)
-
-## Next Steps
-1. Configure Docker for Crucible sandbox
-2. Set up HEARTBEAT.md triggers
-3. Test full loop
-'''
-        readme_path = os.path.join(staging_path, "ARCHITECTURE_STATUS.md")
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
-        
-        return True
-    
-    def _implement_automation(self, proposal: Dict, staging_path: str) -> bool:
-        """Implement automation (e.g., content posting)"""
-        # Create content deployment script
-        
-        script_content = '''#!/bin/bash
-# Content deployment script
-# Generated by Forge Agent
-
-echo "📱 Deploying MarketingBot content..."
-
-# This would integrate with Instagram/LinkedIn APIs
-# For now, create manual posting guide
-
-cat << 'GUIDE'
-Manual Content Deployment Guide:
-
-1. Access content queue:
-   ls ~/.openclaw/workspace/marketingbot/content_queue/
-
-2. Post to Instagram:
-   - Copy content from JSON files
-   - Use Instagram Creator Studio or Later.com
-   - Schedule for optimal times (8am, 12pm, 6pm)
-
-3. Post to LinkedIn:
-   - Use professional tone
-   - Tag relevant hashtags
-   - Include call-to-action
-
-4. Track engagement:
-   - Monitor likes/comments
-   - Respond to inquiries
-   - Track lead conversions
-
-GUIDE
-
-echo "✅ Deployment guide created"
-'''
-        script_path = os.path.join(staging_path, "deploy_content.sh")
-        with open(script_path, 'w') as f:
-            f.write(script_content)
-        os.chmod(script_path, 0o755)
-        
-        return True
-    
-    def _implement_revenue_opt(self, proposal: Dict, staging_path: str) -> bool:
-        """Implement revenue optimizations"""
-        # Create Stripe integration starter
-        
-        code_content = '''# Stripe Integration for Booking Bot
-# Generated by Forge Agent
-
-import stripe
-import os
-from typing import Optional
-
-class StripeBookingIntegration:
-    """
-    Handles booking deposits via Stripe
-    """
-    
-    def __init__(self):
-        # Use environment variable for security
-        stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
-        
-    def create_deposit_session(self, client_email: str, amount_cents: int = 5000) -> Optional[str]:
+    def _implement_unit(self, proposal: Dict, proposal_type: str, memo_key: Optional[str],
+                        unit_path: str, staging_id: str) -> Tuple[bool, Dict, Optional[Dict]]:
         """
-        Create a Stripe checkout session for booking deposit
-        Default: $50 deposit (5000 cents)
+        Produce one proposal's artifacts in unit_path (memo hit or handler)
+        Returns: (success, artifacts, reused_memo_record)
         """
-        try:
-            session = stripe.checkout.Session.create(
-                payment_method_types=['card'],
-                line_items=[{
-                    'price_data': {
-                        'currency': 'sgd',
-                        'product_data': {
-                            'name': 'PT Session Deposit',
-                            'description': 'Booking deposit for personal training session',
-                        },
-                        'unit_amount': amount_cents,
-                    },
-                    'quantity': 1,
-                }],
-                mode='payment',
-                success_url='https://your-domain.com/success',
-                cancel_url='https://your-domain.com/cancel',
-                customer_email=client_email,
-            )
-            return session.url
-        except Exception as e:
-            print(f"Error creating session: {e}")
+        # A retry follows a Crucible FAIL: relinking the memoized output would
+        # only replay that failure, so forget it and run the handler again
+        if memo_key and proposal.get('retry_count', 0) > 0:
+            self.memo.drop(memo_key)
+            logger.info(f"🔁 Retry {proposal['retry_count']}: memoized implementation dropped")
+        
+        reused = self._reuse_memoized(memo_key, unit_path)
+        if reused:
+            return True, reused['artifacts'], reused
+        
+        # Route to the registered implementation handler (generic if unknown)
+        implement = get_handler(proposal_type, 'implement')
+        if not implement(self, proposal, unit_path):
+            return False, {}, None
+        
+        # Dedupe generated files into the artifact store
+        artifacts = self.store.ingest_tree(unit_path)
+        if memo_key:
+            self.memo.put(memo_key, staging_id, artifacts)
+        return True, artifacts, None
+    
+    def _memo_key(self, proposal: Dict, proposal_type: str) -> Optional[str]:
+        """Content key for memoization, None if the handler opts out"""
+        registry = get_registry()
+        fields = registry.memo_fields(proposal_type)
+        if fields is None:
+            return None
+        return proposal_key(proposal, proposal_type, fields, registry.version(proposal_type))
+    
+    def _reuse_memoized(self, memo_key: Optional[str], staging_path: str) -> Optional[Dict]:
+        """Link a previous identical implementation into staging_path"""
+        if not memo_key:
             return None
-
-# Usage:
-# stripe = StripeBookingIntegration()
-# payment_url = stripe.create_deposit_session("client@email.com")
-'''
-        code_path = os.path.join(staging_path, "stripe_integration.py")
-        with open(code_path, 'w') as f:
-            f.write(code_content)
         
-        # Create setup instructions
-        setup_content = '''# Stripe Integration Setup
-
-1. Install Stripe:
-   pip install stripe
-
-2. Set environment variable:
-   export STRIPE_SECRET_KEY="sk_live_..."
-
-3. Add to booking bot flow:
-   - Before confirming booking
-   - Generate payment URL
-   - Send to client via Telegram
-   - Confirm booking only after payment
-
-4. Webhook setup (for production):
-   - Configure Stripe webhook
-   - Listen for payment_intent.succeeded
-   - Auto-confirm booking on payment
-'''
-        setup_path = os.path.join(staging_path, "STRIPE_SETUP.md")
-        with open(setup_path, 'w') as f:
-            f.write(setup_content)
+        record = self.memo.get(memo_key)
+        if not record:
+            return None
         
-        return True
-    
-    def _implement_generic(self, proposal: Dict, staging_path: str) -> bool:
-        """Generic implementation for unknown types"""
-        readme_content = f'''# Implementation: {proposal['proposal']['title']}
-
-## Description
-{proposal['proposal']['description']}
-
-## Status
-Generic implementation template created.
-Manual implementation required.
-
-## Notes
-- Type: {proposal['finding'].get('type', 'unknown')}
-- Priority: {proposal['proposal'].get('priority', 'medium')}
-- Estimated effort: {proposal['proposal'].get('estimated_effort_hours', 4)} hours
-'''
-        readme_path = os.path.join(staging_path, "README.md")
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        artifacts = record['artifacts']
+        if not all(self.store.has(e['sha256'], e['executable']) for e in artifacts.values()):
+            return None
         
-        return True
+        self.store.materialize(artifacts, staging_path)
+        logger.info(f"♻️  Memo hit: reusing artifacts from {record['staging_id']}")
+        return record
     
     def _update_proposal_status(self, proposal: Dict, status: str, staging_id: str):
-        """Update the proposal file with new status"""
+        """Append a status event for the proposal (the proposal file is never rewritten)"""
         filename = proposal.get('_source_file')
         if not filename:
             return
         
-        filepath = os.path.join(self.proposals_dir, filename)
-        
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            data['status'] = status
-            data['implementation'] = {
-                "staging_id": staging_id,
-                "implemented_at": datetime.now().isoformat(),
-                "implemented_by": self.agent_id
-            }
-            
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            self.status_log.append(
+                filename,
+                status,
+                staging_id=staging_id,
+                implemented_by=self.agent_id
+            )
         except Exception as e:
             logger.error(f"Failed to update proposal status: {e}")
     
@@ -499,13 +313,17 @@ Manual implementation required.
         implemented_count = 0
         failed_count = 0
         
-        for proposal in proposals:
-            success, staging_path, error = self.implement_proposal(proposal)
+        batches = group_proposals(proposals)
+        if len(batches) < len(proposals):
+            logger.info(f"Coalesced into {len(batches)} implementation units")
+        
+        for batch in batches:
+            success, staging_path, error = self.implement_batch(batch)
             
             if success:
-                implemented_count += 1
+                implemented_count += len(batch)
             else:
-                failed_count += 1
+                failed_count += len(batch)
                 logger.error(f"Failed: {error}")
         
         logger.info("="*60)
@@ -515,6 +333,8 @@ Manual implementation required.
         logger.info(f"Staging items: {len(os.listdir(self.staging_dir))}")
         logger.info("="*60)
         
+        self.status_log.close()
+        
         return implemented_count
 
 def main():
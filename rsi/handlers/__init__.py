@@ -0,0 +1,2 @@
+from .registry import HandlerRegistry, get_registry, get_handler
+__all__ = ['HandlerRegistry', 'get_registry', 'get_handler']
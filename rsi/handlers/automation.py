@@ -0,0 +1,59 @@
+"""
+Automation (e.g. content posting)
+Handlers: implement (Forge)
+"""
+
+import os
+import logging
+from typing import Dict
+
+VERSION = "1"
+MEMO_FIELDS = ["finding.type"]
+
+logger = logging.getLogger(__name__)
+
+
+def implement(agent, proposal: Dict, staging_path: str) -> bool:
+    """Implement automation (e.g., content posting)"""
+    # Create content deployment script
+
+    script_content = '''#!/bin/bash
+# Content deployment script
+# Generated by Forge Agent
+
+echo "📱 Deploying MarketingBot content..."
+
+# This would integrate with Instagram/LinkedIn APIs
+# For now, create manual posting guide
+
+cat << 'GUIDE'
+Manual Content Deployment Guide:
+
+1. Access content queue:
+   ls ~/.openclaw/workspace/marketingbot/content_queue/
+
+2. Post to Instagram:
+   - Copy content from JSON files
+   - Use Instagram Creator Studio or Later.com
+   - Schedule for optimal times (8am, 12pm, 6pm)
+
+3. Post to LinkedIn:
+   - Use professional tone
+   - Tag relevant hashtags
+   - Include call-to-action
+
+4. Track engagement:
+   - Monitor likes/comments
+   - Respond to inquiries
+   - Track lead conversions
+
+GUIDE
+
+echo "✅ Deployment guide created"
+'''
+    script_path = os.path.join(staging_path, "deploy_content.sh")
+    with open(script_path, 'w') as f:
+        f.write(script_content)
+    os.chmod(script_path, 0o755)
+
+    return True
@@ -0,0 +1,62 @@
+"""
+High error rates in logs
+Handlers: implement (Forge), validate (Crucible)
+"""
+
+import os
+import logging
+from typing import Dict, Tuple
+
+from common.rules import Rule, RuleSet
+
+VERSION = "1"
+MEMO_FIELDS = ["finding.type"]
+
+logger = logging.getLogger(__name__)
+
+# A unit meeting all three rules scores exactly 0.8 and passes (see rules.py)
+RULES = RuleSet([
+    Rule("Analysis script exists", "analyze_errors.sh", check="exists", weight=0.5,
+         required=True, missing="Analysis script missing"),
+    Rule("Uses grep for filtering", "analyze_errors.sh", any_of=["grep"], weight=0.2),
+    Rule("Searches for error patterns", "analyze_errors.sh", any_of=["ERROR", "Exception"], weight=0.1),
+])
+
+
+def implement(agent, proposal: Dict, staging_path: str) -> bool:
+    """Fix high error rates in logs"""
+    # Implementation would analyze logs and create fixes
+    # For now, create diagnostic script
+
+    script_content = '''#!/bin/bash
+# Error analysis script
+# Generated by Forge Agent
+
+echo "🔍 Analyzing errors..."
+
+LOGS=(
+    "/tmp/fred_bot.log"
+    "/tmp/watchdog_v3.log"
+    "/tmp/coordinator.log"
+)
+
+for log in "${LOGS[@]}"; do
+    if [ -f "$log" ]; then
+        echo ""
+        echo "=== $log ==="
+        echo "Recent errors:"
+        tail -50 "$log" | grep -E "(ERROR|Exception)" | tail -10
+    fi
+done
+'''
+    script_path = os.path.join(staging_path, "analyze_errors.sh")
+    with open(script_path, 'w') as f:
+        f.write(script_content)
+    os.chmod(script_path, 0o755)
+
+    return True
+
+
+def validate(agent, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
+    """Validate error analysis scripts"""
+    return RULES.evaluate(staging_path, agent.pass_threshold)
@@ -0,0 +1,76 @@
+"""
+Generic fallback for unknown proposal types
+Handlers: implement (Forge), validate (Crucible), deploy (Warden)
+"""
+
+import os
+import logging
+from typing import Dict, Tuple
+
+from common.artifact_store import load_tree
+from common.rules import Rule, RuleSet
+
+VERSION = "2"
+MEMO_FIELDS = [
+    "finding.type",
+    "proposal.title",
+    "proposal.description",
+    "proposal.priority",
+    "proposal.estimated_effort_hours",
+]
+
+logger = logging.getLogger(__name__)
+
+RULES = RuleSet([
+    Rule("Contains files", "*", check="exists", weight=0.3),
+    Rule("Has documentation", "README.md", check="exists", weight=0.2),
+], base=0.5, title="ℹ️  Generic validation (unknown type)")
+
+
+def implement(agent, proposal: Dict, staging_path: str) -> bool:
+    """Generic implementation for unknown types"""
+    readme_content = f'''# Implementation: {proposal['proposal']['title']}
+
+## Description
+{proposal['proposal']['description']}
+
+## Status
+Generic implementation template created.
+Manual implementation required.
+
+## Notes
+- Type: {proposal['finding'].get('type', 'unknown')}
+- Priority: {proposal['proposal'].get('priority', 'medium')}
+- Estimated effort: {proposal['proposal'].get('estimated_effort_hours', 4)} hours
+'''
+    readme_path = os.path.join(staging_path, "README.md")
+    with open(readme_path, 'w') as f:
+        f.write(readme_content)
+
+    return True
+
+
+def validate(agent, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
+    """Generic validation for unknown types"""
+    return RULES.evaluate(staging_path, agent.pass_threshold)
+
+
+def deploy(agent, staging_path: str, validation: Dict) -> bool:
+    """Generic deployment - release staged artifacts, exposed as deployed/<staging_id>"""
+    deployment_id = validation.get('metadata', {}).get('staging_id')
+    deployed_path = os.path.join(agent.deployed_dir, deployment_id)
+
+    # Staging dirs from before the artifact store are ingested on the fly
+    artifacts = load_tree(staging_path) or agent.store.ingest_tree(staging_path)
+
+    manifest = os.path.join(staging_path, "manifest.json")
+    if os.path.exists(manifest) and "manifest.json" not in artifacts:
+        artifacts = dict(artifacts, **{"manifest.json": agent.store.put_file(manifest)})
+
+    release = agent.releases.publish(deployment_id, deployment_id, artifacts)
+    agent.releases.expose(deployment_id, deployed_path)
+
+    logger.info(f"Generic deployment released to: {deployed_path} -> {release['release_id']} "
+                f"({len(artifacts)} artifacts)")
+
+    return True
@@ -0,0 +1,129 @@
+"""
+Process failures (e.g. Concierge Bot not running)
+Handlers: implement (Forge), validate (Crucible), deploy (Warden)
+"""
+
+import os
+import logging
+from typing import Dict, Tuple
+
+from common.artifact_store import load_tree
+from common.health import Probe
+from common.rules import Rule, RuleSet
+
+AUTOMATION_DIR = "/Users/fredericklaw/.openclaw/workspace/automation"
+# Staged script -> name under AUTOMATION_DIR
+LIVE_NAMES = {
+    "restart_concierge.sh": "auto_restart_concierge.sh",
+    "monitor_concierge.sh": "monitor_concierge.sh",
+}
+VERSION = "3"
+MEMO_FIELDS = ["finding.type", "finding.component"]
+
+logger = logging.getLogger(__name__)
+
+# Canary: the restarted bot must stay up and its log must stay mostly clean
+PROBES = [
+    Probe("Concierge Bot running", "process", pattern="fred_pt_bot.py"),
+    Probe("Concierge Bot log error rate", "log_errors", path="/tmp/fred_bot.log", max_error_rate=0.2),
+]
+
+# Sandbox scenario: the bot is found running once the script has (re)started it
+SANDBOX_STUBS = {
+    "restart_concierge.sh": {"pgrep": 0},
+    "monitor_concierge.sh": {"pgrep": 0},
+}
+
+RULES = RuleSet([
+    Rule("Restart script exists", "restart_concierge.sh", check="exists", weight=0.3,
+         required=True, missing="Restart script missing"),
+    Rule("Script is executable", "restart_concierge.sh", check="executable", weight=0.1,
+         missing="Script not executable"),
+    Rule("Contains process management logic", "restart_concierge.sh",
+         all_of=["pkill", "python3"], weight=0.2),
+    Rule("Has timing delays", "restart_concierge.sh", any_of=["sleep"], weight=0.1),
+    Rule("Monitor script exists", "monitor_concierge.sh", check="exists", weight=0.2),
+])
+
+
+def implement(agent, proposal: Dict, staging_path: str) -> bool:
+    """Fix a process failure (e.g., bot not running)"""
+    component = proposal['finding'].get('component', 'unknown')
+
+    logger.info(f"Creating fix for process: {component}")
+
+    # Create restart script
+    if component == 'concierge_bot':
+        script_content = '''#!/bin/bash
+# Auto-generated restart script for Concierge Bot
+# Generated by Forge Agent
+
+echo "🔧 Restarting Concierge Bot..."
+
+# Kill existing processes
+pkill -f fred_pt_bot.py 2>/dev/null
+sleep 2
+
+# Start bot
+cd /Users/fredericklaw/.openclaw/workspace/automation
+nohup python3 fred_pt_bot.py > /tmp/fred_bot.log 2>&1 &
+sleep 3
+
+# Verify
+if pgrep -f fred_pt_bot.py > /dev/null; then
+    echo "✅ Concierge Bot restarted successfully"
+    exit 0
+else
+    echo "❌ Failed to restart"
+    exit 1
+fi
+'''
+        script_path = os.path.join(staging_path, "restart_concierge.sh")
+        with open(script_path, 'w') as f:
+            f.write(script_content)
+        os.chmod(script_path, 0o755)
+
+        # Create monitoring script (calls the live restart script, never staging,
+        # which is archived once deployed)
+        monitor_content = '''#!/bin/bash
+# Monitor script - runs every 5 minutes via cron
+
+if ! pgrep -f fred_pt_bot.py > /dev/null; then
+    echo "$(date): Concierge Bot down, restarting..." >> /tmp/bot_monitor.log
+    ''' + os.path.join(AUTOMATION_DIR, LIVE_NAMES["restart_concierge.sh"]) + '''
+fi
+'''
+        monitor_path = os.path.join(staging_path, "monitor_concierge.sh")
+        with open(monitor_path, 'w') as f:
+            f.write(monitor_content)
+        os.chmod(monitor_path, 0o755)
+
+        return True
+
+    return False
+
+
+def validate(agent, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
+    """Validate process restart/fix scripts"""
+    return RULES.evaluate(staging_path, agent.pass_threshold)
+
+
+def deploy(agent, staging_path: str, validation: Dict) -> bool:
+    """Deploy process restart scripts"""
+    restart_script = os.path.join(staging_path, "restart_concierge.sh")
+
+    # Publish as a release of the automation dir (links + one symlink swap)
+    artifacts = load_tree(staging_path) or agent.store.ingest_tree(staging_path)
+    files = {
+        live_name: agent.store.with_mode(artifacts[staged], True)
+        for staged, live_name in LIVE_NAMES.items() if staged in artifacts
+    }
+    if files:
+        staging_id = validation.get('metadata', {}).get('staging_id')
+        release = agent.releases.publish("automation", staging_id, files, live_dir=AUTOMATION_DIR)
+        logger.info(f"Process fix released: automation@{release['release_id']}")
+        if "auto_restart_concierge.sh" in files:
+            restart_script = os.path.join(AUTOMATION_DIR, "auto_restart_concierge.sh")
+
+    # Restart to apply (once per Warden transaction, after all changes are live)
+    return agent.restart_service("concierge_bot", ["bash", restart_script])
@@ -0,0 +1,189 @@
+"""
+RSI HANDLER REGISTRY
+Dispatch table mapping proposal type -> implementer / validator / deployer
+
+Each proposal type lives in one handler module exposing any of:
+  implement(agent, proposal, staging_path) -> bool               (Forge)
+  validate(agent, staging_path, manifest) -> (bool, float, str)  (Crucible)
+  deploy(agent, staging_path, validation) -> bool                (Warden)
+
+Optional module attributes:
+  VERSION      - bump when output changes; keys Forge/Crucible caches
+  MEMO_FIELDS  - dotted proposal fields implement() reads; enables memoization
+  RULES        - common.rules.RuleSet behind validate(); its fingerprint is
+                 folded into the validate version so rule edits bust caches
+  PROBES       - common.health.Probe list the Warden polls during the canary
+                 window after deploy()
+  TRANSACTIONAL - False if deploy() has side effects a rollback cannot undo
+                 (installs, cleanups); the Warden deploys such changes in a
+                 transaction of their own (default True)
+  SANDBOX_STUBS - {staged script: {binary: exit code}} the Crucible sandbox
+                 stubs report while running that script (common.sandbox);
+                 folded into the validate version like RULES
+
+Sources, highest precedence first:
+  1. Plugin directory: rsi/plugins/<proposal_type>.py
+  2. Entry points in group "rsi.handlers" (name = proposal type)
+  3. Built-in modules in this package
+
+Only names are collected up front. A handler module is imported the first
+time one of its roles is requested, so each pillar loads only the handler
+modules for the proposal types it actually processes.
+"""
+
+import os
+import json
+import hashlib
+import importlib
+import importlib.util
+import logging
+from typing import Callable, Dict, List, Optional
+
+RSI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGINS_DIR = os.path.join(RSI_DIR, "plugins")
+ENTRY_POINT_GROUP = "rsi.handlers"
+FALLBACK_TYPE = "generic"
+
+ROLES = ("implement", "validate", "deploy")
+
+BUILTIN_HANDLERS = {
+    "process_failure": "handlers.process_failure",
+    "resource_constraint": "handlers.resource_constraint",
+    "error_rate": "handlers.error_rate",
+    "architecture_improvement": "handlers.architecture_improvement",
+    "automation": "handlers.automation",
+    "revenue_optimization": "handlers.revenue_optimization",
+    "generic": "handlers.generic",
+}
+
+logger = logging.getLogger(__name__)
+
+
+class HandlerRegistry:
+    """
+    Lazily-loaded proposal type -> handler module table
+    """
+
+    def __init__(self, plugins_dir: str = PLUGINS_DIR, use_entry_points: bool = True):
+        self.plugins_dir = plugins_dir
+        self.use_entry_points = use_entry_points
+        self._sources: Optional[Dict[str, tuple]] = None
+        self._modules: Dict[str, object] = {}
+
+    def _discover(self) -> Dict[str, tuple]:
+        """Collect (kind, target) per type without importing anything"""
+        sources = {ptype: ("module", name) for ptype, name in BUILTIN_HANDLERS.items()}
+
+        if self.use_entry_points:
+            try:
+                from importlib.metadata import entry_points
+                for ep in entry_points(group=ENTRY_POINT_GROUP):
+                    sources[ep.name] = ("entry_point", ep)
+            except Exception as e:
+                logger.warning(f"Could not read {ENTRY_POINT_GROUP} entry points: {e}")
+
+        if os.path.isdir(self.plugins_dir):
+            for filename in sorted(os.listdir(self.plugins_dir)):
+                if filename.endswith('.py') and not filename.startswith('_'):
+                    sources[filename[:-3]] = ("file", os.path.join(self.plugins_dir, filename))
+
+        return sources
+
+    @property
+    def sources(self) -> Dict[str, tuple]:
+        if self._sources is None:
+            self._sources = self._discover()
+        return self._sources
+
+    def types(self) -> List[str]:
+        """All registered proposal types"""
+        return sorted(self.sources)
+
+    def _load(self, proposal_type: str):
+        if proposal_type in self._modules:
+            return self._modules[proposal_type]
+
+        kind, target = self.sources[proposal_type]
+        if kind == "module":
+            module = importlib.import_module(target)
+        elif kind == "entry_point":
+            module = target.load()
+        else:
+            spec = importlib.util.spec_from_file_location(f"rsi_plugin_{proposal_type}", target)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+        logger.info(f"Loaded {proposal_type} handlers ({kind})")
+        self._modules[proposal_type] = module
+        return module
+
+    def _resolve(self, proposal_type: str, role: str):
+        """Module that provides role for proposal_type (generic fallback)"""
+        if role not in ROLES:
+            raise ValueError(f"Unknown handler role: {role}")
+
+        if proposal_type in self.sources:
+            module = self._load(proposal_type)
+            if getattr(module, role, None) is not None:
+                return module
+
+        return self._load(FALLBACK_TYPE)
+
+    def get(self, proposal_type: str, role: str) -> Callable:
+        """
+        Resolve the handler for a proposal type and role
+
+        Falls back to the generic handler when the type is unknown or its
+        module does not implement the requested role.
+        """
+        return getattr(self._resolve(proposal_type, role), role)
+
+    def version(self, proposal_type: str, role: str = "implement") -> str:
+        """VERSION of the module serving role (used to key caches), "0" if undeclared"""
+        module = self._resolve(proposal_type, role)
+        version = str(getattr(module, "VERSION", "0"))
+        rules = getattr(module, "RULES", None)
+        if role == "validate" and rules is not None:
+            version += "+" + rules.fingerprint()
+        stubs = getattr(module, "SANDBOX_STUBS", None)
+        if role == "validate" and stubs:
+            encoded = json.dumps(stubs, sort_keys=True).encode()
+            version += "+" + hashlib.sha256(encoded).hexdigest()[:12]
+        return version
+
+    def memo_fields(self, proposal_type: str) -> Optional[List[str]]:
+        """
+        Proposal fields the implementer's output depends on (MEMO_FIELDS)
+        None means the output is not a pure function of the proposal and
+        must not be memoized.
+        """
+        fields = getattr(self._resolve(proposal_type, "implement"), "MEMO_FIELDS", None)
+        return list(fields) if fields is not None else None
+
+    def probes(self, proposal_type: str) -> list:
+        """Canary health probes of the module serving deploy (PROBES, empty if undeclared)"""
+        return list(getattr(self._resolve(proposal_type, "deploy"), "PROBES", None) or [])
+
+    def transactional(self, proposal_type: str) -> bool:
+        """Whether the deployer's effects are fully undone by a release rollback"""
+        return bool(getattr(self._resolve(proposal_type, "deploy"), "TRANSACTIONAL", True))
+
+    def sandbox_stubs(self, proposal_type: str, rel_path: str) -> Dict[str, int]:
+        """Stub exit codes the validator's module declares for one staged script"""
+        stubs = getattr(self._resolve(proposal_type, "validate"), "SANDBOX_STUBS", None) or {}
+        return dict(stubs.get(rel_path, {}))
+
+
+_default_registry: Optional[HandlerRegistry] = None
+
+
+def get_registry() -> HandlerRegistry:
+    """Process-wide registry shared by all pillars"""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = HandlerRegistry()
+    return _default_registry
+
+
+def get_handler(proposal_type: str, role: str) -> Callable:
+    return get_registry().get(proposal_type, role)
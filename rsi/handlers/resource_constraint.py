@@ -0,0 +1,78 @@
+"""
+Resource constraints (e.g. disk space)
+Handlers: implement (Forge), validate (Crucible), deploy (Warden)
+"""
+
+import os
+import logging
+from typing import Dict, Tuple
+
+from common.rules import Rule, RuleSet
+
+VERSION = "1"
+MEMO_FIELDS = ["finding.type", "finding.component"]
+# Deleted files are not restored by a rollback
+TRANSACTIONAL = False
+
+logger = logging.getLogger(__name__)
+
+RULES = RuleSet([
+    Rule("Cleanup script exists", "cleanup_disk.sh", check="exists", weight=0.4,
+         required=True, missing="Cleanup script missing"),
+    Rule("Uses find command", "cleanup_disk.sh", any_of=["find"], weight=0.2),
+    Rule("Has deletion logic", "cleanup_disk.sh", any_of=["delete"], ignore_case=True, weight=0.2),
+    Rule("Uses age filtering", "cleanup_disk.sh", any_of=["mtime", "-mmin"], weight=0.1),
+])
+
+
+def implement(agent, proposal: Dict, staging_path: str) -> bool:
+    """Fix resource constraints (e.g., disk space)"""
+    component = proposal['finding'].get('component', 'unknown')
+
+    if component == 'disk_space':
+        script_content = '''#!/bin/bash
+# Disk cleanup script
+# Generated by Forge Agent
+
+echo "🧹 Cleaning disk space..."
+
+# Clean old logs
+echo "Removing old logs..."
+find /tmp -name "*.log" -mtime +7 -delete 2>/dev/null
+find ~/.openclaw/workspace -name "*.log" -mtime +7 -delete 2>/dev/null
+
+# Clean Python cache
+echo "Cleaning Python cache..."
+find ~/.openclaw/workspace -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null
+
+# Clean old screenshots
+echo "Cleaning old screenshots..."
+find /tmp -name "bolt_*.png" -mtime +1 -delete 2>/dev/null
+
+echo "✅ Cleanup complete"
+df -h /Users
+'''
+        script_path = os.path.join(staging_path, "cleanup_disk.sh")
+        with open(script_path, 'w') as f:
+            f.write(script_content)
+        os.chmod(script_path, 0o755)
+
+        return True
+
+    return False
+
+
+def validate(agent, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
+    """Validate resource cleanup scripts"""
+    return RULES.evaluate(staging_path, agent.pass_threshold)
+
+
+def deploy(agent, staging_path: str, validation: Dict) -> bool:
+    """Deploy resource cleanup scripts"""
+    cleanup_script = os.path.join(staging_path, "cleanup_disk.sh")
+
+    # Runs once the Warden transaction has committed, never before
+    if os.path.exists(cleanup_script):
+        return agent.run_after_commit("resource_cleanup", ["bash", cleanup_script], timeout=60)
+
+    return True
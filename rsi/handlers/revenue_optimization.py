@@ -0,0 +1,136 @@
+"""
+Revenue optimizations (e.g. Stripe deposits)
+Handlers: implement (Forge), validate (Crucible), deploy (Warden)
+"""
+
+import os
+import logging
+from typing import Dict, Tuple
+
+from common.artifact_store import load_tree
+from common.rules import Rule, RuleSet
+
+AUTOMATION_DIR = "/Users/fredericklaw/.openclaw/workspace/automation"
+VERSION = "1"
+MEMO_FIELDS = ["finding.type"]
+# An installed package is not removed by a rollback
+TRANSACTIONAL = False
+
+logger = logging.getLogger(__name__)
+
+RULES = RuleSet([
+    Rule("Stripe integration code exists", "stripe_integration.py", check="exists", weight=0.4,
+         required=True, missing="Stripe code missing"),
+    Rule("Imports Stripe library", "stripe_integration.py", any_of=["import stripe"], weight=0.2),
+    Rule("Has session creation", "stripe_integration.py", any_of=["create_deposit_session"], weight=0.2),
+    Rule("Uses Checkout Sessions", "stripe_integration.py", any_of=["checkout.Session"], weight=0.1),
+    Rule("Setup documentation exists", "STRIPE_SETUP.md", check="exists", weight=0.1),
+])
+
+
+def implement(agent, proposal: Dict, staging_path: str) -> bool:
+    """Implement revenue optimizations"""
+    # Create Stripe integration starter
+
+    code_content = '''# Stripe Integration for Booking Bot
+# Generated by Forge Agent
+
+import stripe
+import os
+from typing import Optional
+
+class StripeBookingIntegration:
+    """
+    Handles booking deposits via Stripe
+    """
+    
+    def __init__(self):
+        # Use environment variable for security
+        stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+        
+    def create_deposit_session(self, client_email: str, amount_cents: int = 5000) -> Optional[str]:
+        """
+        Create a Stripe checkout session for booking deposit
+        Default: $50 deposit (5000 cents)
+        """
+        try:
+            session = stripe.checkout.Session.create(
+                payment_method_types=['card'],
+                line_items=[{
+                    'price_data': {
+                        'currency': 'sgd',
+                        'product_data': {
+                            'name': 'PT Session Deposit',
+                            'description': 'Booking deposit for personal training session',
+                        },
+                        'unit_amount': amount_cents,
+                    },
+                    'quantity': 1,
+                }],
+                mode='payment',
+                success_url='https://your-domain.com/success',
+                cancel_url='https://your-domain.com/cancel',
+                customer_email=client_email,
+            )
+            return session.url
+        except Exception as e:
+            print(f"Error creating session: {e}")
+            return None
+
+# Usage:
+# stripe = StripeBookingIntegration()
+# payment_url = stripe.create_deposit_session("client@email.com")
+'''
+    code_path = os.path.join(staging_path, "stripe_integration.py")
+    with open(code_path, 'w') as f:
+        f.write(code_content)
+
+    # Create setup instructions
+    setup_content = '''# Stripe Integration Setup
+
+1. Install Stripe:
+   pip install stripe
+
+2. Set environment variable:
+   export STRIPE_SECRET_KEY="sk_live_..."
+
+3. Add to booking bot flow:
+   - Before confirming booking
+   - Generate payment URL
+   - Send to client via Telegram
+   - Confirm booking only after payment
+
+4. Webhook setup (for production):
+   - Configure Stripe webhook
+   - Listen for payment_intent.succeeded
+   - Auto-confirm booking on payment
+'''
+    setup_path = os.path.join(staging_path, "STRIPE_SETUP.md")
+    with open(setup_path, 'w') as f:
+        f.write(setup_content)
+
+    return True
+
+
+def validate(agent, staging_path: str, manifest: Dict) -> Tuple[bool, float, str]:
+    """Validate revenue optimization code"""
+    return RULES.evaluate(staging_path, agent.pass_threshold)
+
+
+def deploy(agent, staging_path: str, validation: Dict) -> bool:
+    """Deploy revenue optimization code"""
+    artifacts = load_tree(staging_path) or agent.store.ingest_tree(staging_path)
+
+    if "stripe_integration.py" in artifacts:
+        staging_id = validation.get('metadata', {}).get('staging_id')
+        release = agent.releases.publish(
+            "automation", staging_id, {"stripe_integration.py": artifacts["stripe_integration.py"]},
+            live_dir=AUTOMATION_DIR
+        )
+        logger.info(f"Stripe integration code deployed: automation@{release['release_id']}")
+
+    # Install stripe once the Warden transaction has committed
+    agent.run_after_commit("install_stripe", ["pip", "install", "stripe", "--quiet"],
+                           timeout=60, required=False)
+
+    return True
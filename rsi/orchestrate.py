@@ -9,7 +9,12 @@ Usage:
   python3 orchestrate.py --forager       # Run Forager only
   python3 orchestrate.py --forge         # Run Forge only
   python3 orchestrate.py --crucible      # Run Crucible only
+  python3 orchestrate.py --crucible --workers 4   # Crucible on 4 processes
   python3 orchestrate.py --warden        # Run Warden only
+  python3 orchestrate.py --rollback 1    # Undo the last deployment
+  python3 orchestrate.py --rollback <staging_id>   # Restore that deployment
+  python3 orchestrate.py --archive       # Pack terminal items out of the hot dirs
+  python3 orchestrate.py --archived <id> # Print an archived item
 """
 
 import os
@@ -109,7 +114,7 @@ class RSIOrchestrator:
         try:
             import subprocess
             result = subprocess.run(
-                ["python3", script_path],
+                ["python3", script_path] + pillar.get("args", []),
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minute timeout per pillar
@@ -177,6 +182,9 @@ class RSIOrchestrator:
         logger.info("-"*70)
         results["warden"] = self.run_pillar("warden")
         
+        # Housekeeping: keep the hot directories small
+        self.archive()
+        
         # Summary
         logger.info("")
         logger.info("="*70)
@@ -202,6 +210,18 @@ class RSIOrchestrator:
         
         return success_count == total_count
     
+    def archive(self) -> Dict[str, int]:
+        """Move terminal-state items into the archive packfiles"""
+        from common.archive import Archiver
+        try:
+            counts = Archiver().run()
+        except Exception as e:
+            logger.error(f"❌ Archiving failed: {e}")
+            return {}
+        if counts:
+            logger.info("📦 Archived: " + ", ".join(f"{n} {kind}" for kind, n in sorted(counts.items())))
+        return counts
+    
     def get_status(self) -> Dict:
         """Get current system status"""
         status = {
@@ -307,6 +327,30 @@ def main():
         help="Run Warden only"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Crucible worker processes (0 = one per CPU core)"
+    )
+    
+    parser.add_argument(
+        "--rollback",
+        metavar="STAGING_ID|N",
+        help="Restore the release of a staging id, or undo the last N deployments"
+    )
+    
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Move terminal-state items into the archive packfiles"
+    )
+    
+    parser.add_argument(
+        "--archived",
+        metavar="ID",
+        help="Print an archived item by name (or kind:name)"
+    )
+    
     parser.add_argument(
         "--halt",
         action="store_true",
@@ -322,6 +366,8 @@ def main():
     args = parser.parse_args()
     
     orchestrator = RSIOrchestrator()
+    if args.workers is not None:
+        orchestrator.pillars["crucible"]["args"] = ["--workers", str(args.workers)]
     
     # Handle halt/resume
     if args.halt:
@@ -341,6 +387,25 @@ def main():
             print("ℹ️  System was not halted")
         return 0
     
+    # Rollback runs even while halted: it is how a bad deploy is recovered
+    if args.rollback:
+        orchestrator.pillars["warden"]["args"] = ["--rollback", args.rollback]
+        success = orchestrator.run_pillar("warden")
+        return 0 if success else 1
+    
+    if args.archive:
+        orchestrator.archive()
+        return 0
+    
+    if args.archived:
+        from common.archive import PackArchive
+        records = PackArchive().get(args.archived)
+        if not records:
+            print(f"❌ Not in archive: {args.archived}")
+            return 1
+        print(json.dumps(records, indent=2))
+        return 0
+    
     # Show status
     if args.status:
         orchestrator.print_status()
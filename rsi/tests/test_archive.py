@@ -0,0 +1,64 @@
+"""
+ARCHIVER TESTS
+Only reports nobody will look at again leave the validation dir
+
+Run: python3 -m unittest discover rsi/tests
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import archive
+from common.archive import Archiver, PackArchive
+from common.deployed_index import DeployedIndex
+
+
+class ArchiverSettledTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="archive_test_")
+        self.dirs = {name: os.path.join(self.root, name.lower())
+                     for name in ("VALIDATION_DIR", "DEPLOYED_DIR", "STAGING_DIR",
+                                  "PROPOSALS_DIR", "IMPLEMENTED_DIR", "RELEASES_DIR")}
+        for name in ("VALIDATION_DIR", "DEPLOYED_DIR"):
+            os.makedirs(self.dirs[name])
+        patcher = mock.patch.multiple(archive, **self.dirs)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.archiver = Archiver(PackArchive(os.path.join(self.root, "packs")), min_age=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _report(self, staging_id: str) -> str:
+        filename = f"val_{staging_id}_1700000000.json"
+        with open(os.path.join(self.dirs["VALIDATION_DIR"], filename), 'w') as f:
+            json.dump({"result": {"passed": True}}, f)
+        return filename
+
+    def test_escalated_reports_stay_until_a_human_decides(self):
+        escalated = self._report("forge_escalated")
+        rejected = self._report("forge_rejected")
+        canary_failed = self._report("forge_canary")
+        index = DeployedIndex(self.dirs["DEPLOYED_DIR"])
+        index.settle({escalated: "escalated", rejected: "rejected", canary_failed: "canary_failed"})
+
+        names = {name for kind, name, _ in self.archiver.candidates() if kind == "validation"}
+
+        self.assertNotIn(escalated[:-len(".json")], names)
+        self.assertEqual(names, {rejected[:-len(".json")], canary_failed[:-len(".json")]})
+
+    def test_approved_unsettled_reports_stay(self):
+        self._report("forge_waiting")
+        self.assertEqual(self.archiver.candidates(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
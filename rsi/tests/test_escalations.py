@@ -0,0 +1,54 @@
+"""
+ESCALATION QUEUE TESTS
+A staging id escalates once, however many others came after it
+
+Run: python3 -m unittest discover rsi/tests
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.escalations import EscalationQueue, MAX_STAGING_IDS
+
+
+class EscalationDedupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="escalations_test_")
+        self.queue = EscalationQueue(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _add(self, staging_id: str) -> bool:
+        return self.queue.add("Safety violation", "process_failure", "lineage_a", staging_id)
+
+    def test_evicted_staging_ids_are_not_recounted(self):
+        ids = [f"forge_p{i}" for i in range(MAX_STAGING_IDS + 5)]
+        for staging_id in ids:
+            self._add(staging_id)
+        for staging_id in ids:
+            self.assertFalse(self._add(staging_id))
+
+        item, = self.queue.pending()
+        self.assertEqual(item["count"], len(ids))
+        self.assertEqual(item["pending"], len(ids))
+        self.assertEqual(item["staging_ids"], ids[-MAX_STAGING_IDS:])
+
+    def test_dedup_survives_a_reload(self):
+        ids = [f"forge_p{i}" for i in range(MAX_STAGING_IDS + 1)]
+        for staging_id in ids:
+            self._add(staging_id)
+
+        self.queue = EscalationQueue(self.root)
+        self.assertFalse(self._add(ids[0]))
+        self.assertEqual(self.queue.pending()[0]["pending"], len(ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
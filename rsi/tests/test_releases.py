@@ -0,0 +1,76 @@
+"""
+RELEASE STORE TESTS
+Live links must follow `current` through deploys, reverts and rollbacks
+
+Run: python3 -m unittest discover rsi/tests
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.artifact_store import ArtifactStore
+from common.releases import ReleaseStore
+
+
+class ReleaseLinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="releases_test_")
+        self.live_dir = os.path.join(self.root, "automation")
+        self.store = ArtifactStore(os.path.join(self.root, "store"))
+        self.releases = ReleaseStore(self.store, os.path.join(self.root, "releases"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _entry(self, name: str, content: str):
+        path = os.path.join(self.root, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return self.store.put_file(path)
+
+    def test_reverted_first_release_leaves_no_links(self):
+        mark = self.releases.mark()
+        self.releases.publish("automation", "forge_a", {
+            "monitor_concierge.sh": self._entry("m", "monitor"),
+            "auto_restart_concierge.sh": self._entry("r", "restart"),
+        }, live_dir=self.live_dir)
+        self.assertTrue(os.path.islink(os.path.join(self.live_dir, "monitor_concierge.sh")))
+
+        restored = self.releases.revert_to(mark)
+
+        self.assertEqual(restored, {"automation": None})
+        self.assertEqual(os.listdir(self.live_dir), [])
+
+    def test_revert_drops_only_the_links_it_added(self):
+        self.releases.publish("automation", "forge_a", {"a.sh": self._entry("a", "a")},
+                              live_dir=self.live_dir)
+        mark = self.releases.mark()
+        self.releases.publish("automation", "forge_b", {"b.sh": self._entry("b", "b")},
+                              live_dir=self.live_dir)
+
+        self.releases.revert_to(mark)
+
+        self.assertEqual(os.listdir(self.live_dir), ["a.sh"])
+        with open(os.path.join(self.live_dir, "a.sh")) as f:
+            self.assertEqual(f.read(), "a")
+
+    def test_rollback_to_staging_restores_its_links(self):
+        mark = self.releases.mark()
+        self.releases.publish("automation", "forge_a", {"a.sh": self._entry("a", "a")},
+                              live_dir=self.live_dir)
+        self.releases.revert_to(mark)
+
+        self.releases.apply(self.releases.plan_staging("forge_a"))
+
+        with open(os.path.join(self.live_dir, "a.sh")) as f:
+            self.assertEqual(f.read(), "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,14 +10,31 @@ Output: Production deployment to deployed/ + live system
 """
 
 import os
+import sys
 import json
 import time
 import uuid
-import shutil
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import logging
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from handlers import get_handler, get_registry
+from common.artifact_store import ArtifactStore
+from common.releases import ReleaseStore
+from common.health import observe
+from common.batching import batch_key
+from common.deployed_index import DeployedIndex
+from common.escalations import EscalationQueue, make_notifier
+from common.validation_cache import lineage_key
+from common.constitution import CompiledConstitution, ConstitutionCache
+from common.benchmarks import BenchmarkBaselines
+from common.safety_manifest import SafetyManifests, SafetyManifestError, scan_staged
+
 # Configuration
 VALIDATION_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/validation"
 STAGING_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/staging"
@@ -26,6 +43,15 @@ LIVE_DIR = "/Users/fredericklaw/.openclaw"
 CONSTITUTION_DIR = "/Users/fredericklaw/.openclaw/workspace/projects/lobster-project/constitution"
 LOGS_DIR = "/Users/fredericklaw/.openclaw/workspace/rsi/logs"
 
+# Human escalations: one digest per interval to this notifier ("file:" or "unix:")
+ESCALATIONS_DIR = os.path.join(LOGS_DIR, "escalations")
+ESCALATION_NOTIFIER = f"file:{ESCALATIONS_DIR}/digests.jsonl"
+ESCALATION_DIGEST_INTERVAL = 15 * 60
+
+# Canary observation after activation (seconds)
+CANARY_WINDOW = 60
+CANARY_INTERVAL = 5
+
 def setup_logging():
     os.makedirs(LOGS_DIR, exist_ok=True)
     logging.basicConfig(
@@ -56,6 +82,16 @@ class WardenAgent:
         self.staging_dir = STAGING_DIR
         self.deployed_dir = DEPLOYED_DIR
         self.constitution_dir = CONSTITUTION_DIR
+        self.constitution = ConstitutionCache(os.path.join(CONSTITUTION_DIR, "CONSTITUTION.md"))
+        self.store = ArtifactStore()
+        self.releases = ReleaseStore(self.store)
+        self.baselines = BenchmarkBaselines()
+        self.safety = SafetyManifests()
+        self._restarts: Optional[Dict[str, List[str]]] = None
+        self._actions: Optional[Dict[str, Tuple[List[str], float, bool]]] = None
+        self.deployed_index = DeployedIndex(self.deployed_dir)
+        self.escalations = EscalationQueue(ESCALATIONS_DIR, ESCALATION_DIGEST_INTERVAL)
+        self.notifier = make_notifier(ESCALATION_NOTIFIER)
         
         os.makedirs(self.deployed_dir, exist_ok=True)
         os.makedirs(self.constitution_dir, exist_ok=True)
@@ -187,6 +223,33 @@ Every Warden decision MUST log:
 - Validation report reference
 - Deployed file hashes
 
+## ARTICLE VII: MACHINE-READABLE POLICY
+
+The Warden compiles this block. Type rules escalate matching proposal
+types to a human (Article II); forbidden patterns are Article I
+violations when found (case-insensitive) in staged files.
+
+```policy
+{
+  "human_required_types": [
+    {"equals": "network_config", "reason": "Network configuration changes"},
+    {"contains": "credential", "reason": "Credential modifications"},
+    {"contains": "api_key", "reason": "Credential modifications"},
+    {"contains": "delete", "reason": "Data destruction"},
+    {"contains": "purge", "reason": "Data destruction"},
+    {"equals": "system_modification", "reason": "System-level changes"}
+  ],
+  "forbidden_patterns": [
+    {"pattern": "rm -rf /", "reason": "Destructive deletion pattern"},
+    {"pattern": "chmod 777", "reason": "Overly permissive permissions"},
+    {"pattern": "password=", "reason": "Potential credential exposure"},
+    {"pattern": "api_key=", "reason": "Potential credential exposure"},
+    {"pattern": "eval(", "reason": "Dangerous eval usage"}
+  ],
+  "scan_suffixes": [".sh", ".py", ".json"]
+}
+```
+
 ---
 
 *This Constitution is immutable without human approval.*
@@ -198,39 +261,19 @@ Every Warden decision MUST log:
             
             logger.info(f"✅ Constitution created: {constitution_path}")
     
-    def load_constitution(self) -> Dict:
-        """Load and parse the Constitution"""
-        constitution_path = os.path.join(self.constitution_dir, "CONSTITUTION.md")
-        
-        try:
-            with open(constitution_path, 'r') as f:
-                content = f.read()
-            
-            # Parse key rules
-            rules = {
-                "never_expose_ports": True,
-                "never_share_credentials": True,
-                "never_delete_production_data": True,
-                "never_disable_security": True,
-                "requires_human_network_changes": True,
-                "requires_human_credential_changes": True,
-                "requires_human_data_deletion": True,
-                "min_crucible_score": 0.8,
-                "max_retries": 5
-            }
-            
-            return rules
-            
-        except Exception as e:
-            logger.error(f"Failed to load Constitution: {e}")
-            return {}
+    def load_constitution(self) -> CompiledConstitution:
+        """Compiled Constitution; re-parsed only when CONSTITUTION.md changes"""
+        return self.constitution.get()
     
     def poll_validations(self) -> List[Dict]:
         """Check for new validation reports from Crucible"""
         validations = []
         
         try:
-            files = [f for f in os.listdir(self.validation_dir) if f.endswith('.json')]
+            # Handled reports are skipped by name: no open, no marker stat
+            deployed = self.deployed_index.load()
+            all_files = os.listdir(self.validation_dir)
+            files = self.deployed_index.unhandled(all_files, deployed)
             
             for filename in files:
                 filepath = os.path.join(self.validation_dir, filename)
@@ -241,24 +284,40 @@ Every Warden decision MUST log:
                     # Only process if passed and not yet deployed
                     if validation.get('result', {}).get('passed') == True:
                         staging_id = validation.get('metadata', {}).get('staging_id')
-                        
-                        # Check if already deployed
-                        deployed_marker = os.path.join(
-                            self.deployed_dir, f"{staging_id}.deployed"
-                        )
-                        if not os.path.exists(deployed_marker):
+                        if staging_id not in deployed:
                             validation['_source_file'] = filename
                             validations.append(validation)
                             logger.info(f"Found approved validation: {filename}")
                             
                 except Exception as e:
                     logger.error(f"Failed to read {filename}: {e}")
+            
+            self.deployed_index.advance(all_files, [v['_source_file'] for v in validations])
                     
         except Exception as e:
             logger.error(f"Failed to poll validations: {e}")
         
         return validations
     
+    def _proposal_type(self, validation: Dict) -> str:
+        """Proposal type from the embedded proposal or the report metadata"""
+        proposal = validation.get('source_proposal', {})
+        proposal_type = proposal.get('finding', {}).get('type')
+        return proposal_type or validation.get('metadata', {}).get('proposal_type', 'unknown')
+    
+    def _deploy_units(self, validation: Dict) -> List[Tuple[str, str]]:
+        """Distinct (proposal_type, path) units; batched staging dirs have several"""
+        members = validation.get('metadata', {}).get('members')
+        if not members:
+            return [(self._proposal_type(validation), "")]
+        
+        units = []
+        for member in members:
+            unit = (member['proposal_type'], member['path'])
+            if unit not in units:
+                units.append(unit)
+        return units
+    
     def check_constitution(self, validation: Dict) -> Tuple[bool, List[str]]:
         """
         Check if deployment violates Constitution
@@ -270,215 +329,304 @@ Every Warden decision MUST log:
         staging_id = validation.get('metadata', {}).get('staging_id')
         staging_path = os.path.join(self.staging_dir, staging_id)
         
-        # Get proposal type
-        proposal = validation.get('source_proposal', {})
-        proposal_type = proposal.get('finding', {}).get('type', 'unknown')
+        # Get proposal types (several for a batched implementation)
+        proposal_types = [ptype for ptype, _ in self._deploy_units(validation)]
         
-        # Check 1: Crucible score
+        # Check 1: Crucible score (Article IV)
         score = validation.get('result', {}).get('score', 0)
-        min_score = constitution.get('min_crucible_score', 0.8)
+        min_score = constitution.min_crucible_score
         if score < min_score:
             violations.append(f"Score {score:.2f} below threshold {min_score}")
         
-        # Check 2: Network safety
-        if proposal_type == 'network_config':
-            violations.append("REQUIRES HUMAN: Network configuration changes (Article II)")
-        
-        # Check 3: Credential safety
-        if 'credential' in proposal_type.lower() or 'api_key' in proposal_type.lower():
-            violations.append("REQUIRES HUMAN: Credential modifications (Article II)")
-        
-        # Check 4: Data deletion safety
-        if 'delete' in proposal_type.lower() or 'purge' in proposal_type.lower():
-            violations.append("REQUIRES HUMAN: Data destruction (Article II)")
+        # Check 2: Types that always need a human (Article II)
+        for proposal_type in proposal_types:
+            for reason in constitution.human_required(proposal_type):
+                violations.append(f"REQUIRES HUMAN: {reason} (Article II)")
         
-        # Check 5: System integrity
-        if proposal_type == 'system_modification':
-            violations.append("REQUIRES HUMAN: System-level changes (Article II)")
-        
-        # Check files for dangerous patterns
+        # Check 3: Forbidden patterns in staged files (Article I). Forge's signed
+        # safety manifest carries the verdicts; rescan only if the policy changed.
         if os.path.exists(staging_path):
-            for root, dirs, files in os.walk(staging_path):
-                for file in files:
-                    if file.endswith(('.sh', '.py', '.json')):
-                        filepath = os.path.join(root, file)
-                        try:
-                            with open(filepath, 'r') as f:
-                                content = f.read().lower()
-                                
-                                dangerous_patterns = [
-                                    ('rm -rf /', 'Destructive deletion pattern'),
-                                    ('chmod 777', 'Overly permissive permissions'),
-                                    ('password=', 'Potential credential exposure'),
-                                    ('api_key=', 'Potential credential exposure'),
-                                    ('eval(', 'Dangerous eval usage'),
-                                ]
-                                
-                                for pattern, reason in dangerous_patterns:
-                                    if pattern in content:
-                                        violations.append(f"DANGEROUS PATTERN in {file}: {reason}")
-                        except:
-                            pass
+            try:
+                verdicts, status = self.safety.verify(staging_path, constitution)
+            except SafetyManifestError as e:
+                violations.append(f"SAFETY MANIFEST REJECTED: {e}")
+                verdicts, status = {}, "rejected"
+            
+            if verdicts is None:
+                logger.info(f"🔎 Safety manifest {status} for {staging_id} - rescanning")
+                verdicts = scan_staged(staging_path, constitution)
+            
+            for rel_path, verdict in sorted(verdicts.items()):
+                filename = os.path.basename(rel_path)
+                if verdict.get('error'):
+                    violations.append(f"UNSCANNABLE FILE {filename}: {verdict['error']}")
+                for finding in verdict['findings']:
+                    lines = ", ".join(str(n) for n in finding['lines'])
+                    violations.append(f"DANGEROUS PATTERN in {filename} (line {lines}): {finding['reason']}")
         
         compliant = len(violations) == 0
         return compliant, violations
     
-    def deploy_to_production(self, validation: Dict) -> bool:
+    def _source_proposal(self, validation: Dict) -> Dict:
+        """The proposal behind a validation, from Forge's manifest ({} if unreadable)"""
+        staging_id = validation.get('metadata', {}).get('staging_id')
+        try:
+            with open(os.path.join(self.staging_dir, staging_id, "manifest.json"), 'r') as f:
+                return json.load(f).get('source_proposal', {})
+        except (OSError, ValueError):
+            return {}
+    
+    def _service_key(self, validation: Dict) -> str:
+        """Service an approved change targets; compatible changes share one"""
+        proposal = self._source_proposal(validation)
+        if not proposal:
+            return f"staging:{validation.get('metadata', {}).get('staging_id')}"
+        return batch_key(proposal)
+    
+    def group_transactions(self, validations: List[Dict]) -> List[List[Dict]]:
         """
-        Deploy approved changes to production
-        Returns: success
+        Approved validations grouped by the service they touch, in arrival order.
+        A change whose deployer is not TRANSACTIONAL (a rollback cannot undo
+        it) always gets a transaction of its own.
         """
-        staging_id = validation.get('metadata', {}).get('staging_id')
-        staging_path = os.path.join(self.staging_dir, staging_id)
+        registry = get_registry()
+        groups: Dict[str, List[Dict]] = {}
+        for validation in validations:
+            key = self._service_key(validation)
+            if not all(registry.transactional(ptype) for ptype, _ in self._deploy_units(validation)):
+                key = f"solo:{validation.get('metadata', {}).get('staging_id')}"
+            groups.setdefault(key, []).append(validation)
+        return list(groups.values())
+    
+    def restart_service(self, service: str, command: List[str]) -> bool:
+        """
+        Called by deployers. Inside a transaction the restart is deferred and
+        runs once, after every change in the transaction is live.
+        """
+        if self._restarts is not None:
+            self._restarts[service] = command
+            return True
+        return self._run_restart(service, command)
+    
+    def run_after_commit(self, name: str, command: List[str], timeout: float = 60,
+                         required: bool = True) -> bool:
+        """
+        Called by deployers for one-off side effects (cleanups, installs).
+        Inside a transaction they run after commit() and before the restarts,
+        so a transaction that fails first never runs them. A rollback does
+        not undo them; such deployers declare TRANSACTIONAL = False.
+        """
+        if self._actions is not None:
+            self._actions[name] = (command, timeout, required)
+            return True
+        return self._run_action(name, command, timeout) or not required
+    
+    def _run_action(self, name: str, command: List[str], timeout: float) -> bool:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"Failed to run {name}: {e}")
+            return False
+        logger.info(f"⚙️  Ran {name}: exit {result.returncode}")
+        return result.returncode == 0
+    
+    def _run_restart(self, service: str, command: List[str]) -> bool:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"Failed to restart {service}: {e}")
+            return False
+        logger.info(f"🔁 Restarted {service}: exit {result.returncode}")
+        return result.returncode == 0
+    
+    def deploy_to_production(self, validations: List[Dict]) -> Optional[Dict]:
+        """
+        Activate a group of approved changes as one transaction and canary:
+        one release per touched target, each service restarted once
+        Returns: the canary to observe, None if the transaction failed
+        """
+        staging_ids = [v.get('metadata', {}).get('staging_id') for v in validations]
+        txn_id = f"txn_{int(time.time() * 1000)}_{staging_ids[0]}"
+        
+        logger.info(f"Deploying: {', '.join(staging_ids)}"
+                    + (f" (one transaction: {txn_id})" if len(staging_ids) > 1 else ""))
         
-        logger.info(f"Deploying: {staging_id}")
+        # Everything activated from here on is undone if the transaction fails
+        mark = self.releases.mark()
+        self.releases.begin(txn_id)
+        self._restarts = {}
+        self._actions = {}
+        committed = False
         
         try:
-            # Get proposal type for routing
-            proposal = validation.get('source_proposal', {})
-            proposal_type = proposal.get('finding', {}).get('type', 'unknown')
-            
-            # Deploy based on type
-            if proposal_type == 'process_failure':
-                success = self._deploy_process_fix(staging_path, validation)
-            elif proposal_type == 'resource_constraint':
-                success = self._deploy_resource_fix(staging_path, validation)
-            elif proposal_type == 'revenue_optimization':
-                success = self._deploy_revenue_opt(staging_path, validation)
-            else:
-                # Generic deployment
-                success = self._deploy_generic(staging_path, validation)
+            # Deploy each unit with its registered deployer (generic if unknown)
+            success = True
+            probes = {}
+            for validation in validations:
+                staging_path = os.path.join(self.staging_dir, validation['metadata']['staging_id'])
+                for proposal_type, path in self._deploy_units(validation):
+                    deploy = get_handler(proposal_type, 'deploy')
+                    unit_path = os.path.join(staging_path, path) if path else staging_path
+                    if not deploy(self, unit_path, validation):
+                        success = False
+                    for probe in get_registry().probes(proposal_type):
+                        probes.setdefault(probe.description, probe)
             
             if success:
-                # Mark as deployed
-                deployed_marker = os.path.join(
-                    self.deployed_dir, f"{staging_id}.deployed"
-                )
-                with open(deployed_marker, 'w') as f:
-                    f.write(datetime.now().isoformat())
-                
-                logger.info(f"✅ Successfully deployed: {staging_id}")
-                return True
-            else:
-                logger.error(f"❌ Deployment failed: {staging_id}")
-                return False
+                self.releases.commit(staging_ids)
+                committed = True
+                for name, (command, timeout, required) in self._actions.items():
+                    if not self._run_action(name, command, timeout) and required:
+                        success = False
+                for service, command in self._restarts.items():
+                    if not self._run_restart(service, command):
+                        success = False
+            
+            if not success:
+                logger.error(f"❌ Deployment failed: {', '.join(staging_ids)}")
+                self._revert(txn_id, mark)
+                if committed:
+                    self._restart_reverted(self._restarts)
+                return None
+            
+            activations = [e for e in self.releases.journal(mark) if e['action'] != 'adopt']
+            if probes:
+                logger.info(f"🐤 Canary: {txn_id} ({len(probes)} probe(s), {CANARY_WINDOW}s window)")
+            return {
+                "staging_id": txn_id,
+                "validations": validations,
+                "activations": activations,
+                "probes": list(probes.values()),
+                "restarts": dict(self._restarts),
+            }
                 
         except Exception as e:
             logger.error(f"❌ Deployment error: {e}")
-            return False
+            self._revert(txn_id, mark)
+            if committed:
+                self._restart_reverted(self._restarts)
+            return None
+        finally:
+            self.releases.abort()
+            self._restarts = None
+            self._actions = None
     
-    def _deploy_process_fix(self, staging_path: str, validation: Dict) -> bool:
-        """Deploy process restart scripts"""
-        import subprocess
-        
-        restart_script = os.path.join(staging_path, "restart_concierge.sh")
-        monitor_script = os.path.join(staging_path, "monitor_concierge.sh")
-        
-        # Copy to automation directory
-        automation_dir = "/Users/fredericklaw/.openclaw/workspace/automation"
-        
-        if os.path.exists(restart_script):
-            shutil.copy2(restart_script, os.path.join(automation_dir, "auto_restart_concierge.sh"))
-            os.chmod(os.path.join(automation_dir, "auto_restart_concierge.sh"), 0o755)
-        
-        if os.path.exists(monitor_script):
-            shutil.copy2(monitor_script, os.path.join(automation_dir, "monitor_concierge.sh"))
-            os.chmod(os.path.join(automation_dir, "monitor_concierge.sh"), 0o755)
-        
-        # Execute restart to apply immediately
-        try:
-            result = subprocess.run(
-                ["bash", restart_script],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            logger.info(f"Process fix executed: {result.returncode}")
-            return result.returncode == 0
-        except Exception as e:
-            logger.error(f"Failed to execute process fix: {e}")
-            return False
+    def observe_canaries(self, canaries: List[Dict]) -> Dict[str, Tuple[bool, str]]:
+        """Poll every canary's probes concurrently: one window for the whole cycle"""
+        if not canaries:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(canaries)) as pool:
+            futures = {
+                c['staging_id']: pool.submit(observe, c['probes'], CANARY_WINDOW, CANARY_INTERVAL)
+                for c in canaries
+            }
+            return {staging_id: future.result() for staging_id, future in futures.items()}
     
-    def _deploy_resource_fix(self, staging_path: str, validation: Dict) -> bool:
-        """Deploy resource cleanup scripts"""
-        cleanup_script = os.path.join(staging_path, "cleanup_disk.sh")
-        
-        if os.path.exists(cleanup_script):
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["bash", cleanup_script],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                logger.info(f"Resource cleanup executed: {result.returncode}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to execute resource fix: {e}")
-                return False
-        
-        return True
+    def conclude_canaries(self, canaries: List[Dict], verdicts: Dict[str, Tuple[bool, str]]) -> int:
+        """
+        Promote healthy canaries and roll back the rest, each as a unit
+        A canary whose release was built on top of a rolled-back one (same
+        target, deployed later in the cycle) is rolled back with it.
+        Returns: number of validations promoted
+        """
+        restore: Dict[str, Optional[str]] = {}
+        restarts: Dict[str, List[str]] = {}
+        promoted = 0
+        
+        for canary in canaries:
+            staging_id = canary['staging_id']
+            healthy, detail = verdicts[staging_id]
+            targets = {a['target'] for a in canary['activations']}
+            if healthy and targets & restore.keys():
+                healthy, detail = False, "built on a rolled-back release"
+            
+            if healthy:
+                for validation in canary['validations']:
+                    self._promote(validation)
+                promoted += len(canary['validations'])
+                continue
+            
+            logger.error(f"💔 Canary failed: {staging_id}: {detail}")
+            for activation in canary['activations']:
+                restore.setdefault(activation['target'], activation['previous'])
+            restarts.update(canary.get('restarts', {}))
+        
+        if restore:
+            for target, release_id in self.releases.apply(restore, action="revert").items():
+                logger.warning(f"↩️  Rolled back {target} to {release_id or 'nothing (first release)'}")
+            self._restart_reverted(restarts)
+        return promoted
     
-    def _deploy_revenue_opt(self, staging_path: str, validation: Dict) -> bool:
-        """Deploy revenue optimization code"""
-        stripe_code = os.path.join(staging_path, "stripe_integration.py")
+    def _restart_reverted(self, restarts: Dict[str, List[str]]):
+        """Restart the services of a rolled-back change so they stop running its code"""
+        for service, command in restarts.items():
+            logger.warning(f"🔁 Restarting {service} on the restored release")
+            self._run_restart(service, command)
+    
+    def _promote(self, validation: Dict):
+        """Canary passed: record the deployment as final"""
+        staging_id = validation.get('metadata', {}).get('staging_id')
         
-        if os.path.exists(stripe_code):
-            automation_dir = "/Users/fredericklaw/.openclaw/workspace/automation"
-            shutil.copy2(stripe_code, os.path.join(automation_dir, "stripe_integration.py"))
-            logger.info("Stripe integration code deployed")
+        # Mark as deployed
+        deployed_marker = os.path.join(
+            self.deployed_dir, f"{staging_id}.deployed"
+        )
+        with open(deployed_marker, 'w') as f:
+            f.write(datetime.now().isoformat())
+        self.deployed_index.add(staging_id)
         
-        # Install stripe if needed
-        try:
-            import subprocess
-            subprocess.run(
-                ["pip", "install", "stripe", "--quiet"],
-                capture_output=True,
-                timeout=60
-            )
-            logger.info("Stripe package installed")
-        except:
-            pass
+        # What is live now is what future changes are benchmarked against
+        self.baselines.promote(validation.get('result', {}).get('benchmarks', {}), staging_id)
         
-        return True
+        logger.info(f"✅ Successfully deployed: {staging_id}")
     
-    def _deploy_generic(self, staging_path: str, validation: Dict) -> bool:
-        """Generic deployment - copy all files to deployed/"""
-        deployment_id = validation.get('metadata', {}).get('staging_id')
-        deployed_path = os.path.join(self.deployed_dir, deployment_id)
+    def _revert(self, staging_id: str, mark: int):
+        """Reactivate the releases that were live before a failed deployment"""
+        try:
+            restored = self.releases.revert_to(mark)
+        except OSError as e:
+            logger.error(f"❌ Automatic rollback of {staging_id} failed: {e}")
+            return
+        for target, release_id in restored.items():
+            logger.warning(f"↩️  Rolled back {target} to {release_id or 'nothing (first release)'}")
+    
+    def rollback(self, spec: str) -> bool:
+        """
+        Restore earlier releases: spec is a staging_id (restore that
+        deployment) or a number n (undo the last n deployments)
+        """
+        if spec.isdigit():
+            plan = self.releases.plan_steps(int(spec))
+        else:
+            plan = self.releases.plan_staging(spec)
         
-        shutil.copytree(staging_path, deployed_path)
-        logger.info(f"Generic deployment copied to: {deployed_path}")
+        if not plan:
+            logger.error(f"❌ Nothing to roll back for '{spec}'")
+            return False
         
+        applied = self.releases.apply(plan)
+        for target, release_id in plan.items():
+            state = "restored" if target in applied else "already live"
+            logger.info(f"↩️  {target}: {release_id or 'nothing (first release)'} ({state})")
         return True
     
     def escalate_to_human(self, validation: Dict, reason: str):
-        """Escalate to human for review"""
+        """Queue an escalation for the next human digest (repeats are deduplicated)"""
         staging_id = validation.get('metadata', {}).get('staging_id')
-        
-        escalation = {
-            "timestamp": datetime.now().isoformat(),
-            "staging_id": staging_id,
-            "reason": reason,
-            "validation": validation,
-            "requires_action": True,
-            "options": ["approve", "reject", "modify"]
-        }
-        
-        # Save escalation
-        escalation_file = os.path.join(
-            LOGS_DIR, f"ESCALATION_{staging_id}_{int(time.time())}.json"
-        )
-        with open(escalation_file, 'w') as f:
-            json.dump(escalation, f, indent=2)
-        
-        logger.warning(f"⚠️  ESCALATED TO HUMAN: {staging_id}")
-        logger.warning(f"   Reason: {reason}")
-        logger.warning(f"   File: {escalation_file}")
-        
-        # TODO: Send Telegram notification
-        # For now, just log
+        proposal_type = self._proposal_type(validation)
+        lineage = lineage_key(proposal_type, self._source_proposal(validation)) or staging_id
+        
+        if self.escalations.add(reason, proposal_type, lineage, staging_id):
+            logger.warning(f"⚠️  ESCALATED TO HUMAN: {staging_id}")
+            logger.warning(f"   Reason: {reason}")
+        else:
+            logger.info(f"⚠️  Already escalated (same reason and proposal): {staging_id}")
+    
+    def send_escalation_digest(self):
+        """Deliver queued escalations if the digest interval has passed"""
+        digest = self.escalations.flush(self.notifier)
+        if digest:
+            logger.warning(f"📨 Escalation digest sent: {digest['escalations']} item(s) awaiting a human")
     
     def run_cycle(self):
         """Main execution cycle"""
@@ -489,20 +637,22 @@ Every Warden decision MUST log:
         
         # Load Constitution
         constitution = self.load_constitution()
-        logger.info(f"📜 Constitution loaded: {len(constitution)} rules")
+        logger.info(f"📜 Constitution v{constitution.version} loaded: {constitution.rule_count} rules")
         
         # Poll for validations
         validations = self.poll_validations()
         
         if not validations:
             logger.info("No pending validations found")
+            self.send_escalation_digest()
             return 0
         
         logger.info(f"Reviewing {len(validations)} validations...")
         
-        deployed_count = 0
         escalated_count = 0
         rejected_count = 0
+        approved = []
+        outcomes = {}  # report filename -> terminal outcome, so it is not polled again
         
         for validation in validations:
             staging_id = validation.get('metadata', {}).get('staging_id')
@@ -513,18 +663,44 @@ Every Warden decision MUST log:
             if not compliant:
                 if any("REQUIRES HUMAN" in v for v in violations):
                     self.escalate_to_human(validation, "; ".join(violations))
+                    outcomes[validation['_source_file']] = "escalated"
                     escalated_count += 1
                     continue
                 else:
                     logger.error(f"❌ Constitution violations: {violations}")
+                    outcomes[validation['_source_file']] = "rejected"
                     rejected_count += 1
                     continue
             
-            # Step 2: Deploy
-            if self.deploy_to_production(validation):
-                deployed_count += 1
+            approved.append(validation)
+        
+        # Step 2: Deploy compatible changes together, each group as a canary
+        canaries = []
+        for group in self.group_transactions(approved):
+            canary = self.deploy_to_production(group)
+            if canary:
+                canaries.append(canary)
             else:
-                rejected_count += 1
+                # Not terminal: retried after a backoff
+                for filename, next_at in self.deployed_index.defer([v['_source_file'] for v in group]).items():
+                    logger.warning(f"⏳ Deploy of {filename} retried after "
+                                   f"{datetime.fromtimestamp(next_at).strftime('%H:%M:%S')}")
+                rejected_count += len(group)
+        
+        # Step 3: Observe all canaries at once, then promote or roll back
+        verdicts = self.observe_canaries(canaries)
+        deployed_count = self.conclude_canaries(canaries, verdicts)
+        rejected_count += sum(len(c['validations']) for c in canaries) - deployed_count
+        deployed = self.deployed_index.load()
+        for canary in canaries:
+            for validation in canary['validations']:
+                staging_id = validation.get('metadata', {}).get('staging_id')
+                outcome = "deployed" if staging_id in deployed else "canary_failed"
+                outcomes[validation['_source_file']] = outcome
+        self.deployed_index.settle(outcomes)
+        
+        # Step 4: Tell the human about escalations (one digest per interval)
+        self.send_escalation_digest()
         
         logger.info("="*60)
         logger.info(f"WARDEN CYCLE COMPLETE")
@@ -536,8 +712,16 @@ Every Warden decision MUST log:
         return deployed_count
 
 def main():
+    parser = argparse.ArgumentParser(description="The Warden - approve, deploy and roll back changes")
+    parser.add_argument("--rollback", metavar="STAGING_ID|N",
+                        help="Restore the release of a staging id, or undo the last N deployments")
+    args = parser.parse_args()
+    
     agent = WardenAgent()
     
+    if args.rollback:
+        return 0 if agent.rollback(args.rollback) else 1
+    
     try:
         count = agent.run_cycle()
         print(f"\n✅ Warden cycle complete: {count} deployments")